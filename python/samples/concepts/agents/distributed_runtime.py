@@ -0,0 +1,90 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import multiprocessing
+import os
+from dataclasses import dataclass
+from multiprocessing.synchronize import Event
+
+from semantic_kernel.agents.runtime import DistributedRuntime, DistributedRuntimeHost
+from semantic_kernel.agents.runtime.core.agent_id import CoreAgentId
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent, message_handler
+from semantic_kernel.agents.runtime.core.serialization import try_get_known_serializers_for_type
+
+# This sample runs agents in separate processes with the distributed runtime.
+# A host routes the messages between the workers, every worker is a separate process that hosts its own agents.
+# The messages are serialized with the message serializers of the runtime and sent over a loopback connection,
+# use an address like `unix:/tmp/agents.sock` to use a Unix socket instead of TCP.
+# It does not need any AI service.
+
+NUMBER_OF_REQUESTS = 5
+
+
+@dataclass
+class Request:
+    content: str
+
+
+@dataclass
+class Response:
+    content: str
+
+
+class UpperCaseAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that converts text to upper case.")
+
+    @message_handler
+    async def on_request(self, message: Request, ctx: MessageContext) -> Response:
+        return Response(content=f"{message.content.upper()} (handled by process {os.getpid()})")
+
+
+async def run_worker(address: str, ready: Event, done: Event) -> None:
+    runtime = DistributedRuntime(address)
+    await runtime.start()
+    await UpperCaseAgent.register(runtime, "upper_case", UpperCaseAgent)
+    ready.set()
+    # Serve requests until the main process is done
+    await asyncio.to_thread(done.wait)
+    await runtime.close()
+
+
+def worker_main(address: str, ready: Event, done: Event) -> None:
+    asyncio.run(run_worker(address, ready, done))
+
+
+async def main():
+    async with DistributedRuntimeHost("127.0.0.1:0") as host:
+        ready, done = multiprocessing.Event(), multiprocessing.Event()
+        worker = multiprocessing.Process(target=worker_main, args=(host.address, ready, done))
+        worker.start()
+        await asyncio.to_thread(ready.wait)
+
+        runtime = DistributedRuntime(host.address)
+        await runtime.start()
+        # The responses are deserialized in this process, so their serializer is registered here
+        runtime.add_message_serializer(try_get_known_serializers_for_type(Response))
+        responses = await asyncio.gather(*[
+            runtime.send_message(Request(content=f"request {index}"), CoreAgentId("upper_case", "default"))
+            for index in range(NUMBER_OF_REQUESTS)
+        ])
+        for response in responses:
+            print(f"# process {os.getpid()} received: {response.content}")
+
+        await runtime.close()
+        done.set()
+        await asyncio.to_thread(worker.join)
+
+    """
+    Sample output:
+    # process 1000 received: REQUEST 0 (handled by process 1001)
+    # process 1000 received: REQUEST 1 (handled by process 1001)
+    # process 1000 received: REQUEST 2 (handled by process 1001)
+    # process 1000 received: REQUEST 3 (handled by process 1001)
+    # process 1000 received: REQUEST 4 (handled by process 1001)
+    """
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
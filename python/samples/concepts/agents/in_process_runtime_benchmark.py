@@ -0,0 +1,65 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import logging
+import time
+
+from semantic_kernel.agents.runtime import InProcessRuntime
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent, message_handler
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+from semantic_kernel.contents import ChatMessageContent
+
+# This sample measures the number of messages per second the in-process runtime delivers.
+# A message with a large ChatMessageContent payload is published to a number of subscribed agents,
+# each publish is delivered to all of them (fan-out).
+# It does not need any AI service.
+# The runtime only serializes messages for the event logger when that logger is enabled,
+# run the benchmark a second time with `LOG_EVENTS = True` to see the cost of the message events.
+
+NUMBER_OF_AGENTS = 10
+NUMBER_OF_MESSAGES = 2_000
+PAYLOAD_SIZE = 10_000
+LOG_EVENTS = False
+TOPIC = TopicId("benchmark", "default")
+
+
+class CountingAgent(RoutedAgent):
+    received = 0
+
+    def __init__(self) -> None:
+        super().__init__("An agent that counts the messages it receives.")
+
+    @message_handler
+    async def on_message_received(self, message: ChatMessageContent, ctx: MessageContext) -> None:
+        CountingAgent.received += 1
+
+
+async def main():
+    if LOG_EVENTS:
+        # A handler that discards the events, so only the cost of creating them is measured
+        event_logger = logging.getLogger("in_process_runtime.events")
+        event_logger.setLevel(logging.INFO)
+        event_logger.addHandler(logging.NullHandler())
+
+    runtime = InProcessRuntime()
+    for index in range(NUMBER_OF_AGENTS):
+        agent_type = await CountingAgent.register(runtime, f"agent_{index}", CountingAgent)
+        await runtime.add_subscription(TypeSubscription(TOPIC.type, agent_type))
+
+    message = ChatMessageContent(role="user", content="x" * PAYLOAD_SIZE)
+    runtime.start()
+    start = time.perf_counter()
+    for _ in range(NUMBER_OF_MESSAGES):
+        await runtime.publish_message(message, topic_id=TOPIC)
+    await runtime.stop_when_idle()
+    elapsed = time.perf_counter() - start
+    await runtime.close()
+
+    print(f"Published {NUMBER_OF_MESSAGES} messages to {NUMBER_OF_AGENTS} agents in {elapsed:.2f}s")
+    print(f"{NUMBER_OF_MESSAGES / elapsed:,.0f} publishes/s, {CountingAgent.received / elapsed:,.0f} deliveries/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
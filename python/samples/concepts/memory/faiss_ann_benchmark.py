@@ -0,0 +1,100 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import time
+
+import numpy as np
+
+from semantic_kernel.connectors.faiss import FaissCollection
+from semantic_kernel.data.vector import IndexKind, VectorStoreCollectionDefinition, VectorStoreField
+
+# This sample compares the recall and latency of the flat, HNSW and IVF Flat index kinds of the Faiss connector.
+# It uses random, clustered vectors, so it does not need any AI service.
+# The flat index does an exhaustive search, so its results are used as the ground truth for the recall.
+# For HNSW the `ef_search` and for IVF the `nprobe` search parameters are varied,
+# higher values give a better recall, at the cost of latency.
+# Increase the number of records to see the difference between the approaches grow.
+
+NUMBER_OF_RECORDS = 50_000
+DIMENSIONS = 128
+NUMBER_OF_QUERIES = 100
+TOP = 10
+
+
+def create_definition(index_kind: IndexKind) -> VectorStoreCollectionDefinition:
+    return VectorStoreCollectionDefinition(
+        fields=[
+            VectorStoreField("key", name="id", type="int"),
+            VectorStoreField(
+                "vector",
+                name="vector",
+                dimensions=DIMENSIONS,
+                index_kind=index_kind,
+                distance_function="euclidean_squared_distance",
+            ),
+        ]
+    )
+
+
+def create_vectors(rng: np.random.Generator, count: int, centers: np.ndarray) -> np.ndarray:
+    assignments = rng.integers(0, len(centers), size=count)
+    return (centers[assignments] + rng.normal(scale=0.5, size=(count, DIMENSIONS))).astype(np.float32)
+
+
+async def create_collection(index_kind: IndexKind, vectors: np.ndarray) -> FaissCollection:
+    collection = FaissCollection(
+        record_type=dict,
+        definition=create_definition(index_kind),
+        collection_name=f"benchmark_{index_kind.value}",
+        training_size=min(len(vectors), 20_000),
+    )
+    await collection.ensure_collection_exists()
+    start = time.perf_counter()
+    # upserting in batches, the IVF index is trained once the training_size is reached
+    for batch_start in range(0, len(vectors), 10_000):
+        await collection.upsert([
+            {"id": i, "vector": vectors[i]} for i in range(batch_start, min(batch_start + 10_000, len(vectors)))
+        ])
+    print(f"Built {index_kind.value} index in {time.perf_counter() - start:.2f}s")
+    return collection
+
+
+async def run_queries(collection: FaissCollection, queries: np.ndarray, **kwargs) -> tuple[list[list[int]], float]:
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        search_results = await collection.search(
+            vector=query.tolist(), vector_property_name="vector", top=TOP, **kwargs
+        )
+        results.append([result.record["id"] async for result in search_results.results])
+    return results, (time.perf_counter() - start) / len(queries) * 1000
+
+
+def recall(results: list[list[int]], ground_truth: list[list[int]]) -> float:
+    return float(np.mean([len(set(res) & set(truth)) / TOP for res, truth in zip(results, ground_truth)]))
+
+
+async def main():
+    rng = np.random.default_rng(42)
+    centers = rng.normal(scale=4.0, size=(256, DIMENSIONS))
+    vectors = create_vectors(rng, NUMBER_OF_RECORDS, centers)
+    queries = create_vectors(rng, NUMBER_OF_QUERIES, centers)
+
+    flat = await create_collection(IndexKind.FLAT, vectors)
+    ground_truth, latency = await run_queries(flat, queries)
+    print(f"{'index':<10}{'parameter':<16}{'recall@' + str(TOP):<12}{'latency (ms)':<12}")
+    print(f"{'flat':<10}{'-':<16}{1.0:<12.3f}{latency:<12.3f}")
+
+    hnsw = await create_collection(IndexKind.HNSW, vectors)
+    for ef_search in (16, 32, 64, 128, 256):
+        results, latency = await run_queries(hnsw, queries, ef_search=ef_search)
+        print(f"{'hnsw':<10}{'ef_search=' + str(ef_search):<16}{recall(results, ground_truth):<12.3f}{latency:<12.3f}")
+
+    ivf = await create_collection(IndexKind.IVF_FLAT, vectors)
+    for nprobe in (1, 4, 8, 16, 32):
+        results, latency = await run_queries(ivf, queries, nprobe=nprobe)
+        print(f"{'ivf_flat':<10}{'nprobe=' + str(nprobe):<16}{recall(results, ground_truth):<12.3f}{latency:<12.3f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,11 +2,13 @@
 
 
 import asyncio
+import time
 from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Any
 
-from pydantic import Field, SkipValidation, ValidationError, model_validator
+from pydantic import Field, PrivateAttr, SkipValidation, ValidationError, model_validator
 
 from semantic_kernel.agents.channels.agent_channel import AgentChannel
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
@@ -14,6 +16,34 @@ from semantic_kernel.kernel_pydantic import KernelBaseModel
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 
+def _create_synchronized_event() -> asyncio.Event:
+    # A new queue is empty, so it starts out synchronized
+    event = asyncio.Event()
+    event.set()
+    return event
+
+
+@experimental
+@dataclass
+class ChannelLagMetrics:
+    """How far a channel lags behind the messages broadcast to it."""
+
+    pending_batches: int
+    """The number of message lists waiting to be received by the channel."""
+    pending_messages: int
+    """The number of messages waiting to be received by the channel."""
+    lag_seconds: float
+    """The time the oldest pending message list has been waiting, 0 when nothing is pending."""
+    delivered_batches: int
+    """The number of message lists the channel received."""
+    delivered_messages: int
+    """The number of messages the channel received."""
+    receive_calls: int
+    """The number of calls to the receive method of the channel, less than the delivered batches when batched."""
+    last_receive_duration: float | None
+    """The duration of the last receive call in seconds, None when the channel did not receive any message."""
+
+
 @experimental
 class QueueReference(KernelBaseModel):
     """Utility class to associate a queue with its specific lock."""
@@ -23,6 +53,14 @@ class QueueReference(KernelBaseModel):
     receive_task: SkipValidation[asyncio.Task | None] = None
     receive_failure: Exception | None = None
 
+    # Set while no receive task processes the queue, so waiting for it does not need polling
+    _synchronized: asyncio.Event = PrivateAttr(default_factory=_create_synchronized_event)
+    _enqueued_at: deque[float] = PrivateAttr(default_factory=deque)
+    _delivered_batches: int = PrivateAttr(default=0)
+    _delivered_messages: int = PrivateAttr(default=0)
+    _receive_calls: int = PrivateAttr(default=0)
+    _last_receive_duration: float | None = PrivateAttr(default=None)
+
     @property
     def is_empty(self):
         """Check if the queue is empty."""
@@ -37,6 +75,27 @@ class QueueReference(KernelBaseModel):
                 raise ValidationError("receive_task must be an instance of asyncio.Task or None")
         return values
 
+    def get_lag_metrics(self) -> ChannelLagMetrics:
+        """Get the lag metrics of the queue."""
+        # The queue can be changed directly, so the enqueue times are trimmed to the pending lists
+        while len(self._enqueued_at) > len(self.queue):
+            self._enqueued_at.popleft()
+        lag_seconds = time.monotonic() - self._enqueued_at[0] if self._enqueued_at else 0.0
+        return ChannelLagMetrics(
+            pending_batches=len(self.queue),
+            pending_messages=sum(len(messages) for messages in self.queue),
+            lag_seconds=lag_seconds,
+            delivered_batches=self._delivered_batches,
+            delivered_messages=self._delivered_messages,
+            receive_calls=self._receive_calls,
+            last_receive_duration=self._last_receive_duration,
+        )
+
+    def _start_receive_task(self, receive: Any) -> None:
+        """Start a receive task, the caller holds the queue lock."""
+        self._synchronized.clear()
+        self.receive_task = asyncio.create_task(receive)
+
 
 @experimental
 @dataclass
@@ -49,10 +108,17 @@ class ChannelReference:
 
 @experimental
 class BroadcastQueue(KernelBaseModel):
-    """A queue for broadcasting messages to listeners."""
+    """A queue for broadcasting messages to listeners.
+
+    Every channel has its own queue that is processed by a background task. Waiting for a channel to be
+    synchronized is signaled by that task, and all message lists that are pending when the task picks up work
+    are delivered to the channel in a single receive call, up to `max_batch_size` lists.
+    """
 
     queues: dict[str, QueueReference] = Field(default_factory=dict)
+    # Kept for compatibility, channels are no longer polled so the duration is not used
     block_duration: float = 0.1
+    max_batch_size: int | None = Field(default=None, gt=0)
 
     async def enqueue(self, channel_refs: list[ChannelReference], messages: list[ChatMessageContent]) -> None:
         """Enqueue a set of messages for a given channel.
@@ -69,9 +135,10 @@ class BroadcastQueue(KernelBaseModel):
 
             async with queue_ref.queue_lock:
                 queue_ref.queue.append(messages)
+                queue_ref._enqueued_at.append(time.monotonic())
 
                 if not queue_ref.receive_task or queue_ref.receive_task.done():
-                    queue_ref.receive_task = asyncio.create_task(self.receive(channel_ref, queue_ref))
+                    queue_ref._start_receive_task(self.receive(channel_ref, queue_ref))
 
     async def ensure_synchronized(self, channel_ref: ChannelReference) -> None:
         """Blocks until a channel-queue is not in a receive state to ensure that channel history is complete.
@@ -86,8 +153,6 @@ class BroadcastQueue(KernelBaseModel):
 
         while True:
             async with queue_ref.queue_lock:
-                is_empty = queue_ref.is_empty
-
                 if queue_ref.receive_failure is not None:
                     failure = queue_ref.receive_failure
                     queue_ref.receive_failure = None
@@ -95,35 +160,60 @@ class BroadcastQueue(KernelBaseModel):
                         f"Unexpected failure broadcasting to channel: {type(channel_ref.channel)}, failure: {failure}"
                     ) from failure
 
-                if not is_empty and (not queue_ref.receive_task or queue_ref.receive_task.done()):
-                    queue_ref.receive_task = asyncio.create_task(self.receive(channel_ref, queue_ref))
+                if queue_ref.is_empty:
+                    return
 
-            if is_empty:
-                break
+                if not queue_ref.receive_task or queue_ref.receive_task.done():
+                    queue_ref._start_receive_task(self.receive(channel_ref, queue_ref))
+                else:
+                    # The running task sets the event again when it stops
+                    queue_ref._synchronized.clear()
+
+            # The receive task sets the event when it stops, because the queue is empty or it failed
+            await queue_ref._synchronized.wait()
 
-            await asyncio.sleep(self.block_duration)
+    def get_lag_metrics(self) -> dict[str, ChannelLagMetrics]:
+        """Get the lag metrics of every channel, by the hash of the channel."""
+        return {channel_hash: queue_ref.get_lag_metrics() for channel_hash, queue_ref in self.queues.items()}
 
     async def receive(self, channel_ref: ChannelReference, queue_ref: QueueReference) -> None:
         """Processes the specified queue with the provided channel, until the queue is empty.
 
+        All pending message lists are delivered to the channel in one receive call, up to `max_batch_size` lists.
+
         Args:
             channel_ref: The channel reference.
             queue_ref: The queue reference.
         """
-        while True:
-            async with queue_ref.queue_lock:
-                if queue_ref.is_empty:
-                    break
-
-                messages = queue_ref.queue[0]
-            try:
-                await channel_ref.channel.receive(messages)
-            except Exception as e:
-                queue_ref.receive_failure = e
-
-            async with queue_ref.queue_lock:
-                if not queue_ref.is_empty:
-                    queue_ref.queue.popleft()
-
-                if queue_ref.receive_failure is not None or queue_ref.is_empty:
-                    break
+        try:
+            while True:
+                async with queue_ref.queue_lock:
+                    if queue_ref.is_empty:
+                        break
+
+                    # The lists stay in the queue until they are received, so the channel is not synchronized yet
+                    batch = list(islice(queue_ref.queue, self.max_batch_size))
+
+                messages = batch[0] if len(batch) == 1 else [message for messages in batch for message in messages]
+                start = time.perf_counter()
+                try:
+                    await channel_ref.channel.receive(messages)
+                except Exception as e:
+                    queue_ref.receive_failure = e
+                queue_ref._last_receive_duration = time.perf_counter() - start
+                queue_ref._receive_calls += 1
+
+                async with queue_ref.queue_lock:
+                    for _ in range(min(len(batch), len(queue_ref.queue))):
+                        queue_ref.queue.popleft()
+                        if queue_ref._enqueued_at:
+                            queue_ref._enqueued_at.popleft()
+                    if queue_ref.receive_failure is None:
+                        queue_ref._delivered_batches += len(batch)
+                        queue_ref._delivered_messages += len(messages)
+
+                    if queue_ref.receive_failure is not None or queue_ref.is_empty:
+                        break
+        finally:
+            # Wake up the callers waiting for the channel, they check the queue and the failure again
+            queue_ref._synchronized.set()
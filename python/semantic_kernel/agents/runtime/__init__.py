@@ -9,6 +9,8 @@ from semantic_kernel.agents.runtime.core.message_context import MessageContext
 from semantic_kernel.agents.runtime.core.routed_agent import MessageHandler, RoutedAgent, message_handler
 from semantic_kernel.agents.runtime.core.subscription import Subscription
 from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.distributed.distributed_runtime import DistributedRuntime
+from semantic_kernel.agents.runtime.distributed.distributed_runtime_host import DistributedRuntimeHost
 from semantic_kernel.agents.runtime.in_process.default_subscription import DefaultSubscription
 from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProcessRuntime
 from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
@@ -22,6 +24,8 @@ __all__ = [
     "CoreAgentMetadata",
     "CoreRuntime",
     "DefaultSubscription",
+    "DistributedRuntime",
+    "DistributedRuntimeHost",
     "InProcessRuntime",
     "MessageContext",
     "MessageHandler",
@@ -0,0 +1 @@
+# Copyright (c) Microsoft. All rights reserved.
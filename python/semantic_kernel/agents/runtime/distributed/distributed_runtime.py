@@ -0,0 +1,381 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import inspect
+import itertools
+import logging
+import uuid
+from asyncio import Future, Task
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from semantic_kernel.agents.runtime.core.agent import Agent
+from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
+from semantic_kernel.agents.runtime.core.agent_metadata import AgentMetadata
+from semantic_kernel.agents.runtime.core.agent_type import AgentType, CoreAgentType
+from semantic_kernel.agents.runtime.core.cancellation_token import CancellationToken
+from semantic_kernel.agents.runtime.core.core_runtime import CoreRuntime
+from semantic_kernel.agents.runtime.core.exceptions import (
+    CantHandleException,
+    MessageDroppedException,
+    NotAccessibleError,
+    UndeliverableException,
+)
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.serialization import (
+    JSON_DATA_CONTENT_TYPE,
+    PROTOBUF_DATA_CONTENT_TYPE,
+    MessageSerializer,
+    SerializationRegistry,
+    try_get_known_serializers_for_type,
+)
+from semantic_kernel.agents.runtime.core.subscription import Subscription
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.distributed.transport import (
+    FrameConnection,
+    open_frame_connection,
+    subscription_to_dict,
+)
+from semantic_kernel.agents.runtime.in_process.agent_instantiation_context import AgentInstantiationContext
+from semantic_kernel.agents.runtime.in_process.message_handler_context import MessageHandlerContext
+from semantic_kernel.agents.runtime.in_process.runtime_impl_helpers import get_impl
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=Agent)
+
+# The exceptions that keep their type when they are raised by a remote agent, others are raised as a RuntimeError
+_REMOTE_EXCEPTION_TYPES: dict[str, type[Exception]] = {
+    exception_type.__name__: exception_type
+    for exception_type in (
+        CantHandleException,
+        ConnectionError,
+        LookupError,
+        MessageDroppedException,
+        UndeliverableException,
+        ValueError,
+    )
+}
+
+
+@experimental
+class DistributedRuntime(CoreRuntime):
+    """A runtime that hosts agents in a worker process connected to a `DistributedRuntimeHost`.
+
+    Every worker registers the agent types it hosts with the host, messages to agents in other workers
+    are serialized with the message serializers of the runtime and routed through the host, so the agents
+    of an orchestration can run in separate processes or on separate machines.
+    Only `TypeSubscription` and `TypePrefixSubscription` subscriptions can be added, and the agents hosted
+    by other workers can only be reached through messages.
+
+    The runtime must be started before agents are registered, since the registrations are sent to the host.
+    """
+
+    def __init__(self, address: str) -> None:
+        """Initialize the runtime.
+
+        Args:
+            address: The address of the host, either `host:port` or `unix:<path>` for a Unix socket.
+        """
+        self._address = address
+        self._connection: FrameConnection | None = None
+        self._read_task: Task[None] | None = None
+        self._agent_factories: dict[str, Callable[[], Awaitable[Agent]]] = {}
+        self._instantiated_agents: dict[AgentId, Agent] = {}
+        self._serialization_registry = SerializationRegistry()
+        self._pending_requests: dict[int, Future[tuple[dict[str, Any], bytes]]] = {}
+        self._request_ids = itertools.count()
+        self._background_tasks: set[Task[Any]] = set()
+
+    async def start(self) -> None:
+        """Connect to the host and start handling the messages for the agents of this worker."""
+        if self._connection is not None:
+            raise RuntimeError("Runtime is already started")
+        self._connection = await open_frame_connection(self._address)
+        self._read_task = asyncio.create_task(self._read_frames(self._connection))
+
+    async def stop(self) -> None:
+        """Disconnect from the host, the handlers that are running are not awaited."""
+        if self._connection is None:
+            raise RuntimeError("Runtime is not started")
+        connection, self._connection = self._connection, None
+        await connection.close()
+        if self._read_task is not None:
+            await self._read_task
+            self._read_task = None
+
+    async def stop_when_idle(self) -> None:
+        """Disconnect from the host once the message handlers of the agents of this worker are done."""
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self.stop()
+
+    async def close(self) -> None:
+        """Calls :meth:`stop` if applicable and the :meth:`Agent.close` method on all instantiated agents."""
+        if self._connection is not None:
+            await self.stop()
+        for agent in self._instantiated_agents.values():
+            await agent.close()
+
+    async def send_message(
+        self,
+        message: Any,
+        recipient: AgentId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> Any:
+        """Send a message to an agent and get a response.
+
+        The response is deserialized with the serializers of this runtime, add the serializers of the
+        response types with `add_message_serializer`, otherwise the response is an `UnknownPayload`.
+        """
+        if cancellation_token is None:
+            cancellation_token = CancellationToken()
+        header, payload = self._serialize(message)
+        header.update(
+            kind="send",
+            recipient=str(recipient),
+            sender=None if sender is None else str(sender),
+            message_id=message_id or str(uuid.uuid4()),
+        )
+        response_header, response_payload = await self._request(header, payload, cancellation_token)
+        return self._deserialize(response_header, response_payload)
+
+    async def publish_message(
+        self,
+        message: Any,
+        topic_id: TopicId,
+        *,
+        sender: AgentId | None = None,
+        cancellation_token: CancellationToken | None = None,
+        message_id: str | None = None,
+    ) -> None:
+        """Publish a message to all agents that are subscribed to the topic."""
+        header, payload = self._serialize(message)
+        header.update(
+            kind="publish",
+            topic_id=str(topic_id),
+            sender=None if sender is None else str(sender),
+            message_id=message_id or str(uuid.uuid4()),
+        )
+        await self._get_connection().write(header, payload)
+
+    async def register_factory(
+        self,
+        type: str | AgentType,
+        agent_factory: Callable[[], T | Awaitable[T]],
+        *,
+        expected_class: type[T] | None = None,
+    ) -> AgentType:
+        """Register a factory for the agents of a type hosted by this worker."""
+        if isinstance(type, str):
+            type = CoreAgentType(type)
+
+        if type.type in self._agent_factories:
+            raise ValueError(f"Agent with type {type} already exists.")
+
+        async def factory_wrapper() -> T:
+            agent_instance = agent_factory()
+            if inspect.isawaitable(agent_instance):
+                agent_instance = await agent_instance
+            if expected_class is not None and agent_instance.__class__ != expected_class:
+                raise ValueError("Factory registered using the wrong type.")
+            return agent_instance
+
+        await self._request({"kind": "register_agent_type", "agent_type": type.type})
+        self._agent_factories[type.type] = factory_wrapper
+        return type
+
+    async def try_get_underlying_agent_instance(self, id: AgentId, type: type[T] = Agent) -> T:  # type: ignore[assignment]
+        """Get the instance of an agent hosted by this worker."""
+        agent_instance = await self._get_agent(id)
+        if not isinstance(agent_instance, type):
+            raise TypeError(
+                f"Agent with name {id.type} is not of type {type.__name__}. "
+                f"It is of type {agent_instance.__class__.__name__}"
+            )
+        return agent_instance
+
+    async def get(
+        self, id_or_type: AgentId | AgentType | str, /, key: str = "default", *, lazy: bool = True
+    ) -> AgentId:
+        """Get an agent by id or type."""
+        return await get_impl(id_or_type=id_or_type, key=key, lazy=lazy, instance_getter=self._get_agent)
+
+    async def save_state(self) -> Mapping[str, Any]:
+        """Save the state of the agents instantiated by this worker."""
+        return {str(agent_id): dict(await agent.save_state()) for agent_id, agent in self._instantiated_agents.items()}
+
+    async def load_state(self, state: Mapping[str, Any]) -> None:
+        """Load the state of the agents hosted by this worker, the state of other agents is ignored."""
+        for agent_id_str, agent_state in state.items():
+            agent_id = CoreAgentId.from_str(agent_id_str)
+            if agent_id.type in self._agent_factories:
+                await (await self._get_agent(agent_id)).load_state(agent_state)
+
+    async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
+        """Get the metadata of an agent hosted by this worker."""
+        return (await self._get_agent(agent)).metadata
+
+    async def agent_save_state(self, agent: AgentId) -> Mapping[str, Any]:
+        """Save the state of an agent hosted by this worker."""
+        return await (await self._get_agent(agent)).save_state()
+
+    async def agent_load_state(self, agent: AgentId, state: Mapping[str, Any]) -> None:
+        """Load the state of an agent hosted by this worker."""
+        await (await self._get_agent(agent)).load_state(state)
+
+    async def add_subscription(self, subscription: Subscription) -> None:
+        """Add a subscription, it is registered with the host so messages from all workers are routed by it."""
+        await self._request({"kind": "add_subscription", "subscription": subscription_to_dict(subscription)})
+
+    async def remove_subscription(self, id: str) -> None:
+        """Remove a subscription."""
+        await self._request({"kind": "remove_subscription", "id": id})
+
+    def add_message_serializer(self, serializer: MessageSerializer[Any] | Sequence[MessageSerializer[Any]]) -> None:
+        """Add a message serializer to the runtime."""
+        self._serialization_registry.add_serializer(serializer)
+
+    def _get_connection(self) -> FrameConnection:
+        if self._connection is None:
+            raise RuntimeError("Runtime is not started")
+        return self._connection
+
+    async def _request(
+        self,
+        header: dict[str, Any],
+        payload: bytes = b"",
+        cancellation_token: CancellationToken | None = None,
+    ) -> tuple[dict[str, Any], bytes]:
+        """Send a frame to the host and wait for its result."""
+        connection = self._get_connection()
+        request_id = next(self._request_ids)
+        future: Future[tuple[dict[str, Any], bytes]] = asyncio.get_running_loop().create_future()
+        self._pending_requests[request_id] = future
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+        try:
+            await connection.write({**header, "request_id": request_id}, payload)
+            result_header, result_payload = await future
+        finally:
+            self._pending_requests.pop(request_id, None)
+        if "error" in result_header:
+            exception_type = _REMOTE_EXCEPTION_TYPES.get(result_header.get("error_type", ""), RuntimeError)
+            raise exception_type(result_header["error"])
+        return result_header, result_payload
+
+    async def _read_frames(self, connection: FrameConnection) -> None:
+        try:
+            while (frame := await connection.read()) is not None:
+                header, payload = frame
+                try:
+                    match header["kind"]:
+                        case "result":
+                            future = self._pending_requests.get(header["request_id"])
+                            if future is not None and not future.done():
+                                future.set_result((header, payload))
+                        case "send":
+                            self._run_in_background(self._process_send(connection, header, payload))
+                        case "deliver":
+                            self._process_deliver(header, payload)
+                        case kind:
+                            logger.warning(f"Ignoring frame of unknown kind {kind} from the host.")
+                except Exception:
+                    # A frame that cannot be processed must not stop the worker from reading the next frames
+                    logger.error(f"Error processing {header.get('kind')} frame from the host", exc_info=True)
+        finally:
+            for future in self._pending_requests.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("The connection to the host was closed."))
+
+    def _run_in_background(self, coroutine: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _process_send(self, connection: FrameConnection, header: dict[str, Any], payload: bytes) -> None:
+        recipient = CoreAgentId.from_str(header["recipient"])
+        try:
+            message = self._deserialize(header, payload)
+            message_context = MessageContext(
+                sender=None if header["sender"] is None else CoreAgentId.from_str(header["sender"]),
+                topic_id=None,
+                is_rpc=True,
+                cancellation_token=CancellationToken(),
+                message_id=header["message_id"],
+            )
+            response = await self._invoke_agent(recipient, message, message_context)
+            response_header, response_payload = self._serialize(response)
+        except Exception as e:
+            logger.error(f"Error processing message for {recipient}", exc_info=True)
+            response_header, response_payload = {"error": str(e), "error_type": type(e).__name__}, b""
+        await connection.write(
+            {**response_header, "kind": "result", "request_id": header["request_id"]}, response_payload
+        )
+
+    def _process_deliver(self, header: dict[str, Any], payload: bytes) -> None:
+        # The message is deserialized once for all the recipients hosted by this worker
+        message = self._deserialize(header, payload)
+        sender = None if header["sender"] is None else CoreAgentId.from_str(header["sender"])
+        topic_id = TopicId.from_str(header["topic_id"])
+        for recipient in header["recipients"]:
+            message_context = MessageContext(
+                sender=sender,
+                topic_id=topic_id,
+                is_rpc=False,
+                cancellation_token=CancellationToken(),
+                message_id=header["message_id"],
+            )
+            self._run_in_background(self._invoke_published(CoreAgentId.from_str(recipient), message, message_context))
+
+    async def _invoke_published(self, recipient: AgentId, message: Any, message_context: MessageContext) -> None:
+        try:
+            await self._invoke_agent(recipient, message, message_context)
+        except Exception:
+            logger.error(f"Error processing publish message for {recipient}", exc_info=True)
+
+    async def _invoke_agent(self, recipient: AgentId, message: Any, message_context: MessageContext) -> Any:
+        agent = await self._get_agent(recipient)
+        with MessageHandlerContext.populate_context(agent.id):
+            return await agent.on_message(message, ctx=message_context)
+
+    async def _get_agent(self, agent_id: AgentId) -> Agent:
+        if agent_id in self._instantiated_agents:
+            return self._instantiated_agents[agent_id]
+        if agent_id.type not in self._agent_factories:
+            raise NotAccessibleError(f"Agent with type {agent_id.type} is not hosted by this worker.")
+        with AgentInstantiationContext.populate_context((self, agent_id)):
+            agent = await self._agent_factories[agent_id.type]()
+        self._instantiated_agents[agent_id] = agent
+        return agent
+
+    def _serialize(self, message: Any) -> tuple[dict[str, Any], bytes]:
+        """Serialize a message, the header contains the type name and the content type of the payload."""
+        if message is None:
+            return {"type_name": None}, b""
+        type_name = self._serialization_registry.type_name(message)
+        for data_content_type in (JSON_DATA_CONTENT_TYPE, PROTOBUF_DATA_CONTENT_TYPE):
+            if self._serialization_registry.is_registered(type_name, data_content_type):
+                break
+        else:
+            # Responses are often of types no agent of this worker handles, so known types are added on first use
+            serializers = try_get_known_serializers_for_type(message.__class__)
+            if not serializers:
+                raise ValueError(f"No message serializer is registered for messages of type {type_name}.")
+            self._serialization_registry.add_serializer(serializers)
+            data_content_type = serializers[0].data_content_type
+        payload = self._serialization_registry.serialize(
+            message, type_name=type_name, data_content_type=data_content_type
+        )
+        return {"type_name": type_name, "data_content_type": data_content_type}, payload
+
+    def _deserialize(self, header: dict[str, Any], payload: bytes) -> Any:
+        if header.get("type_name") is None:
+            return None
+        return self._serialization_registry.deserialize(
+            payload, type_name=header["type_name"], data_content_type=header["data_content_type"]
+        )
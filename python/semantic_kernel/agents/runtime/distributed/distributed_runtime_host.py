@@ -0,0 +1,186 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import contextlib
+import itertools
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.distributed.transport import (
+    FrameConnection,
+    start_frame_server,
+    subscription_from_dict,
+)
+from semantic_kernel.agents.runtime.in_process.runtime_impl_helpers import SubscriptionManager
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingRequest:
+    """A message that was forwarded to the worker of the recipient and waits for the response."""
+
+    origin: FrameConnection
+    request_id: int
+    target: FrameConnection
+
+
+@experimental
+class DistributedRuntimeHost:
+    """The host that routes messages between the workers of a distributed runtime.
+
+    Every `DistributedRuntime` connects to the host and registers the agent types and subscriptions of
+    the agents it hosts. The host forwards direct messages to the worker that hosts the agent type of
+    the recipient and the responses back to the sender, and delivers published messages to the workers
+    that host subscribed agents. Messages are forwarded as serialized payloads, the host never deserializes them.
+    """
+
+    def __init__(self, address: str = "127.0.0.1:0") -> None:
+        """Initialize the DistributedRuntimeHost.
+
+        Args:
+            address: The address to listen on, either `host:port` or `unix:<path>` for a Unix socket.
+                Use port 0 to listen on a free port, the address property contains the actual address once started.
+        """
+        self._address = address
+        self._server: asyncio.Server | None = None
+        self._connections: set[FrameConnection] = set()
+        self._agent_types: dict[str, FrameConnection] = {}
+        self._subscription_manager = SubscriptionManager()
+        self._subscription_owners: dict[str, FrameConnection] = {}
+        self._pending_requests: dict[int, _PendingRequest] = {}
+        self._request_ids = itertools.count()
+
+    @property
+    def address(self) -> str:
+        """The address the host listens on."""
+        return self._address
+
+    async def start(self) -> None:
+        """Start listening for workers."""
+        if self._server is not None:
+            raise RuntimeError("Host is already started")
+        self._server, self._address = await start_frame_server(self._address, self._serve)
+
+    async def stop(self) -> None:
+        """Stop listening and close the connections to the workers."""
+        if self._server is None:
+            raise RuntimeError("Host is not started")
+        self._server.close()
+        for connection in list(self._connections):
+            await connection.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> "DistributedRuntimeHost":
+        """Start the host."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Stop the host."""
+        await self.stop()
+
+    async def _serve(self, connection: FrameConnection) -> None:
+        self._connections.add(connection)
+        try:
+            # Frames of a worker are handled in order, so the messages it publishes are delivered in order
+            while (frame := await connection.read()) is not None:
+                header, payload = frame
+                try:
+                    await self._handle_frame(connection, header, payload)
+                except Exception as e:
+                    logger.error(f"Error handling {header.get('kind')} from a worker", exc_info=True)
+                    if "request_id" in header:
+                        await self._write_error(connection, header["request_id"], e)
+        finally:
+            await self._remove_connection(connection)
+
+    async def _handle_frame(self, connection: FrameConnection, header: dict[str, Any], payload: bytes) -> None:
+        match header["kind"]:
+            case "register_agent_type":
+                agent_type = header["agent_type"]
+                if agent_type in self._agent_types:
+                    raise ValueError(f"Agent with type {agent_type} already exists.")
+                self._agent_types[agent_type] = connection
+                await connection.write({"kind": "result", "request_id": header["request_id"]})
+            case "add_subscription":
+                subscription = subscription_from_dict(header["subscription"])
+                await self._subscription_manager.add_subscription(subscription)
+                self._subscription_owners[subscription.id] = connection
+                await connection.write({"kind": "result", "request_id": header["request_id"]})
+            case "remove_subscription":
+                await self._subscription_manager.remove_subscription(header["id"])
+                self._subscription_owners.pop(header["id"], None)
+                await connection.write({"kind": "result", "request_id": header["request_id"]})
+            case "send":
+                await self._forward_send(connection, header, payload)
+            case "result":
+                pending = self._pending_requests.pop(header["request_id"], None)
+                if pending is not None:
+                    await pending.origin.write({**header, "request_id": pending.request_id}, payload)
+            case "publish":
+                await self._deliver_publish(header, payload)
+            case kind:
+                raise ValueError(f"Unknown frame kind: {kind}")
+
+    async def _forward_send(self, connection: FrameConnection, header: dict[str, Any], payload: bytes) -> None:
+        recipient = CoreAgentId.from_str(header["recipient"])
+        target = self._agent_types.get(recipient.type)
+        if target is None:
+            raise LookupError(f"Agent type '{recipient.type}' does not exist.")
+        request_id = next(self._request_ids)
+        self._pending_requests[request_id] = _PendingRequest(connection, header["request_id"], target)
+        await target.write({**header, "request_id": request_id}, payload)
+
+    async def _deliver_publish(self, header: dict[str, Any], payload: bytes) -> None:
+        topic_id = TopicId.from_str(header["topic_id"])
+        sender = header.get("sender")
+        recipients_by_worker: defaultdict[FrameConnection, list[str]] = defaultdict(list)
+        for recipient in await self._subscription_manager.get_subscribed_recipients(topic_id):
+            # Avoid sending the message back to the sender
+            if str(recipient) == sender:
+                continue
+            target = self._get_worker(recipient)
+            if target is None:
+                logger.warning(f"Agent type '{recipient.type}' of a subscription to {topic_id} does not exist.")
+                continue
+            recipients_by_worker[target].append(str(recipient))
+        # The payload is sent once per worker, with all the recipients that worker hosts
+        for target, recipients in recipients_by_worker.items():
+            await target.write({**header, "kind": "deliver", "recipients": recipients}, payload)
+
+    def _get_worker(self, agent_id: AgentId) -> FrameConnection | None:
+        return self._agent_types.get(agent_id.type)
+
+    async def _write_error(self, connection: FrameConnection, request_id: int, error: BaseException) -> None:
+        await connection.write({
+            "kind": "result",
+            "request_id": request_id,
+            "error": str(error),
+            "error_type": type(error).__name__,
+        })
+
+    async def _remove_connection(self, connection: FrameConnection) -> None:
+        """Remove the agent types and subscriptions of a worker that disconnected and fail its pending requests."""
+        self._connections.discard(connection)
+        for agent_type in [t for t, owner in self._agent_types.items() if owner is connection]:
+            del self._agent_types[agent_type]
+        for subscription_id in [s for s, owner in self._subscription_owners.items() if owner is connection]:
+            del self._subscription_owners[subscription_id]
+            await self._subscription_manager.remove_subscription(subscription_id)
+        for request_id, pending in list(self._pending_requests.items()):
+            if pending.origin is connection:
+                del self._pending_requests[request_id]
+            elif pending.target is connection:
+                del self._pending_requests[request_id]
+                with contextlib.suppress(ConnectionError):
+                    await self._write_error(
+                        pending.origin, pending.request_id, ConnectionError("The worker of the recipient disconnected.")
+                    )
+        await connection.close()
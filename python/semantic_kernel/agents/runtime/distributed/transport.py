@@ -0,0 +1,150 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import contextlib
+import json
+import struct
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from semantic_kernel.agents.runtime.core.subscription import Subscription
+from semantic_kernel.agents.runtime.in_process.type_prefix_subscription import TypePrefixSubscription
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+UNIX_ADDRESS_PREFIX = "unix:"
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# A frame is the length of the json header and of the payload, followed by the header and the payload
+_FRAME_PREFIX = struct.Struct("!II")
+
+
+@experimental
+class FrameConnection:
+    """A connection that exchanges frames of a json header and a binary payload over an asyncio stream."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Initialize the FrameConnection.
+
+        Args:
+            reader: The stream to read frames from.
+            writer: The stream to write frames to.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._write_lock = asyncio.Lock()
+
+    async def read(self) -> tuple[dict[str, Any], bytes] | None:
+        """Read the next frame, returns None when the connection was closed."""
+        try:
+            prefix = await self._reader.readexactly(_FRAME_PREFIX.size)
+            header_size, payload_size = _FRAME_PREFIX.unpack(prefix)
+            if header_size + payload_size > MAX_FRAME_SIZE:
+                raise ValueError(f"Frame of {header_size + payload_size} bytes exceeds the maximum frame size.")
+            header = await self._reader.readexactly(header_size)
+            payload = await self._reader.readexactly(payload_size) if payload_size else b""
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+        return json.loads(header), payload
+
+    async def write(self, header: dict[str, Any], payload: bytes = b"") -> None:
+        """Write a frame.
+
+        Args:
+            header: The json serializable header of the frame.
+            payload: The binary payload of the frame.
+        """
+        encoded_header = json.dumps(header).encode("utf-8")
+        # The frame is written with a single call, so frames of concurrent writers are never interleaved
+        self._writer.write(_FRAME_PREFIX.pack(len(encoded_header), len(payload)) + encoded_header + payload)
+        async with self._write_lock:
+            await self._writer.drain()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer.is_closing():
+            return
+        self._writer.close()
+        with contextlib.suppress(ConnectionError):
+            await self._writer.wait_closed()
+
+
+@experimental
+async def open_frame_connection(address: str) -> FrameConnection:
+    """Connect to a host.
+
+    Args:
+        address: The address of the host, either `host:port` or `unix:<path>` for a Unix socket.
+    """
+    if address.startswith(UNIX_ADDRESS_PREFIX):
+        reader, writer = await asyncio.open_unix_connection(address.removeprefix(UNIX_ADDRESS_PREFIX))
+    else:
+        host, port = _split_tcp_address(address)
+        reader, writer = await asyncio.open_connection(host, port)
+    return FrameConnection(reader, writer)
+
+
+@experimental
+async def start_frame_server(
+    address: str, on_connection: Callable[[FrameConnection], Awaitable[None]]
+) -> tuple[asyncio.Server, str]:
+    """Start a server that calls `on_connection` for every connection.
+
+    Args:
+        address: The address to listen on, either `host:port` or `unix:<path>`, use port 0 to pick a free port.
+        on_connection: The callback that serves a connection.
+
+    Returns:
+        The server and the address it listens on.
+    """
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await on_connection(FrameConnection(reader, writer))
+
+    if address.startswith(UNIX_ADDRESS_PREFIX):
+        server = await asyncio.start_unix_server(handle, address.removeprefix(UNIX_ADDRESS_PREFIX))
+        return server, address
+    host, port = _split_tcp_address(address)
+    server = await asyncio.start_server(handle, host, port)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"{host}:{port}"
+
+
+def _split_tcp_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Invalid address: {address}. Use `host:port` or `unix:<path>`.")
+    return host, int(port)
+
+
+@experimental
+def subscription_to_dict(subscription: Subscription) -> dict[str, str]:
+    """Convert a subscription to a json serializable dict, so it can be registered with the host."""
+    if isinstance(subscription, TypeSubscription):
+        return {
+            "kind": "type",
+            "id": subscription.id,
+            "topic_type": subscription.topic_type,
+            "agent_type": subscription.agent_type,
+        }
+    if isinstance(subscription, TypePrefixSubscription):
+        return {
+            "kind": "prefix",
+            "id": subscription.id,
+            "topic_type_prefix": subscription.topic_type_prefix,
+            "agent_type": subscription.agent_type,
+        }
+    raise ValueError(
+        f"Subscription of type {type(subscription).__name__} can not be used with a distributed runtime, "
+        "use a TypeSubscription or a TypePrefixSubscription."
+    )
+
+
+@experimental
+def subscription_from_dict(data: dict[str, str]) -> Subscription:
+    """Create a subscription from the dict created by `subscription_to_dict`."""
+    if data["kind"] == "type":
+        return TypeSubscription(data["topic_type"], data["agent_type"], id=data["id"])
+    if data["kind"] == "prefix":
+        return TypePrefixSubscription(data["topic_type_prefix"], data["agent_type"], id=data["id"])
+    raise ValueError(f"Unknown subscription kind: {data['kind']}")
@@ -7,8 +7,10 @@ import sys
 import uuid
 import warnings
 from asyncio import CancelledError, Future, Queue, Task
-from collections.abc import Awaitable, Callable, Mapping, Sequence
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any, ParamSpec, TypeVar, cast
 
 from semantic_kernel.utils.feature_stage_decorator import experimental
@@ -53,7 +55,7 @@ from semantic_kernel.agents.runtime.core.topic import TopicId
 
 from .agent_instantiation_context import AgentInstantiationContext
 from .message_handler_context import MessageHandlerContext
-from .runtime_impl_helpers import SubscriptionManager, get_impl
+from .runtime_impl_helpers import FifoLimiter, HandlerSlot, SubscriptionManager, get_impl
 
 logger = logging.getLogger("in_process_runtime")
 event_logger = logging.getLogger("in_process_runtime.events")
@@ -74,6 +76,7 @@ class PublishMessageEnvelope:
     topic_id: TopicId
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    queue_slot: FifoLimiter | None = None
 
 
 @experimental
@@ -88,6 +91,9 @@ class SendMessageEnvelope:
     cancellation_token: CancellationToken
     metadata: EnvelopeMetadata | None = None
     message_id: str
+    queue_slot: FifoLimiter | None = None
+    from_message_handler: bool = False
+    held_agent_types: frozenset[str] = field(default_factory=frozenset)
 
 
 @experimental
@@ -147,6 +153,19 @@ class RunContext:
         await asyncio.create_task(check_condition())
 
 
+# The agent types whose handler slots are held by the current handler and the handlers waiting for its response
+_held_agent_types: ContextVar[frozenset[str]] = ContextVar("held_agent_types", default=frozenset())
+
+
+@contextmanager
+def _hold_agent_type(held_agent_types: frozenset[str], agent_type: str) -> Iterator[None]:
+    token = _held_agent_types.set(held_agent_types | {agent_type})
+    try:
+        yield
+    finally:
+        _held_agent_types.reset(token)
+
+
 def _warn_if_none(value: Any, handler_name: str) -> None:
     """Utility function to check if the intervention handler returned None and issue a warning.
 
@@ -169,6 +188,20 @@ class InProcessRuntime(CoreRuntime):
 
     Messages are delivered in the order they are received, and the runtime processes
     each message in a separate asyncio task concurrently.
+
+    The number of message handlers that run at the same time can be limited across all agents and per agent type.
+    Handlers that wait for a slot of their agent type are started in the order the messages were received,
+    so with a limit of 1 the messages to an agent type are handled one at a time, first in first out.
+    A message that is sent from within a message handler does not count against the global limit,
+    since the sending handler already holds a slot while it waits for the response. For the same reason it
+    does not count against the limit of an agent type whose slot is held by the sending handler or by a handler
+    that waits for it, so an agent can send to its own type and calls like A -> B -> A do not deadlock.
+    Handlers that wait for each other without being part of the same call, like A -> B in one handler while
+    B -> A in another, can still deadlock when both agent types are limited.
+
+    When `max_queue_size` is set, `send_message` and `publish_message` wait while that many messages are queued
+    and not yet handled, which applies backpressure to the producers. Messages sent or published from within
+    a message handler are always accepted, so handlers can not deadlock the runtime.
     """
 
     def __init__(
@@ -177,8 +210,25 @@ class InProcessRuntime(CoreRuntime):
         intervention_handlers: list[InterventionHandler] | None = None,
         tracer_provider: TracerProvider | None = None,
         ignore_unhandled_exceptions: bool = True,
+        max_queue_size: int = 0,
+        max_concurrent_handlers: int | None = None,
+        max_concurrent_handlers_per_agent_type: int | Mapping[str, int] | None = None,
     ) -> None:
-        """Initialize the runtime."""
+        """Initialize the runtime.
+
+        Args:
+            intervention_handlers: The intervention handlers to call for every message.
+            tracer_provider: The tracer provider to use for tracing.
+            ignore_unhandled_exceptions: Whether to ignore exceptions raised by the handlers of published messages.
+            max_queue_size: The number of messages from outside a message handler that can be queued before
+                `send_message` and `publish_message` wait, 0 means unbounded.
+            max_concurrent_handlers: The number of message handlers that can run at the same time, None means
+                unbounded.
+            max_concurrent_handlers_per_agent_type: The number of message handlers that can run at the same time
+                per agent type, either one limit for all agent types or a limit by agent type, None means unbounded.
+        """
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must be 0 or greater.")
         self._tracer_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("InProcessRuntime"))
         self._message_queue: Queue[PublishMessageEnvelope | SendMessageEnvelope | ResponseMessageEnvelope] = Queue()
         # (namespace, type) -> List[AgentId]
@@ -193,6 +243,11 @@ class InProcessRuntime(CoreRuntime):
         self._serialization_registry = SerializationRegistry()
         self._ignore_unhandled_handler_exceptions = ignore_unhandled_exceptions
         self._background_exception: BaseException | None = None
+        self._max_queue_size = max_queue_size
+        self._queue_limiter = FifoLimiter(max_queue_size) if max_queue_size > 0 else None
+        self._handler_limiter = FifoLimiter(max_concurrent_handlers) if max_concurrent_handlers is not None else None
+        self._max_concurrent_handlers_per_agent_type = max_concurrent_handlers_per_agent_type
+        self._agent_type_limiters: dict[str, FifoLimiter] = {}
 
     @property
     def unprocessed_messages_count(
@@ -222,15 +277,16 @@ class InProcessRuntime(CoreRuntime):
         if message_id is None:
             message_id = str(uuid.uuid4())
 
-        event_logger.info(
-            MessageEvent(
-                payload=self._try_serialize(message),
-                sender=sender,
-                receiver=recipient,
-                kind=MessageKind.DIRECT,
-                delivery_stage=DeliveryStage.SEND,
+        if event_logger.isEnabledFor(logging.INFO):
+            event_logger.info(
+                MessageEvent(
+                    payload=self._try_serialize(message),
+                    sender=sender,
+                    receiver=recipient,
+                    kind=MessageKind.DIRECT,
+                    delivery_stage=DeliveryStage.SEND,
+                )
             )
-        )
 
         with self._tracer_helper.trace_block(
             "create",
@@ -242,9 +298,12 @@ class InProcessRuntime(CoreRuntime):
             if recipient.type not in self._known_agent_names:
                 future.set_exception(Exception("Recipient not found"))
 
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Sending message of type {type(message).__name__} to {recipient.type}: {content}")
 
+            from_message_handler = self._in_message_handler()
+            queue_slot = None if from_message_handler else await self._acquire_queue_slot()
             await self._message_queue.put(
                 SendMessageEnvelope(
                     message=message,
@@ -254,6 +313,9 @@ class InProcessRuntime(CoreRuntime):
                     sender=sender,
                     metadata=get_telemetry_envelope_metadata(),
                     message_id=message_id,
+                    queue_slot=queue_slot,
+                    from_message_handler=from_message_handler,
+                    held_agent_types=_held_agent_types.get(),
                 )
             )
 
@@ -279,22 +341,25 @@ class InProcessRuntime(CoreRuntime):
         ):
             if cancellation_token is None:
                 cancellation_token = CancellationToken()
-            content = message.__dict__ if hasattr(message, "__dict__") else message
-            logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
+            if logger.isEnabledFor(logging.INFO):
+                content = message.__dict__ if hasattr(message, "__dict__") else message
+                logger.info(f"Publishing message of type {type(message).__name__} to all subscribers: {content}")
 
             if message_id is None:
                 message_id = str(uuid.uuid4())
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message),
-                    sender=sender,
-                    receiver=topic_id,
-                    kind=MessageKind.PUBLISH,
-                    delivery_stage=DeliveryStage.SEND,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize(message),
+                        sender=sender,
+                        receiver=topic_id,
+                        kind=MessageKind.PUBLISH,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
+            queue_slot = None if self._in_message_handler() else await self._acquire_queue_slot()
             await self._message_queue.put(
                 PublishMessageEnvelope(
                     message=message,
@@ -303,6 +368,7 @@ class InProcessRuntime(CoreRuntime):
                     topic_id=topic_id,
                     metadata=get_telemetry_envelope_metadata(),
                     message_id=message_id,
+                    queue_slot=queue_slot,
                 )
             )
 
@@ -346,73 +412,94 @@ class InProcessRuntime(CoreRuntime):
             recipient = message_envelope.recipient
 
             if recipient.type not in self._known_agent_names:
+                self._release_queue_slot(message_envelope)
                 raise LookupError(f"Agent type '{recipient.type}' does not exist.")
 
+            # A message sent from within a handler is part of the work of that handler, which holds a global slot,
+            # and of the handlers waiting for it, which hold the slots of their agent types
+            handler_slot = self._create_handler_slot(
+                recipient.type,
+                use_global_limit=not message_envelope.from_message_handler,
+                use_type_limit=recipient.type not in message_envelope.held_agent_types,
+            )
             try:
                 sender_id = str(message_envelope.sender) if message_envelope.sender is not None else "Unknown"
                 logger.info(
                     f"Calling message handler for {recipient} with message type "
                     f"{type(message_envelope.message).__name__} sent by {sender_id}"
                 )
-                event_logger.info(
-                    MessageEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        sender=message_envelope.sender,
-                        receiver=recipient,
-                        kind=MessageKind.DIRECT,
-                        delivery_stage=DeliveryStage.DELIVER,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageEvent(
+                            payload=self._try_serialize(message_envelope.message),
+                            sender=message_envelope.sender,
+                            receiver=recipient,
+                            kind=MessageKind.DIRECT,
+                            delivery_stage=DeliveryStage.DELIVER,
+                        )
                     )
-                )
-                recipient_agent = await self._get_agent(recipient)
-
-                message_context = MessageContext(
-                    sender=message_envelope.sender,
-                    topic_id=None,
-                    is_rpc=True,
-                    cancellation_token=message_envelope.cancellation_token,
-                    message_id=message_envelope.message_id,
-                )
-                with (
-                    self._tracer_helper.trace_block("process", recipient_agent.id, parent=message_envelope.metadata),
-                    MessageHandlerContext.populate_context(recipient_agent.id),
-                ):
-                    response = await recipient_agent.on_message(
-                        message_envelope.message,
-                        ctx=message_context,
+                async with handler_slot:
+                    self._release_queue_slot(message_envelope)
+                    recipient_agent = await self._get_agent(recipient)
+
+                    message_context = MessageContext(
+                        sender=message_envelope.sender,
+                        topic_id=None,
+                        is_rpc=True,
+                        cancellation_token=message_envelope.cancellation_token,
+                        message_id=message_envelope.message_id,
                     )
+                    with (
+                        self._tracer_helper.trace_block(
+                            "process", recipient_agent.id, parent=message_envelope.metadata
+                        ),
+                        MessageHandlerContext.populate_context(recipient_agent.id),
+                        _hold_agent_type(message_envelope.held_agent_types, recipient.type),
+                    ):
+                        response = await recipient_agent.on_message(
+                            message_envelope.message,
+                            ctx=message_context,
+                        )
             except CancelledError as e:
+                handler_slot.cancel()
+                self._release_queue_slot(message_envelope)
                 if not message_envelope.future.cancelled():
                     message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._try_serialize(message_envelope.message),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
             except BaseException as e:
+                handler_slot.cancel()
+                self._release_queue_slot(message_envelope)
                 message_envelope.future.set_exception(e)
                 self._message_queue.task_done()
-                event_logger.info(
-                    MessageHandlerExceptionEvent(
-                        payload=self._try_serialize(message_envelope.message),
-                        handling_agent=recipient,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        MessageHandlerExceptionEvent(
+                            payload=self._try_serialize(message_envelope.message),
+                            handling_agent=recipient,
+                            exception=e,
+                        )
                     )
-                )
                 return
 
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(response),
-                    sender=message_envelope.recipient,
-                    receiver=message_envelope.sender,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.SEND,
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize(response),
+                        sender=message_envelope.recipient,
+                        receiver=message_envelope.sender,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.SEND,
+                    )
                 )
-            )
 
             await self._message_queue.put(
                 ResponseMessageEnvelope(
@@ -427,44 +514,41 @@ class InProcessRuntime(CoreRuntime):
 
     async def _process_publish(self, message_envelope: PublishMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("publish", message_envelope.topic_id, parent=message_envelope.metadata):
+            handler_slots: list[HandlerSlot] = []
+            handlers_scheduled = False
             try:
-                responses: list[Awaitable[Any]] = []
-                recipients = await self._subscription_manager.get_subscribed_recipients(message_envelope.topic_id)
-                for agent_id in recipients:
-                    # Avoid sending the message back to the sender
-                    if message_envelope.sender is not None and agent_id == message_envelope.sender:
-                        continue
-
-                    sender_agent = (
-                        await self._get_agent(message_envelope.sender) if message_envelope.sender is not None else None
-                    )
-                    sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
-                    logger.info(
-                        f"Calling message handler for {agent_id.type} with message type "
-                        f"{type(message_envelope.message).__name__} published by {sender_name}"
+                message = message_envelope.message
+                sender = message_envelope.sender
+                message_type = type(message).__name__
+                log_events = event_logger.isEnabledFor(logging.INFO)
+                # The sender name and the event payload are the same for every recipient,
+                # so they are resolved once, when the first recipient is found.
+                sender_name: str | None = None
+                payload: str | None = None
+
+                # Avoid sending the message back to the sender
+                recipients = [
+                    agent_id
+                    for agent_id in await self._subscription_manager.get_subscribed_recipients(
+                        message_envelope.topic_id
                     )
-                    event_logger.info(
-                        MessageEvent(
-                            payload=self._try_serialize(message_envelope.message),
-                            sender=message_envelope.sender,
-                            receiver=None,
-                            kind=MessageKind.PUBLISH,
-                            delivery_stage=DeliveryStage.DELIVER,
-                        )
-                    )
-                    message_context = MessageContext(
-                        sender=message_envelope.sender,
-                        topic_id=message_envelope.topic_id,
-                        is_rpc=False,
-                        cancellation_token=message_envelope.cancellation_token,
-                        message_id=message_envelope.message_id,
-                    )
-                    agent = await self._get_agent(agent_id)
-
-                    async def _on_message(agent: Agent, message_context: MessageContext) -> Any:
+                    if sender is None or agent_id != sender
+                ]
+                # The slots are reserved before anything is awaited, so they are granted in the order of the messages.
+                # The queue slot of the message is released once all its handlers have started.
+                handler_slots = [self._create_handler_slot(agent_id.type) for agent_id in recipients]
+                waiting_handlers = len(handler_slots)
+
+                async def _on_message(agent: Agent, message_context: MessageContext, handler_slot: HandlerSlot) -> Any:
+                    nonlocal waiting_handlers
+                    async with handler_slot:
+                        waiting_handlers -= 1
+                        if waiting_handlers == 0:
+                            self._release_queue_slot(message_envelope)
                         with (
                             self._tracer_helper.trace_block("process", agent.id, parent=message_envelope.metadata),
                             MessageHandlerContext.populate_context(agent.id),
+                            _hold_agent_type(frozenset(), agent.id.type),
                         ):
                             try:
                                 return await agent.on_message(
@@ -473,46 +557,82 @@ class InProcessRuntime(CoreRuntime):
                                 )
                             except BaseException as e:
                                 logger.error(f"Error processing publish message for {agent.id}", exc_info=True)
-                                event_logger.info(
-                                    MessageHandlerExceptionEvent(
-                                        payload=self._try_serialize(message_envelope.message),
-                                        handling_agent=agent.id,
-                                        exception=e,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageHandlerExceptionEvent(
+                                            payload=self._try_serialize(message_envelope.message),
+                                            handling_agent=agent.id,
+                                            exception=e,
+                                        )
                                     )
-                                )
                                 raise e
 
-                    future = _on_message(agent, message_context)
-                    responses.append(future)
+                responses: list[Awaitable[Any]] = []
+                for agent_id, handler_slot in zip(recipients, handler_slots):
+                    if sender_name is None:
+                        sender_agent = await self._get_agent(sender) if sender is not None else None
+                        sender_name = str(sender_agent.id) if sender_agent is not None else "Unknown"
+                    logger.info(
+                        f"Calling message handler for {agent_id.type} with message type {message_type} "
+                        f"published by {sender_name}"
+                    )
+                    if log_events:
+                        if payload is None:
+                            payload = self._try_serialize(message)
+                        event_logger.info(
+                            MessageEvent(
+                                payload=payload,
+                                sender=sender,
+                                receiver=None,
+                                kind=MessageKind.PUBLISH,
+                                delivery_stage=DeliveryStage.DELIVER,
+                            )
+                        )
+                    message_context = MessageContext(
+                        sender=sender,
+                        topic_id=message_envelope.topic_id,
+                        is_rpc=False,
+                        cancellation_token=message_envelope.cancellation_token,
+                        message_id=message_envelope.message_id,
+                    )
+                    agent = await self._get_agent(agent_id)
+                    responses.append(_on_message(agent, message_context, handler_slot))
 
+                handlers_scheduled = True
                 await asyncio.gather(*responses)
             except BaseException as e:
                 if not self._ignore_unhandled_handler_exceptions:
                     self._background_exception = e
             finally:
+                if not handlers_scheduled:
+                    for handler_slot in handler_slots:
+                        handler_slot.cancel()
+                self._release_queue_slot(message_envelope)
                 self._message_queue.task_done()
             # TODO(evmattso): if responses are given for a publish
 
     async def _process_response(self, message_envelope: ResponseMessageEnvelope) -> None:
         with self._tracer_helper.trace_block("ack", message_envelope.recipient, parent=message_envelope.metadata):
-            content = (
-                message_envelope.message.__dict__
-                if hasattr(message_envelope.message, "__dict__")
-                else message_envelope.message
-            )
-            logger.info(
-                f"Resolving response with message type {type(message_envelope.message).__name__} for recipient "
-                f"{message_envelope.recipient} from {message_envelope.sender.type}: {content}"
-            )
-            event_logger.info(
-                MessageEvent(
-                    payload=self._try_serialize(message_envelope.message),
-                    sender=message_envelope.sender,
-                    receiver=message_envelope.recipient,
-                    kind=MessageKind.RESPOND,
-                    delivery_stage=DeliveryStage.DELIVER,
+            if logger.isEnabledFor(logging.INFO):
+                content = (
+                    message_envelope.message.__dict__
+                    if hasattr(message_envelope.message, "__dict__")
+                    else message_envelope.message
+                )
+                logger.info(
+                    f"Resolving response with message type {type(message_envelope.message).__name__} for recipient "
+                    f"{message_envelope.recipient} from {message_envelope.sender.type}: {content}"
+                )
+            if event_logger.isEnabledFor(logging.INFO):
+                event_logger.info(
+                    MessageEvent(
+                        payload=self._try_serialize(message_envelope.message),
+                        sender=message_envelope.sender,
+                        receiver=message_envelope.recipient,
+                        kind=MessageKind.RESPOND,
+                        delivery_stage=DeliveryStage.DELIVER,
+                    )
                 )
-            )
             if not message_envelope.future.cancelled():
                 message_envelope.future.set_result(message_envelope.message)
             self._message_queue.task_done()
@@ -562,17 +682,20 @@ class InProcessRuntime(CoreRuntime):
                                 )
                                 _warn_if_none(temp_message, "on_send")
                             except BaseException as e:
+                                self._release_queue_slot(message_envelope)
                                 future.set_exception(e)
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=recipient,
-                                        kind=MessageKind.DIRECT,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._try_serialize(message),
+                                            sender=sender,
+                                            receiver=recipient,
+                                            kind=MessageKind.DIRECT,
+                                        )
                                     )
-                                )
+                                self._release_queue_slot(message_envelope)
                                 future.set_exception(MessageDroppedException())
                                 return
 
@@ -603,16 +726,19 @@ class InProcessRuntime(CoreRuntime):
                             except BaseException as e:
                                 # TODO(evmattso): we should raise the intervention exception to the publisher.
                                 logger.error(f"Exception raised in in intervention handler: {e}", exc_info=True)
+                                self._release_queue_slot(message_envelope)
                                 return
                             if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                                event_logger.info(
-                                    MessageDroppedEvent(
-                                        payload=self._try_serialize(message),
-                                        sender=sender,
-                                        receiver=topic_id,
-                                        kind=MessageKind.PUBLISH,
+                                if event_logger.isEnabledFor(logging.INFO):
+                                    event_logger.info(
+                                        MessageDroppedEvent(
+                                            payload=self._try_serialize(message),
+                                            sender=sender,
+                                            receiver=topic_id,
+                                            kind=MessageKind.PUBLISH,
+                                        )
                                     )
-                                )
+                                self._release_queue_slot(message_envelope)
                                 return
 
                         message_envelope.message = temp_message
@@ -631,14 +757,15 @@ class InProcessRuntime(CoreRuntime):
                             future.set_exception(e)
                             return
                         if temp_message is DropMessage or isinstance(temp_message, DropMessage):
-                            event_logger.info(
-                                MessageDroppedEvent(
-                                    payload=self._try_serialize(message),
-                                    sender=sender,
-                                    receiver=recipient,
-                                    kind=MessageKind.RESPOND,
+                            if event_logger.isEnabledFor(logging.INFO):
+                                event_logger.info(
+                                    MessageDroppedEvent(
+                                        payload=self._try_serialize(message),
+                                        sender=sender,
+                                        receiver=recipient,
+                                        kind=MessageKind.RESPOND,
+                                    )
                                 )
-                            )
                             future.set_exception(MessageDroppedException())
                             return
                         message_envelope.message = temp_message
@@ -677,7 +804,7 @@ class InProcessRuntime(CoreRuntime):
             await self._run_context.stop()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._reset_message_queue()
 
     async def stop_when_idle(self) -> None:
         """Stop the runtime message processing loop when there is no outstanding message being processed or queued.
@@ -691,7 +818,7 @@ class InProcessRuntime(CoreRuntime):
             await self._run_context.stop_when_idle()
         finally:
             self._run_context = None
-            self._message_queue = Queue()
+            self._reset_message_queue()
 
     async def stop_when(self, condition: Callable[[], bool]) -> None:
         """Stop the runtime message processing loop when the condition is met.
@@ -712,7 +839,7 @@ class InProcessRuntime(CoreRuntime):
         await self._run_context.stop_when(condition)
 
         self._run_context = None
-        self._message_queue = Queue()
+        self._reset_message_queue()
 
     async def agent_metadata(self, agent: AgentId) -> AgentMetadata:
         """Get the metadata for an agent."""
@@ -783,12 +910,13 @@ class InProcessRuntime(CoreRuntime):
                 return agent
 
             except BaseException as e:
-                event_logger.info(
-                    AgentConstructionExceptionEvent(
-                        agent_id=agent_id,
-                        exception=e,
+                if event_logger.isEnabledFor(logging.INFO):
+                    event_logger.info(
+                        AgentConstructionExceptionEvent(
+                            agent_id=agent_id,
+                            exception=e,
+                        )
                     )
-                )
                 logger.error(f"Error constructing agent {agent_id}", exc_info=True)
                 raise
 
@@ -844,6 +972,49 @@ class InProcessRuntime(CoreRuntime):
         """Add a message serializer to the runtime."""
         self._serialization_registry.add_serializer(serializer)
 
+    @staticmethod
+    def _in_message_handler() -> bool:
+        try:
+            MessageHandlerContext.agent_id()
+        except RuntimeError:
+            return False
+        return True
+
+    async def _acquire_queue_slot(self) -> FifoLimiter | None:
+        """Wait until there is room in the queue, returns the limiter that holds the slot."""
+        if self._queue_limiter is None:
+            return None
+        limiter = self._queue_limiter
+        await limiter.acquire()
+        return limiter
+
+    @staticmethod
+    def _release_queue_slot(message_envelope: SendMessageEnvelope | PublishMessageEnvelope) -> None:
+        if message_envelope.queue_slot is not None:
+            message_envelope.queue_slot.release()
+            message_envelope.queue_slot = None
+
+    def _create_handler_slot(
+        self, agent_type: str, use_global_limit: bool = True, use_type_limit: bool = True
+    ) -> HandlerSlot:
+        type_limiter = self._agent_type_limiters.get(agent_type)
+        if type_limiter is None and use_type_limit:
+            limits = self._max_concurrent_handlers_per_agent_type
+            limit = limits.get(agent_type) if isinstance(limits, Mapping) else limits
+            if limit is not None:
+                type_limiter = self._agent_type_limiters[agent_type] = FifoLimiter(limit)
+        return HandlerSlot(
+            type_limiter if use_type_limit else None, self._handler_limiter if use_global_limit else None
+        )
+
+    def _reset_message_queue(self) -> None:
+        """Replace the message queue after the runtime stopped, the messages that were left are discarded."""
+        self._message_queue = Queue()
+        if self._queue_limiter is not None:
+            # The slots of the discarded messages are never released, so the producers move on to a new limiter
+            self._queue_limiter.close()
+            self._queue_limiter = FifoLimiter(self._max_queue_size)
+
     def _try_serialize(self, message: Any) -> str:
         try:
             type_name = self._serialization_registry.type_name(message)
@@ -1,7 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from collections import defaultdict
+import asyncio
+from collections import defaultdict, deque
 from collections.abc import Awaitable, Callable, Sequence
+from types import TracebackType
 from typing import DefaultDict
 
 from semantic_kernel.agents.runtime.core.agent import Agent
@@ -9,6 +11,8 @@ from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
 from semantic_kernel.agents.runtime.core.agent_type import AgentType
 from semantic_kernel.agents.runtime.core.subscription import Subscription
 from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.type_prefix_subscription import TypePrefixSubscription
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 
@@ -35,60 +39,294 @@ async def get_impl(
     return id
 
 
+class _PrefixTrieNode:
+    """A node of the trie that indexes prefix subscriptions by their topic type prefix."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_PrefixTrieNode"] = {}
+        self.subscriptions: dict[str, TypePrefixSubscription] = {}
+
+
+def _is_indexable(subscription: Subscription, subscription_type: type) -> bool:
+    """Check if a subscription can be routed by its type index, i.e. it does not override the matching."""
+    return (
+        isinstance(subscription, subscription_type)
+        and type(subscription).is_match is subscription_type.is_match
+        and type(subscription).map_to_agent is subscription_type.map_to_agent
+    )
+
+
 @experimental
 class SubscriptionManager:
-    """Manages subscriptions for agents."""
+    """Manages subscriptions for agents.
+
+    Subscriptions are indexed for routing: type subscriptions are bucketed by their exact topic type and
+    type prefix subscriptions are stored in a trie by their prefix, other subscriptions are matched one by one.
+    The recipients of the topics that have been published to are cached and updated incrementally when
+    subscriptions are added or removed.
+    """
 
     def __init__(self) -> None:
         """Initialize the SubscriptionManager."""
-        self._subscriptions: list[Subscription] = []
-        self._seen_topics: set[TopicId] = set()
-        self._subscribed_recipients: DefaultDict[TopicId, list[AgentId]] = defaultdict(list)
+        self._subscriptions: dict[str, Subscription] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._subscription_keys: dict[tuple[str, str, str], str] = {}
+        self._type_index: DefaultDict[str, dict[str, TypeSubscription]] = defaultdict(dict)
+        self._prefix_index = _PrefixTrieNode()
+        self._other_subscriptions: dict[str, Subscription] = {}
+        self._seen_topics: DefaultDict[str, set[TopicId]] = defaultdict(set)
+        self._subscribed_recipients: dict[TopicId, list[AgentId]] = {}
 
     @property
     def subscriptions(self) -> Sequence[Subscription]:
         """Get the list of subscriptions."""
-        return self._subscriptions
+        return list(self._subscriptions.values())
 
     async def add_subscription(self, subscription: Subscription) -> None:
         """Add a subscription to the manager."""
-        # Check if the subscription already exists
-        if any(sub == subscription for sub in self._subscriptions):
+        key = self._get_key(subscription)
+        if (
+            subscription.id in self._subscriptions
+            or (key is not None and key in self._subscription_keys)
+            or any(sub == subscription for sub in self._other_subscriptions.values())
+            or (key is None and any(sub == subscription for sub in self._subscriptions.values()))
+        ):
             raise ValueError("Subscription already exists")
 
-        self._subscriptions.append(subscription)
-        self._rebuild_subscriptions(self._seen_topics)
+        self._subscriptions[subscription.id] = subscription
+        self._order[subscription.id] = self._next_order
+        self._next_order += 1
+        if key is not None:
+            self._subscription_keys[key] = subscription.id
+        if isinstance(subscription, TypeSubscription) and key is not None:
+            self._type_index[subscription.topic_type][subscription.id] = subscription
+        elif isinstance(subscription, TypePrefixSubscription) and key is not None:
+            node = self._get_prefix_node(subscription.topic_type_prefix)
+            node.subscriptions[subscription.id] = subscription
+        else:
+            self._other_subscriptions[subscription.id] = subscription
+
+        # The new subscription has the highest order, so its recipient goes to the end of the lists
+        for topic in self._get_seen_matches(subscription):
+            self._subscribed_recipients[topic] = [
+                *self._subscribed_recipients[topic],
+                subscription.map_to_agent(topic),
+            ]
 
     async def remove_subscription(self, id: str) -> None:
         """Remove a subscription from the manager."""
-        # Check if the subscription exists
-        if not any(sub.id == id for sub in self._subscriptions):
+        subscription = self._subscriptions.pop(id, None)
+        if subscription is None:
             raise ValueError("Subscription does not exist")
 
-        def is_not_sub(x: Subscription) -> bool:
-            return x.id != id
-
-        self._subscriptions = list(filter(is_not_sub, self._subscriptions))
+        del self._order[id]
+        key = self._get_key(subscription)
+        if key is not None:
+            self._subscription_keys.pop(key, None)
+        if isinstance(subscription, TypeSubscription) and key is not None:
+            bucket = self._type_index[subscription.topic_type]
+            bucket.pop(id, None)
+            if not bucket:
+                del self._type_index[subscription.topic_type]
+        elif isinstance(subscription, TypePrefixSubscription) and key is not None:
+            self._remove_from_prefix_index(subscription)
+        else:
+            self._other_subscriptions.pop(id, None)
 
-        # Rebuild the subscriptions
-        self._rebuild_subscriptions(self._seen_topics)
+        # Another subscription can map to the same agent, so the affected topics are rebuilt from the index
+        for topic in self._get_seen_matches(subscription):
+            self._subscribed_recipients[topic] = self._build_for_topic(topic)
 
     async def get_subscribed_recipients(self, topic: TopicId) -> list[AgentId]:
         """Get the list of recipients subscribed to a topic."""
-        if topic not in self._seen_topics:
-            self._build_for_new_topic(topic)
-        return self._subscribed_recipients[topic]
-
-    # TODO(evmattso): optimize this...
-    def _rebuild_subscriptions(self, topics: set[TopicId]) -> None:
-        """Rebuild the subscriptions for the given topics."""
-        self._subscribed_recipients.clear()
-        for topic in topics:
-            self._build_for_new_topic(topic)
-
-    def _build_for_new_topic(self, topic: TopicId) -> None:
-        """Build the subscriptions for a new topic."""
-        self._seen_topics.add(topic)
-        for subscription in self._subscriptions:
-            if subscription.is_match(topic):
-                self._subscribed_recipients[topic].append(subscription.map_to_agent(topic))
+        recipients = self._subscribed_recipients.get(topic)
+        if recipients is None:
+            recipients = self._build_for_topic(topic)
+            self._subscribed_recipients[topic] = recipients
+            self._seen_topics[topic.type].add(topic)
+        return recipients
+
+    def _build_for_topic(self, topic: TopicId) -> list[AgentId]:
+        """Build the recipients of a topic from the index, in the order the subscriptions were added."""
+        matches: list[Subscription] = list(self._type_index.get(topic.type, {}).values())
+        node: _PrefixTrieNode | None = self._prefix_index
+        for char in topic.type:
+            matches.extend(node.subscriptions.values())
+            node = node.children.get(char)
+            if node is None:
+                break
+        if node is not None:
+            matches.extend(node.subscriptions.values())
+        matches.extend(sub for sub in self._other_subscriptions.values() if sub.is_match(topic))
+        matches.sort(key=lambda sub: self._order[sub.id])
+        return [sub.map_to_agent(topic) for sub in matches]
+
+    def _get_seen_matches(self, subscription: Subscription) -> list[TopicId]:
+        """Get the seen topics that match a subscription."""
+        if isinstance(subscription, TypeSubscription) and self._get_key(subscription) is not None:
+            return list(self._seen_topics.get(subscription.topic_type, ()))
+        if isinstance(subscription, TypePrefixSubscription) and self._get_key(subscription) is not None:
+            prefix = subscription.topic_type_prefix
+            return [
+                topic
+                for topic_type, topics in self._seen_topics.items()
+                if topic_type.startswith(prefix)
+                for topic in topics
+            ]
+        return [topic for topics in self._seen_topics.values() for topic in topics if subscription.is_match(topic)]
+
+    def _get_prefix_node(self, prefix: str) -> _PrefixTrieNode:
+        """Get the trie node of a prefix, creating the missing nodes."""
+        node = self._prefix_index
+        for char in prefix:
+            node = node.children.setdefault(char, _PrefixTrieNode())
+        return node
+
+    def _remove_from_prefix_index(self, subscription: TypePrefixSubscription) -> None:
+        """Remove a prefix subscription from the trie and prune the nodes that became empty."""
+        path = [self._prefix_index]
+        for char in subscription.topic_type_prefix:
+            path.append(path[-1].children[char])
+        path[-1].subscriptions.pop(subscription.id, None)
+        for char, parent, node in zip(
+            reversed(subscription.topic_type_prefix), reversed(path[:-1]), reversed(path[1:])
+        ):
+            if node.subscriptions or node.children:
+                break
+            del parent.children[char]
+
+    @staticmethod
+    def _get_key(subscription: Subscription) -> tuple[str, str, str] | None:
+        """Get the key that identifies equal subscriptions, None if the subscription is not indexed."""
+        if _is_indexable(subscription, TypeSubscription):
+            return ("type", subscription.topic_type, subscription.agent_type)  # type: ignore[attr-defined]
+        if _is_indexable(subscription, TypePrefixSubscription):
+            return ("prefix", subscription.topic_type_prefix, subscription.agent_type)  # type: ignore[attr-defined]
+        return None
+
+
+@experimental
+class FifoLimiter:
+    """Limits the number of concurrent holders of a slot.
+
+    Unlike an `asyncio.Semaphore`, a slot can be reserved without waiting, and the reservations are granted
+    in the order they were made.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the FifoLimiter.
+
+        Args:
+            limit: The number of slots, must be at least 1.
+        """
+        if limit < 1:
+            raise ValueError("The limit must be at least 1.")
+        self._available = limit
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """The number of reservations that are waiting for a slot."""
+        return sum(not waiter.done() for waiter in self._waiters)
+
+    def reserve(self) -> asyncio.Future[None]:
+        """Reserve a slot, the returned future completes when the slot is granted."""
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        reservation: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            reservation.set_result(None)
+        else:
+            self._waiters.append(reservation)
+        return reservation
+
+    async def wait(self, reservation: asyncio.Future[None]) -> None:
+        """Wait until a reservation is granted, the reservation is given up when the wait is cancelled."""
+        try:
+            await reservation
+        except asyncio.CancelledError:
+            self.cancel(reservation)
+            raise
+
+    async def acquire(self) -> None:
+        """Reserve a slot and wait until it is granted."""
+        await self.wait(self.reserve())
+
+    def cancel(self, reservation: asyncio.Future[None]) -> None:
+        """Give up a reservation that was not released, a granted slot is passed on."""
+        if reservation.done() and not reservation.cancelled():
+            self.release()
+        else:
+            reservation.cancel()
+
+    def release(self) -> None:
+        """Release a slot, it is granted to the oldest waiting reservation."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._available += 1
+
+    def close(self) -> None:
+        """Grant all waiting reservations, used when the limiter is replaced so no waiter is left behind."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+@experimental
+class HandlerSlot:
+    """A slot to run a message handler, limited per agent type and across all agents.
+
+    The slot of the agent type is reserved when the HandlerSlot is created, so handlers of an agent type
+    start in the order their slots were created. The global slot is acquired once the agent type slot is granted.
+    """
+
+    def __init__(self, type_limiter: FifoLimiter | None, global_limiter: FifoLimiter | None) -> None:
+        """Initialize the HandlerSlot and reserve the slot of the agent type.
+
+        Args:
+            type_limiter: The limiter of the agent type, if any.
+            global_limiter: The limiter across all agents, if any.
+        """
+        self._type_limiter = type_limiter
+        self._global_limiter = global_limiter
+        self._reservation = type_limiter.reserve() if type_limiter is not None else None
+        self._entered = False
+
+    async def __aenter__(self) -> None:
+        """Wait until the handler is allowed to run."""
+        self._entered = True
+        if self._type_limiter is not None and self._reservation is not None:
+            await self._type_limiter.wait(self._reservation)
+        if self._global_limiter is not None:
+            try:
+                await self._global_limiter.acquire()
+            except BaseException:
+                if self._type_limiter is not None:
+                    self._type_limiter.release()
+                raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the slots."""
+        if self._global_limiter is not None:
+            self._global_limiter.release()
+        if self._type_limiter is not None:
+            self._type_limiter.release()
+
+    def cancel(self) -> None:
+        """Give up the reservation of a slot that was never used."""
+        if not self._entered and self._type_limiter is not None and self._reservation is not None:
+            self._type_limiter.cancel(self._reservation)
+            self._entered = True
@@ -223,7 +223,7 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
                     system_message_content = curr_message.content
                 system_message_count += 1
             elif curr_message.role == AuthorRole.USER or curr_message.role == AuthorRole.ASSISTANT:
-                formatted_messages.append(MESSAGE_CONVERTERS[curr_message.role](curr_message))
+                formatted_messages.append(curr_message.get_cached_format(MESSAGE_CONVERTERS[curr_message.role]))
             elif curr_message.role == AuthorRole.TOOL:
                 if prev_message is None:
                     # Under no circumstances should a tool message be the first message in the chat history
@@ -234,7 +234,7 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
                     # the tool messages are considered as USER messages. We are checking against the SK roles.
                     raise ServiceInvalidRequestError("Tool message found after a user or system message.")
 
-                formatted_message = MESSAGE_CONVERTERS[curr_message.role](curr_message)
+                formatted_message = curr_message.get_cached_format(MESSAGE_CONVERTERS[curr_message.role])
                 if prev_message.role == AuthorRole.ASSISTANT:
                     # The first tool message after an assistant message should be a new message
                     formatted_messages.append(formatted_message)
@@ -242,7 +242,11 @@ class AnthropicChatCompletion(ChatCompletionClientBase):
                     # Append the tool message to the previous tool message.
                     # This indicates that the assistant message requested multiple parallel tool calls.
                     # Anthropic requires that parallel Tool messages are grouped together in a single message.
-                    formatted_messages[-1][content_key] += formatted_message[content_key]
+                    # The formatted messages are cached on the messages, so they are combined into a new one.
+                    formatted_messages[-1] = {
+                        **formatted_messages[-1],
+                        content_key: formatted_messages[-1][content_key] + formatted_message[content_key],
+                    }
             else:
                 raise ServiceInvalidRequestError(f"Unsupported role in chat history: {curr_message.role}")
 
@@ -227,7 +227,7 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
                 if self.instruction_role == "developer" and message.role == AuthorRole.SYSTEM
                 else message.role
             )
-            chat_request_messages.append(MESSAGE_CONVERTERS[role](message))
+            chat_request_messages.append(message.get_cached_format(MESSAGE_CONVERTERS[role]))
 
         return chat_request_messages
 
@@ -173,7 +173,7 @@ class BedrockChatCompletion(BedrockBase, ChatCompletionClientBase):
         for message in chat_history.messages:
             if message.role == AuthorRole.SYSTEM:
                 continue
-            messages.append(MESSAGE_CONVERTERS[message.role](message))
+            messages.append(message.get_cached_format(MESSAGE_CONVERTERS[message.role]))
 
         return messages
 
@@ -185,7 +185,7 @@ class BedrockChatCompletion(BedrockBase, ChatCompletionClientBase):
         for message in chat_history.messages:
             if message.role != AuthorRole.SYSTEM:
                 continue
-            messages.append(MESSAGE_CONVERTERS[message.role](message))
+            messages.append(message.get_cached_format(MESSAGE_CONVERTERS[message.role]))
 
         return messages
 
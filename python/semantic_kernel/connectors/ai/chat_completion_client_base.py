@@ -1,7 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
-import copy
 import logging
 from abc import ABC
 from collections.abc import AsyncGenerator, Callable
@@ -100,14 +98,13 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
             A list of chat message contents representing the response(s) from the LLM.
         """
         from semantic_kernel.connectors.ai.function_calling_utils import (
+            invoke_function_calls,
             merge_function_results,
         )
 
         # Create a copy of the settings to avoid modifying the original settings
-        settings = copy.deepcopy(settings)
-        # Later on, we already use the tools or equivalent settings, we cast here.
-        if not isinstance(settings, self.get_prompt_execution_settings_class()):
-            settings = self.get_prompt_execution_settings_from_settings(settings)
+        # Later on, we already use the tools or equivalent settings, so it is converted here.
+        settings = settings.copy_for_request(self.get_prompt_execution_settings_class())
 
         if not self.SUPPORTS_FUNCTION_CALLING:
             return await self._inner_get_chat_message_contents(chat_history, settings)
@@ -151,19 +148,15 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
                 # This function either updates the chat history with the function call results
                 # or returns the context, with terminate set to True in which case the loop will
                 # break and the function calls are returned.
-                results = await asyncio.gather(
-                    *[
-                        kernel.invoke_function_call(
-                            function_call=function_call,
-                            chat_history=chat_history,
-                            arguments=kwargs.get("arguments"),
-                            execution_settings=settings,
-                            function_call_count=fc_count,
-                            request_index=request_index,
-                            function_behavior=settings.function_choice_behavior,
-                        )
-                        for function_call in function_calls
-                    ],
+                results = await invoke_function_calls(
+                    kernel,
+                    function_calls,
+                    chat_history,
+                    settings.function_choice_behavior,
+                    arguments=kwargs.get("arguments"),
+                    execution_settings=settings,
+                    function_call_count=fc_count,
+                    request_index=request_index,
                 )
 
                 if any(result.terminate for result in results if result is not None):
@@ -211,14 +204,13 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
             A stream representing the response(s) from the LLM.
         """
         from semantic_kernel.connectors.ai.function_calling_utils import (
+            invoke_function_calls,
             merge_streaming_function_results,
         )
 
         # Create a copy of the settings to avoid modifying the original settings
-        settings = copy.deepcopy(settings)
-        # Later on, we already use the tools or equivalent settings, we cast here.
-        if not isinstance(settings, self.get_prompt_execution_settings_class()):
-            settings = self.get_prompt_execution_settings_from_settings(settings)
+        # Later on, we already use the tools or equivalent settings, so it is converted here.
+        settings = settings.copy_for_request(self.get_prompt_execution_settings_class())
 
         if not self.SUPPORTS_FUNCTION_CALLING:
             async for streaming_chat_message_contents in self._inner_get_streaming_chat_message_contents(
@@ -286,20 +278,16 @@ class ChatCompletionClientBase(AIServiceClientBase, ABC):
                 # This function either updates the chat history with the function call results
                 # or returns the context, with terminate set to True in which case the loop will
                 # break and the function calls are returned.
-                results = await asyncio.gather(
-                    *[
-                        kernel.invoke_function_call(
-                            function_call=function_call,
-                            chat_history=chat_history,
-                            arguments=kwargs.get("arguments"),
-                            is_streaming=True,
-                            execution_settings=settings,
-                            function_call_count=fc_count,
-                            request_index=request_index,
-                            function_behavior=settings.function_choice_behavior,
-                        )
-                        for function_call in function_calls
-                    ],
+                results = await invoke_function_calls(
+                    kernel,
+                    function_calls,
+                    chat_history,
+                    settings.function_choice_behavior,
+                    arguments=kwargs.get("arguments"),
+                    is_streaming=True,
+                    execution_settings=settings,
+                    function_call_count=fc_count,
+                    request_index=request_index,
                 )
 
                 # Merge and yield the function results, regardless of the termination status
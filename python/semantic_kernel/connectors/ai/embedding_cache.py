@@ -0,0 +1,314 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pydantic import Field, PrivateAttr
+
+if sys.version_info >= (3, 12):
+    from typing import override  # pragma: no cover
+else:
+    from typing_extensions import override  # pragma: no cover
+
+from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+if TYPE_CHECKING:
+    from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+SQLITE_MAX_VARIABLES = 500
+
+
+def create_embedding_cache_key(model_id: str, dimensions: int | None, text: Any) -> str:
+    """Create the content-addressed cache key of a text.
+
+    Args:
+        model_id: The id of the model that creates the embedding.
+        dimensions: The requested number of dimensions, if any.
+        text: The text to embed, other values are serialized to json.
+    """
+    if not isinstance(text, str):
+        text = json.dumps(text, sort_keys=True, default=str)
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model_id}:{dimensions or ''}:{text_hash}"
+
+
+@experimental
+class EmbeddingCacheBase(KernelBaseModel, ABC):
+    """Base class for a tier of the embedding cache."""
+
+    name: str
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        """Get the cached embeddings, keys that are not cached are left out of the result.
+
+        Args:
+            keys: The keys to look up.
+        """
+
+    @abstractmethod
+    async def set_many(self, items: dict[str, np.ndarray]) -> None:
+        """Store embeddings in the cache.
+
+        Args:
+            items: The embeddings to store by key.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all embeddings from the cache."""
+
+
+@experimental
+class InMemoryEmbeddingCache(EmbeddingCacheBase):
+    """In-process embedding cache that evicts the least recently used embeddings."""
+
+    name: str = "memory"
+    max_size: int = Field(default=DEFAULT_EMBEDDING_CACHE_SIZE, gt=0)
+    _entries: OrderedDict[str, np.ndarray] = PrivateAttr(default_factory=OrderedDict)
+
+    def __len__(self) -> int:
+        """Get the number of cached embeddings."""
+        return len(self._entries)
+
+    @override
+    async def get_many(self, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        for key in keys:
+            if (embedding := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                found[key] = embedding
+        return found
+
+    @override
+    async def set_many(self, items: dict[str, np.ndarray]) -> None:
+        for key, embedding in items.items():
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @override
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+@experimental
+class SqliteEmbeddingCache(EmbeddingCacheBase):
+    """On-disk embedding cache, stored in a sqlite database so it is shared between processes and restarts."""
+
+    name: str = "sqlite"
+    path: Path
+    _connection: sqlite3.Connection | None = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, dtype TEXT NOT NULL, data BLOB NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _get_many(self, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            connection = self._get_connection()
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                chunk = keys[start : start + SQLITE_MAX_VARIABLES]
+                rows = connection.execute(
+                    f"SELECT key, dtype, data FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})",  # nosec
+                    chunk,
+                )
+                for key, dtype, data in rows:
+                    found[key] = np.frombuffer(data, dtype=dtype)
+        return found
+
+    def _set_many(self, items: dict[str, np.ndarray]) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dtype, data) VALUES (?, ?, ?)",
+                [(key, embedding.dtype.str, embedding.tobytes()) for key, embedding in items.items()],
+            )
+            connection.commit()
+
+    def _clear(self) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute("DELETE FROM embeddings")
+            connection.commit()
+
+    @override
+    async def get_many(self, keys: Sequence[str]) -> dict[str, np.ndarray]:
+        return await asyncio.to_thread(self._get_many, list(keys))
+
+    @override
+    async def set_many(self, items: dict[str, np.ndarray]) -> None:
+        await asyncio.to_thread(self._set_many, items)
+
+    @override
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def close(self) -> None:
+        """Close the connection to the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class EmbeddingCacheMetrics(KernelBaseModel):
+    """The hits and misses of an embedding cache, counted per text."""
+
+    hits: int = 0
+    misses: int = 0
+    tier_hits: dict[str, int] = Field(default_factory=dict)
+
+    @property
+    def lookups(self) -> int:
+        """The total number of texts that were looked up."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of the texts that were found in the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@experimental
+class CachedEmbeddingGenerator(EmbeddingGeneratorBase):
+    """Embedding generator that caches the embeddings of another embedding generator.
+
+    Embeddings are cached by the model id, the requested dimensions and the hash of the text,
+    the caches are checked in order and embeddings found in a later cache are copied into the earlier ones.
+    Only the texts that are not cached are sent to the wrapped generator, duplicate texts are sent once.
+    """
+
+    generator: EmbeddingGeneratorBase
+    caches: list[EmbeddingCacheBase]
+    metrics: EmbeddingCacheMetrics = Field(default_factory=EmbeddingCacheMetrics)
+
+    def __init__(
+        self,
+        generator: EmbeddingGeneratorBase,
+        caches: list[EmbeddingCacheBase] | None = None,
+        disk_cache_path: str | Path | None = None,
+        service_id: str | None = None,
+    ) -> None:
+        """Initialize a CachedEmbeddingGenerator.
+
+        Args:
+            generator: The embedding generator to cache.
+            caches: The cache tiers, from fastest to slowest, defaults to an in-memory LRU cache.
+            disk_cache_path: When set, a sqlite cache at this path is added after the other caches.
+            service_id: The service id, defaults to the service id of the generator.
+        """
+        caches = list(caches) if caches else [InMemoryEmbeddingCache()]
+        if disk_cache_path:
+            caches.append(SqliteEmbeddingCache(path=Path(disk_cache_path)))
+        super().__init__(
+            ai_model_id=generator.ai_model_id,
+            service_id=service_id or generator.service_id,
+            generator=generator,
+            caches=caches,
+        )
+
+    @override
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        async def generate(missing: list[str]) -> list[np.ndarray]:
+            return list(await self.generator.generate_embeddings(missing, settings, **kwargs))
+
+        return np.array(await self._get_embeddings(texts, settings, generate, **kwargs))
+
+    @override
+    async def generate_raw_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None" = None,
+        **kwargs: Any,
+    ) -> Any:
+        async def generate(missing: list[str]) -> list[np.ndarray]:
+            return [
+                np.asarray(raw) for raw in await self.generator.generate_raw_embeddings(missing, settings, **kwargs)
+            ]
+
+        return [embedding.tolist() for embedding in await self._get_embeddings(texts, settings, generate, **kwargs)]
+
+    async def _get_embeddings(
+        self,
+        texts: list[str],
+        settings: "PromptExecutionSettings | None",
+        generate: Callable[[list[str]], Awaitable[list[np.ndarray]]],
+        **kwargs: Any,
+    ) -> list[np.ndarray]:
+        model_id = getattr(settings, "ai_model_id", None) or self.ai_model_id
+        dimensions = kwargs.get("dimensions") or self._get_dimensions(settings)
+        keys = [create_embedding_cache_key(model_id, dimensions, text) for text in texts]
+
+        found: dict[str, np.ndarray] = {}
+        tier_hits: dict[str, int] = {}
+        for index, cache in enumerate(self.caches):
+            pending = [key for key in dict.fromkeys(keys) if key not in found]
+            if not pending:
+                break
+            hits = await cache.get_many(pending)
+            if not hits:
+                continue
+            tier_hits[cache.name] = sum(key in hits for key in keys)
+            found.update(hits)
+            for faster_cache in self.caches[:index]:
+                await faster_cache.set_many(hits)
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        if missing:
+            generated = dict(zip(missing, await generate(list(missing.values()))))
+            for cache in self.caches:
+                await cache.set_many(generated)
+            found.update(generated)
+
+        hits = sum(key not in missing for key in keys)
+        self.metrics.hits += hits
+        self.metrics.misses += len(keys) - hits
+        for name, count in tier_hits.items():
+            self.metrics.tier_hits[name] = self.metrics.tier_hits.get(name, 0) + count
+        logger.debug(f"Embedding cache: {hits} of {len(keys)} texts found, {len(missing)} texts generated.")
+        return [found[key] for key in keys]
+
+    @staticmethod
+    def _get_dimensions(settings: "PromptExecutionSettings | None") -> int | None:
+        if settings is None:
+            return None
+        dimensions = getattr(settings, "dimensions", None)
+        if dimensions is None:
+            dimensions = settings.extension_data.get("dimensions")
+        return dimensions
+
+    @override
+    def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
+        return self.generator.get_prompt_execution_settings_class()
@@ -1,7 +1,13 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from openai import APIConnectionError
+from pydantic import Field
 
 from semantic_kernel.services.ai_service_client_base import AIServiceClientBase
 from semantic_kernel.utils.feature_stage_decorator import experimental
@@ -11,10 +17,57 @@ if TYPE_CHECKING:
 
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+DEFAULT_MAX_BATCH_RETRIES = 2
+BATCH_RETRY_BASE_DELAY = 0.5
+CHARACTERS_PER_TOKEN = 4
+
+
+def _is_transient_error(ex: BaseException) -> bool:
+    """Whether the error, or an error that caused it, is a timeout, a connection error or a 408, 429 or 5xx response.
+
+    The services wrap the errors of their clients, so the chain of causes is checked as well.
+    """
+    error: BaseException | None = ex
+    seen: set[int] = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError, APIConnectionError)):
+            return True
+        status_code = getattr(error, "status_code", None)
+        if isinstance(status_code, int) and (status_code in (408, 429) or status_code >= 500):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
 
 @experimental
 class EmbeddingGeneratorBase(AIServiceClientBase, ABC):
-    """Base class for embedding generators."""
+    """Base class for embedding generators.
+
+    Services that send texts to the model in batches can use the batching engine of this class,
+    which splits the texts by the number of items and by the estimated number of tokens per batch,
+    sends the batches concurrently, retries batches that fail with transient errors
+    and returns the results in the input order.
+    The batching attributes can be set on the service after it is created.
+
+    Attributes:
+        max_batch_size: The maximum number of texts per batch, if not set, the number of texts is not limited.
+        max_batch_tokens: The maximum estimated number of tokens per batch, if not set,
+            the number of tokens is not limited. A single text that exceeds the budget is sent in its own batch.
+        max_concurrent_batches: The maximum number of batches that are sent at the same time.
+        max_batch_retries: The number of times a batch that fails with a timeout, a connection error or
+            a 408, 429 or 5xx response is retried, only the failed batch is resent.
+    """
+
+    max_batch_size: int | None = Field(default=None, gt=0)
+    max_batch_tokens: int | None = Field(default=None, gt=0)
+    max_concurrent_batches: int = Field(default=DEFAULT_MAX_CONCURRENT_BATCHES, gt=0)
+    max_batch_retries: int = Field(default=DEFAULT_MAX_BATCH_RETRIES, ge=0)
 
     @abstractmethod
     async def generate_embeddings(
@@ -48,3 +101,88 @@ class EmbeddingGeneratorBase(AIServiceClientBase, ABC):
             kwargs (Any): Additional arguments to pass to the request.
         """
         return await self.generate_embeddings(texts, settings, **kwargs)
+
+    def estimate_token_count(self, text: str) -> int:
+        """Estimate the number of tokens of a text, used to split texts into batches.
+
+        The default uses a characters per token heuristic, override this to use the tokenizer of the model.
+
+        Args:
+            text: The text to estimate the number of tokens for.
+        """
+        return len(text) // CHARACTERS_PER_TOKEN + 1
+
+    def _create_batches(self, texts: Sequence[str], batch_size: int | None = None) -> list[tuple[int, int]]:
+        """Split the texts into batches, returned as (start, end) ranges of the texts.
+
+        Args:
+            texts: The texts to split.
+            batch_size: The maximum number of texts per batch, defaults to max_batch_size.
+        """
+        batch_size = batch_size or self.max_batch_size or len(texts)
+        if not self.max_batch_tokens:
+            return [(start, min(start + batch_size, len(texts))) for start in range(0, len(texts), batch_size)]
+        batches: list[tuple[int, int]] = []
+        start = 0
+        tokens = 0
+        for index, text in enumerate(texts):
+            text_tokens = self.estimate_token_count(text)
+            if index > start and (index - start >= batch_size or tokens + text_tokens > self.max_batch_tokens):
+                batches.append((start, index))
+                start = index
+                tokens = 0
+            tokens += text_tokens
+        if start < len(texts):
+            batches.append((start, len(texts)))
+        return batches
+
+    async def _send_batches(
+        self,
+        texts: list[str],
+        send_batch: Callable[[list[str]], Awaitable[Sequence[_T]]],
+        batch_size: int | None = None,
+    ) -> list[_T]:
+        """Send the texts in concurrent batches and return the combined results in the order of the texts.
+
+        Args:
+            texts: The texts to send.
+            send_batch: The function that sends a single batch and returns one result per text.
+            batch_size: The maximum number of texts per batch, defaults to max_batch_size.
+
+        Raises:
+            The exception of a batch that fails with an error that is not transient, or that still fails
+            after max_batch_retries retries, the batches that are still pending are cancelled.
+        """
+        if not texts:
+            return []
+        batches = self._create_batches(texts, batch_size)
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def send_with_retries(start: int, end: int) -> Sequence[_T]:
+            async with semaphore:
+                attempt = 0
+                while True:
+                    try:
+                        return await send_batch(texts[start:end])
+                    except Exception as ex:
+                        if attempt >= self.max_batch_retries or not _is_transient_error(ex):
+                            raise
+                        delay = BATCH_RETRY_BASE_DELAY * 2**attempt
+                        attempt += 1
+                        logger.warning(
+                            f"Embedding batch {start}-{end} failed (attempt {attempt}), retrying in {delay}s: {ex}"
+                        )
+                        await asyncio.sleep(delay)
+
+        if len(batches) == 1:
+            return list(await send_with_retries(*batches[0]))
+
+        tasks = [asyncio.create_task(send_with_retries(start, end)) for start, end in batches]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [item for result in results for item in result]
@@ -1,15 +1,48 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from collections.abc import Callable
+from dataclasses import field
+from typing import Annotated, Any, TypeVar
 
+from pydantic import Field
 from pydantic.dataclasses import dataclass
 
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
+_T = TypeVar("_T")
+
 
 @experimental
 @dataclass
 class FunctionCallChoiceConfiguration:
-    """Configuration for function call choice."""
+    """Configuration for function call choice.
+
+    The tools of the available functions are built once per tool format. The kernel caches its configurations
+    as long as its functions do not change, see `Kernel.get_function_call_choice_configuration`,
+    so the tools are not built again for every request.
+    """
 
     available_functions: list[KernelFunctionMetadata] | None = None
+    _tools: Annotated[dict[Any, tuple[Any, int, list[Any]]], Field(exclude=True)] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def get_tools(self, tool_format: Callable[[KernelFunctionMetadata], _T]) -> list[_T]:
+        """Get the available functions in the format of the tools of a connector.
+
+        The tools are shared by every request that uses this configuration, so they must not be changed.
+
+        Args:
+            tool_format: Converts the metadata of a function to a tool.
+
+        Returns:
+            A new list with the tools of the available functions.
+        """
+        functions = self.available_functions or []
+        cached = self._tools.get(tool_format)
+        # The functions can be replaced or extended after the tools were built
+        if cached is None or cached[0] is not functions or cached[1] != len(functions):
+            cached = (functions, len(functions), [tool_format(function) for function in functions])
+            self._tools[tool_format] = cached
+        return list(cached[2])
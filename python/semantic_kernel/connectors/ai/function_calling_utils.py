@@ -1,8 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import logging
 from collections import OrderedDict
-from collections.abc import Callable
-from copy import deepcopy
+from collections.abc import AsyncGenerator, Callable
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any
 
 from semantic_kernel.contents.utils.author_role import AuthorRole
@@ -12,14 +14,22 @@ from semantic_kernel.utils.feature_stage_decorator import experimental
 if TYPE_CHECKING:
     from semantic_kernel.connectors.ai.function_choice_behavior import (
         FunctionCallChoiceConfiguration,
+        FunctionChoiceBehavior,
         FunctionChoiceType,
     )
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+    from semantic_kernel.contents.chat_history import ChatHistory
     from semantic_kernel.contents.chat_message_content import ChatMessageContent
+    from semantic_kernel.contents.function_call_content import FunctionCallContent
     from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
+    from semantic_kernel.filters.auto_function_invocation.auto_function_invocation_context import (
+        AutoFunctionInvocationContext,
+    )
     from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
     from semantic_kernel.kernel import Kernel
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 def update_settings_from_function_call_configuration(
     function_choice_configuration: "FunctionCallChoiceConfiguration",
@@ -33,10 +43,7 @@ def update_settings_from_function_call_configuration(
         and hasattr(settings, "tools")
     ):
         settings.tool_choice = type
-        settings.tools = [
-            kernel_function_metadata_to_function_call_format(f)
-            for f in function_choice_configuration.available_functions
-        ]
+        settings.tools = function_choice_configuration.get_tools(kernel_function_metadata_to_function_call_format)
 
 
 def kernel_function_metadata_to_function_call_format(
@@ -176,9 +183,7 @@ def prepare_settings_for_function_calling(
     Returns:
         PromptExecutionSettings of type settings_class.
     """
-    settings = deepcopy(settings)
-    if not isinstance(settings, settings_class):
-        settings = settings_class.from_prompt_execution_settings(settings)
+    settings = settings.copy_for_request(settings_class)
 
     if settings.function_choice_behavior:
         # Configure the function choice behavior into the settings object
@@ -189,3 +194,101 @@ def prepare_settings_for_function_calling(
             settings=settings,
         )
     return settings
+
+
+async def invoke_function_calls_as_completed(
+    kernel: "Kernel",
+    function_calls: list["FunctionCallContent"],
+    chat_history: "ChatHistory",
+    function_behavior: "FunctionChoiceBehavior | None" = None,
+    **kwargs: Any,
+) -> AsyncGenerator[tuple["FunctionCallContent", "AutoFunctionInvocationContext | None"], None]:
+    """Invoke the function calls of a response concurrently and yield the results as they complete.
+
+    The concurrency limit, the timeouts and whether synchronous functions run in a worker thread
+    are taken from the function choice behavior. Every function call adds its result to the chat history,
+    when a function call times out, a result that says so is added instead.
+
+    Args:
+        kernel: The kernel with the functions.
+        function_calls: The function calls to invoke.
+        chat_history: The chat history, the function results are added to it.
+        function_behavior: The function choice behavior that controls the invocation.
+        kwargs: Additional arguments for `Kernel.invoke_function_call`.
+
+    Yields:
+        The function call and the invocation context if the function requested to terminate, otherwise None.
+    """
+    from semantic_kernel.contents.function_result_content import FunctionResultContent
+    from semantic_kernel.functions.kernel_function_from_method import KernelFunctionFromMethod
+
+    semaphore = (
+        asyncio.Semaphore(function_behavior.max_concurrent_function_calls)
+        if function_behavior and function_behavior.max_concurrent_function_calls
+        else None
+    )
+
+    async def invoke(
+        function_call: "FunctionCallContent",
+    ) -> tuple["FunctionCallContent", "AutoFunctionInvocationContext | None"]:
+        timeout = function_behavior.get_function_call_timeout(function_call.name) if function_behavior else None
+        async with semaphore or nullcontext():
+            with (
+                KernelFunctionFromMethod.run_sync_methods_in_thread()
+                if function_behavior and function_behavior.run_sync_functions_in_thread
+                else nullcontext()
+            ):
+                try:
+                    return function_call, await asyncio.wait_for(
+                        kernel.invoke_function_call(
+                            function_call=function_call,
+                            chat_history=chat_history,
+                            function_behavior=function_behavior,
+                            **kwargs,
+                        ),
+                        timeout,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"The function call `{function_call.name}` timed out after {timeout} seconds.")
+                    frc = FunctionResultContent.from_function_call_content_and_result(
+                        function_call_content=function_call,
+                        result=f"The tool call `{function_call.name}` timed out after {timeout} seconds.",
+                    )
+                    chat_history.add_message(
+                        message=frc.to_streaming_chat_message_content()
+                        if kwargs.get("is_streaming")
+                        else frc.to_chat_message_content()
+                    )
+                    return function_call, None
+
+    if len(function_calls) == 1:
+        yield await invoke(function_calls[0])
+        return
+
+    tasks = [asyncio.create_task(invoke(function_call)) for function_call in function_calls]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def invoke_function_calls(
+    kernel: "Kernel",
+    function_calls: list["FunctionCallContent"],
+    chat_history: "ChatHistory",
+    function_behavior: "FunctionChoiceBehavior | None" = None,
+    **kwargs: Any,
+) -> list["AutoFunctionInvocationContext | None"]:
+    """Invoke the function calls of a response concurrently, see `invoke_function_calls_as_completed`.
+
+    Returns:
+        The results in the order the function calls completed, in which they were also added to the chat history.
+    """
+    return [
+        result
+        async for _, result in invoke_function_calls_as_completed(
+            kernel, function_calls, chat_history, function_behavior, **kwargs
+        )
+    ]
@@ -4,6 +4,8 @@ import logging
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Literal, TypeVar
 
+from pydantic import Field
+
 from semantic_kernel.connectors.ai.function_choice_type import FunctionChoiceType
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError
 from semantic_kernel.kernel_pydantic import KernelBaseModel
@@ -33,6 +35,14 @@ class FunctionChoiceBehavior(KernelBaseModel):
         filters: Filters for the function choice behavior. Available options are: excluded_plugins,
             included_plugins, excluded_functions, or included_functions.
         type_: The type of function choice behavior.
+        max_concurrent_function_calls: The maximum number of function calls of a single response
+            that are invoked at the same time, by default all of them are invoked at once.
+        function_call_timeout: The timeout in seconds for a single function call, by default there is no timeout.
+            When a function call times out, the model receives a result that says so.
+        function_timeouts: Timeouts in seconds for specific functions, by fully qualified name,
+            these take precedence over the function_call_timeout.
+        run_sync_functions_in_thread: Run synchronous kernel functions in a worker thread,
+            so that they do not block the event loop.
 
     Properties:
         auto_invoke_kernel_functions: Check if the kernel functions should be auto-invoked.
@@ -61,6 +71,10 @@ class FunctionChoiceBehavior(KernelBaseModel):
         | None
     ) = None
     type_: FunctionChoiceType | None = None
+    max_concurrent_function_calls: int | None = Field(default=None, gt=0)
+    function_call_timeout: float | None = Field(default=None, gt=0)
+    function_timeouts: dict[str, float] | None = None
+    run_sync_functions_in_thread: bool = False
 
     @property
     def auto_invoke_kernel_functions(self):
@@ -72,6 +86,12 @@ class FunctionChoiceBehavior(KernelBaseModel):
         """Set the auto_invoke_kernel_functions property."""
         self.maximum_auto_invoke_attempts = DEFAULT_MAX_AUTO_INVOKE_ATTEMPTS if value else 0
 
+    def get_function_call_timeout(self, function_name: str | None) -> float | None:
+        """Get the timeout in seconds for a call to the function with the given fully qualified name."""
+        if self.function_timeouts and function_name in self.function_timeouts:
+            return self.function_timeouts[function_name]
+        return self.function_call_timeout
+
     def _check_and_get_config(
         self,
         kernel: "Kernel",
@@ -81,11 +101,7 @@ class FunctionChoiceBehavior(KernelBaseModel):
         | None = None,
     ) -> "FunctionCallChoiceConfiguration":
         """Check for missing functions and get the function call choice configuration."""
-        from semantic_kernel.connectors.ai.function_call_choice_configuration import FunctionCallChoiceConfiguration
-
-        if filters:
-            return FunctionCallChoiceConfiguration(available_functions=kernel.get_list_of_function_metadata(filters))
-        return FunctionCallChoiceConfiguration(available_functions=kernel.get_full_list_of_function_metadata())
+        return kernel.get_function_call_choice_configuration(filters)
 
     def configure(
         self,
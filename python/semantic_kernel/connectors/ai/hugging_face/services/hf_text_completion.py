@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
@@ -13,7 +14,8 @@ else:
 
 
 import torch
-from transformers import AutoTokenizer, TextIteratorStreamer, pipeline
+from pydantic import Field, PrivateAttr
+from transformers import AutoTokenizer, TextStreamer, pipeline
 
 from semantic_kernel.connectors.ai.hugging_face.hf_prompt_execution_settings import HuggingFacePromptExecutionSettings
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -28,15 +30,38 @@ from semantic_kernel.utils.telemetry.model_diagnostics.decorators import (
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENT_GENERATIONS = 1
+_STREAM_END = object()
+
+
+class _AsyncQueueStreamer(TextStreamer):
+    """Streamer that hands the generated text from the generation thread to an asyncio queue."""
+
+    def __init__(self, tokenizer: Any, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+        super().__init__(tokenizer)
+        self.loop = loop
+        self.queue = queue
+
+    def on_finalized_text(self, text: str, stream_end: bool = False) -> None:
+        if text:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, text)
+
 
 class HuggingFaceTextCompletion(TextCompletionClientBase):
-    """Hugging Face text completion service."""
+    """Hugging Face text completion service.
+
+    Generation runs in a worker thread, at most max_concurrent_generations at the same time,
+    other requests wait in first in, first out order.
+    """
 
     MODEL_PROVIDER_NAME: ClassVar[str] = "huggingface"
 
     task: Literal["summarization", "text-generation", "text2text-generation"]
     device: str
     generator: Any
+    max_concurrent_generations: int = Field(default=DEFAULT_MAX_CONCURRENT_GENERATIONS, gt=0)
+    _tokenizer: Any = PrivateAttr(default=None)
+    _generation_semaphore: asyncio.Semaphore | None = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -105,7 +130,8 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
         assert isinstance(settings, HuggingFacePromptExecutionSettings)  # nosec
 
         try:
-            results = self.generator(prompt, **settings.prepare_settings_dict())
+            async with self._get_generation_semaphore():
+                results = await asyncio.to_thread(self.generator, prompt, **settings.prepare_settings_dict())
         except Exception as e:
             raise ServiceResponseException("Hugging Face completion failed") from e
 
@@ -129,27 +155,55 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
                 "HuggingFace TextIteratorStreamer does not stream multiple responses in a parsable format."
                 " If you need multiple responses, please use the complete method.",
             )
+        semaphore = self._get_generation_semaphore()
+        await semaphore.acquire()
         try:
-            streamer = TextIteratorStreamer(AutoTokenizer.from_pretrained(self.ai_model_id))
-            # See https://github.com/huggingface/transformers/blob/main/src/transformers/generation/streamers.py#L159
-            thread = Thread(
-                target=self.generator, args={prompt}, kwargs=settings.prepare_settings_dict(streamer=streamer)
-            )
-            thread.start()
-
-            for new_text in streamer:
-                yield [
-                    StreamingTextContent(
-                        choice_index=0, inner_content=new_text, text=new_text, ai_model_id=self.ai_model_id
-                    )
-                ]
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+            streamer = _AsyncQueueStreamer(self._get_tokenizer(), loop, queue)
+            generation_kwargs = settings.prepare_settings_dict(streamer=streamer)
+
+            def generate() -> None:
+                # the semaphore is released when the generation is done, even if the caller stopped reading
+                result: Any = _STREAM_END
+                try:
+                    self.generator(prompt, **generation_kwargs)
+                except Exception as e:
+                    result = e
+                finally:
+                    loop.call_soon_threadsafe(semaphore.release)
+                    loop.call_soon_threadsafe(queue.put_nowait, result)
 
-            thread.join()
+            # See https://github.com/huggingface/transformers/blob/main/src/transformers/generation/streamers.py#L159
+            Thread(target=generate, daemon=True).start()
         except Exception as e:
+            semaphore.release()
             raise ServiceResponseException("Hugging Face completion failed") from e
 
+        while (new_text := await queue.get()) is not _STREAM_END:
+            if isinstance(new_text, Exception):
+                raise ServiceResponseException("Hugging Face completion failed") from new_text
+            yield [
+                StreamingTextContent(
+                    choice_index=0, inner_content=new_text, text=new_text, ai_model_id=self.ai_model_id
+                )
+            ]
+
     # endregion
 
+    def _get_tokenizer(self) -> Any:
+        """Get the tokenizer of the pipeline, it is only loaded when the pipeline has none."""
+        if self._tokenizer is None:
+            self._tokenizer = getattr(self.generator, "tokenizer", None) or AutoTokenizer.from_pretrained(
+                self.ai_model_id
+            )
+        return self._tokenizer
+
+    def _get_generation_semaphore(self) -> asyncio.Semaphore:
+        if self._generation_semaphore is None:
+            self._generation_semaphore = asyncio.Semaphore(self.max_concurrent_generations)
+        return self._generation_semaphore
+
     def _create_text_content(self, response: Any, candidate: dict[str, str]) -> TextContent:
         return TextContent(
             inner_content=response,
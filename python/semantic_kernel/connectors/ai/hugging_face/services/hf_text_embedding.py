@@ -1,7 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if sys.version_info >= (3, 12):
@@ -11,6 +14,7 @@ else:
 
 import torch
 from numpy import ndarray
+from pydantic import Field, PrivateAttr
 
 from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.exceptions import ServiceResponseException
@@ -24,13 +28,35 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_MAX_MICRO_BATCH_SIZE = 256
+
+
+@dataclass
+class _MicroBatch:
+    """The requests that are waiting to be encoded together."""
+
+    kwargs: dict[str, Any]
+    requests: list[tuple[list[str], asyncio.Future]] = field(default_factory=list)
+    size: int = 0
+    flush_handle: asyncio.TimerHandle | None = None
+
 
 @experimental
 class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
-    """Hugging Face text embedding service."""
+    """Hugging Face text embedding service.
+
+    The model runs in a worker thread, so it does not block the event loop.
+    Requests that arrive within batch_window seconds of each other, with the same arguments,
+    are encoded together, up to max_batch_size texts.
+    """
 
     device: str
     generator: Any
+    batch_window: float = Field(default=DEFAULT_BATCH_WINDOW, ge=0)
+    max_batch_size: int | None = Field(default=DEFAULT_MAX_MICRO_BATCH_SIZE, gt=0)
+    _executor: ThreadPoolExecutor | None = PrivateAttr(default=None)
+    _micro_batches: dict[Any, _MicroBatch] = PrivateAttr(default_factory=dict)
 
     def __init__(
         self,
@@ -70,7 +96,7 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
     ) -> ndarray:
         try:
             logger.info(f"Generating embeddings for {len(texts)} texts.")
-            return self.generator.encode(sentences=texts, convert_to_numpy=True, **kwargs)
+            return await self._encode(texts, convert_to_numpy=True, **kwargs)
         except Exception as e:
             raise ServiceResponseException("Hugging Face embeddings failed", e) from e
 
@@ -83,6 +109,64 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
     ) -> "list[Tensor] | ndarray | Tensor":
         try:
             logger.info(f"Generating raw embeddings for {len(texts)} texts.")
-            return self.generator.encode(sentences=texts, **kwargs)
+            return await self._encode(texts, **kwargs)
         except Exception as e:
             raise ServiceResponseException("Hugging Face embeddings failed", e) from e
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hf-text-embedding")
+        return self._executor
+
+    async def _encode(self, texts: list[str], **kwargs: Any) -> Any:
+        """Encode the texts in the worker thread, together with the other requests that arrive at the same time."""
+        loop = asyncio.get_running_loop()
+        try:
+            key = tuple(sorted(kwargs.items()))
+            hash(key)
+        except TypeError:
+            # arguments that can not be compared are encoded on their own
+            return await loop.run_in_executor(self._get_executor(), self._encode_batch, texts, kwargs)
+
+        future: asyncio.Future = loop.create_future()
+        micro_batch = self._micro_batches.get(key)
+        if micro_batch is None:
+            micro_batch = self._micro_batches[key] = _MicroBatch(kwargs=kwargs)
+            micro_batch.flush_handle = loop.call_later(self.batch_window, self._flush, key)
+        micro_batch.requests.append((texts, future))
+        micro_batch.size += len(texts)
+        if self.max_batch_size and micro_batch.size >= self.max_batch_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Any) -> None:
+        """Send the waiting requests to the worker thread and set their results once the batch is encoded."""
+        micro_batch = self._micro_batches.pop(key, None)
+        if micro_batch is None:
+            return
+        if micro_batch.flush_handle is not None:
+            micro_batch.flush_handle.cancel()
+        texts = [text for request_texts, _ in micro_batch.requests for text in request_texts]
+        logger.debug(f"Encoding a batch of {len(texts)} texts from {len(micro_batch.requests)} requests.")
+        batch_future = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self._encode_batch, texts, micro_batch.kwargs
+        )
+
+        def set_results(done: asyncio.Future) -> None:
+            error = asyncio.CancelledError() if done.cancelled() else done.exception()
+            if error is not None:
+                for _, future in micro_batch.requests:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            embeddings = done.result()
+            start = 0
+            for request_texts, future in micro_batch.requests:
+                if not future.done():
+                    future.set_result(embeddings[start : start + len(request_texts)])
+                start += len(request_texts)
+
+        batch_future.add_done_callback(set_results)
+
+    def _encode_batch(self, texts: list[str], kwargs: dict[str, Any]) -> Any:
+        return self.generator.encode(sentences=texts, **kwargs)
@@ -1,6 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import asyncio
 import copy
 import logging
 import sys
@@ -107,7 +106,7 @@ class NvidiaTextEmbedding(NvidiaHandler, EmbeddingGeneratorBase):
         Args:
             texts (List[str]): The texts to generate embeddings for.
             settings (NvidiaEmbeddingPromptExecutionSettings): The settings to use for the request.
-            batch_size (int): The batch size to use for the request.
+            batch_size (int): The maximum number of texts per request, defaults to max_batch_size.
             kwargs (Dict[str, Any]): Additional arguments to pass to the request.
         """
         if not settings:
@@ -128,22 +127,14 @@ class NvidiaTextEmbedding(NvidiaHandler, EmbeddingGeneratorBase):
         if settings.truncate is not None:
             settings.extra_body.setdefault("truncate", settings.truncate)
 
-        raw_embeddings = []
-        tasks = []
-
-        batch_size = batch_size or len(texts)
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        async def send_batch(batch: list[str]) -> list[Any]:
             batch_settings = copy.deepcopy(settings)
             batch_settings.input = batch
-            tasks.append(self._send_request(settings=batch_settings))
-
-        results = await asyncio.gather(*tasks)
-        for raw_embedding in results:
+            raw_embedding = await self._send_request(settings=batch_settings)
             assert isinstance(raw_embedding, list)  # nosec
-            raw_embeddings.extend(raw_embedding)
+            return raw_embedding
 
-        return raw_embeddings
+        return await self._send_batches(texts, send_batch, batch_size)
 
     def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
         """Get the request settings class."""
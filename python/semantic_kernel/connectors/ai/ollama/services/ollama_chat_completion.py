@@ -122,7 +122,7 @@ class OllamaChatCompletion(OllamaBase, ChatCompletionClientBase):
         role_key: str = "role",
         content_key: str = "content",
     ) -> list[Message]:
-        return [MESSAGE_CONVERTERS[message.role](message) for message in chat_history.messages]
+        return [message.get_cached_format(MESSAGE_CONVERTERS[message.role]) for message in chat_history.messages]
 
     @override
     def _verify_function_choice_settings(self, settings: "PromptExecutionSettings") -> None:
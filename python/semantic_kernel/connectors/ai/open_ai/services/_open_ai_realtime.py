@@ -106,10 +106,9 @@ def update_settings_from_function_call_configuration(
         and hasattr(settings, "tools")
     ):
         settings.tool_choice = type  # type: ignore
-        settings.tools = [  # type: ignore
-            kernel_function_metadata_to_function_call_format(f)
-            for f in function_choice_configuration.available_functions
-        ]
+        settings.tools = function_choice_configuration.get_tools(  # type: ignore
+            kernel_function_metadata_to_function_call_format
+        )
 
 
 def kernel_function_metadata_to_function_call_format(
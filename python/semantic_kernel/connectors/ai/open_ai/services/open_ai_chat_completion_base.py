@@ -291,16 +291,16 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
         Returns:
             prepared_chat_history (Any): The prepared chat history for a request.
         """
-        return [
-            {
-                **message.to_dict(role_key=role_key, content_key=content_key),
-                role_key: "developer"
-                if self.instruction_role == "developer" and message.to_dict(role_key=role_key)[role_key] == "system"
-                else message.to_dict(role_key=role_key)[role_key],
-            }
+        messages = [
+            message.to_dict(role_key=role_key, content_key=content_key)
             for message in chat_history.messages
             if not isinstance(message, (AnnotationContent, FileReferenceContent))
         ]
+        if self.instruction_role == "developer":
+            for message in messages:
+                if message[role_key] == "system":
+                    message[role_key] = "developer"
+        return messages
 
     # endregion
 
@@ -4,6 +4,7 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 from numpy import array, ndarray
+from pydantic import Field
 
 if sys.version_info >= (3, 12):
     from typing import override  # pragma: no cover
@@ -20,10 +21,18 @@ from semantic_kernel.utils.feature_stage_decorator import experimental
 if TYPE_CHECKING:
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 
+OPENAI_MAX_EMBEDDING_INPUTS = 2048
+
 
 @experimental
 class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
-    """Base class for OpenAI text embedding services."""
+    """Base class for OpenAI text embedding services.
+
+    The embeddings endpoint accepts at most 2048 inputs per request, so the texts are sent in batches of that size
+    by default, the batches are sent concurrently.
+    """
+
+    max_batch_size: int | None = Field(default=OPENAI_MAX_EMBEDDING_INPUTS, gt=0)
 
     @override
     async def generate_embeddings(
@@ -49,7 +58,7 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
         Args:
             texts (List[str]): The texts to generate embeddings for.
             settings (PromptExecutionSettings): The settings to use for the request.
-            batch_size (int): The batch size to use for the request.
+            batch_size (int): The maximum number of texts per request, defaults to max_batch_size.
             kwargs (Dict[str, Any]): Additional arguments to pass to the request.
         """
         if not settings:
@@ -62,15 +71,13 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
             settings.ai_model_id = self.ai_model_id
         for key, value in kwargs.items():
             setattr(settings, key, value)
-        raw_embeddings = []
-        batch_size = batch_size or len(texts)
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            settings.input = batch
-            raw_embedding = await self._send_request(settings=settings)
+
+        async def send_batch(batch: list[str]) -> list[Any]:
+            raw_embedding = await self._send_request(settings=settings.model_copy(update={"input": batch}))
             assert isinstance(raw_embedding, list)  # nosec
-            raw_embeddings.extend(raw_embedding)
-        return raw_embeddings
+            return raw_embedding
+
+        return await self._send_batches(texts, send_batch, batch_size)
 
     def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
         """Get the request settings class."""
@@ -1,9 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
+from copy import copy
 from typing import Annotated, Any, TypeVar
 
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
 from semantic_kernel.connectors.ai.function_choice_behavior import FunctionChoiceBehavior
 from semantic_kernel.kernel_pydantic import KernelBaseModel
@@ -30,12 +31,16 @@ class PromptExecutionSettings(KernelBaseModel):
         prepare_settings_dict: Prepares the settings as a dictionary for sending to the AI service.
         update_from_prompt_execution_settings: Update the keys from another prompt execution settings object.
         from_prompt_execution_settings: Create a prompt execution settings from another prompt execution settings.
+        copy_for_request: Create a copy of the settings for a single request, instead of a deep copy.
     """
 
     service_id: Annotated[str | None, Field(min_length=1)] = None
     extension_data: dict[str, Any] = Field(default_factory=dict)
     function_choice_behavior: Annotated[FunctionChoiceBehavior | None, Field(exclude=True)] = None
 
+    # The conversions to other settings classes, with the state of these settings they were created from
+    _conversions: dict[type, tuple[tuple[Any, ...], "PromptExecutionSettings"]] = PrivateAttr(default_factory=dict)
+
     @model_validator(mode="before")
     @classmethod
     def parse_function_choice_behavior(cls: type[_T], data: Any) -> dict[str, Any]:
@@ -104,6 +109,54 @@ class PromptExecutionSettings(KernelBaseModel):
             function_choice_behavior=config.function_choice_behavior,
         )
 
+    def copy_for_request(self, settings_class: type[_T] | None = None) -> _T:
+        """Create a copy of the settings that a single request can change.
+
+        The copy is shallow, only the dictionaries and lists of the fields are copied, so setting fields of the
+        copy, or changing those dictionaries and lists, does not change these settings. The values inside them
+        are shared, so a request replaces them instead of changing them in place.
+
+        When the settings have to be converted to the settings class of a service, the conversion is cached
+        on these settings and used again as long as they do not change, so every request only copies it.
+
+        Args:
+            settings_class: The settings class of the service, by default the copy has the class of these settings.
+
+        Returns:
+            The copy of the settings, converted to the settings class.
+        """
+        if settings_class is None or isinstance(self, settings_class):
+            return self._copy_shallow()  # type: ignore[return-value]
+        cached = self._conversions.get(settings_class)
+        if cached is None or not self._has_state(cached[0]):
+            converted = settings_class.from_prompt_execution_settings(self)
+            # The conversion packs the extension data, so the state is taken afterwards
+            cached = (self._get_state(), converted)
+            self._conversions[settings_class] = cached
+        return cached[1]._copy_shallow()  # type: ignore[return-value]
+
+    def _copy_shallow(self: _T) -> _T:
+        copied = self.model_copy()
+        for name, value in copied.__dict__.items():
+            if isinstance(value, dict | list):
+                copied.__dict__[name] = copy(value)
+        copied._conversions = {}
+        return copied
+
+    def _get_state(self) -> tuple[Any, ...]:
+        # Copies of the containers, so changing them in place is noticed as well
+        return (
+            frozenset(self.model_fields_set),
+            tuple(copy(value) if isinstance(value, dict | list) else value for value in self.__dict__.values()),
+        )
+
+    def _has_state(self, state: tuple[Any, ...]) -> bool:
+        try:
+            # Values are compared by identity first, so this is only expensive for values that changed
+            return bool(state == self._get_state())
+        except Exception:
+            return False
+
     def unpack_extension_data(self) -> None:
         """Update the prompt execution settings from extension data.
 
@@ -1,6 +1,5 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-import copy
 from abc import ABC
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any
@@ -71,7 +70,7 @@ class TextCompletionClientBase(AIServiceClientBase, ABC):
             list[TextContent]: A string or list of strings representing the response(s) from the LLM.
         """
         # Create a copy of the settings to avoid modifying the original settings
-        settings = copy.deepcopy(settings)
+        settings = settings.copy_for_request()
 
         return await self._inner_get_text_contents(prompt, settings)
 
@@ -106,7 +105,7 @@ class TextCompletionClientBase(AIServiceClientBase, ABC):
             list[StreamingTextContent]: A stream representing the response(s) from the LLM.
         """
         # Create a copy of the settings to avoid modifying the original settings
-        settings = copy.deepcopy(settings)
+        settings = settings.copy_for_request()
 
         async for contents in self._inner_get_streaming_text_contents(prompt, settings):
             yield contents
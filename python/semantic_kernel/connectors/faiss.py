@@ -1,15 +1,26 @@
 # Copyright (c) Microsoft. All rights reserved.
+import asyncio
+import json
 import logging
 import sys
 from collections.abc import MutableMapping, Sequence
+from os import PathLike
+from pathlib import Path
 from typing import Any, Final, Generic
 
 import faiss
 import numpy as np
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
-from semantic_kernel.connectors.in_memory import IN_MEMORY_SCORE_KEY, InMemoryCollection, InMemoryStore, TKey
+from semantic_kernel.connectors.in_memory import (
+    COMPACTION_THRESHOLD,
+    IN_MEMORY_SCORE_KEY,
+    InMemoryCollection,
+    InMemoryStore,
+    TKey,
+    _replace_file,
+)
 from semantic_kernel.data.vector import (
     DistanceFunction,
     IndexKind,
@@ -31,23 +42,45 @@ else:
 
 logger = logging.getLogger(__name__)
 
+FAISS_SNAPSHOT_KEY_MAP_FILE: Final[str] = "faiss_key_map.json"
+
 DISTANCE_FUNCTION_MAP: Final[dict[DistanceFunction, type[faiss.Index]]] = {
     DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE: faiss.IndexFlatL2,
     DistanceFunction.DOT_PROD: faiss.IndexFlatIP,
     DistanceFunction.DEFAULT: faiss.IndexFlatL2,
 }
+METRIC_TYPE_MAP: Final[dict[DistanceFunction, int]] = {
+    DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE: faiss.METRIC_L2,
+    DistanceFunction.DOT_PROD: faiss.METRIC_INNER_PRODUCT,
+    DistanceFunction.DEFAULT: faiss.METRIC_L2,
+}
 INDEX_KIND_MAP: Final[dict[IndexKind, bool]] = {
     IndexKind.FLAT: True,
+    IndexKind.HNSW: True,
+    IndexKind.IVF_FLAT: True,
     IndexKind.DEFAULT: True,
 }
+DEFAULT_HNSW_M: Final[int] = 32
+DEFAULT_IVF_NLIST: Final[int] = 100
+# faiss warns when there are less than 39 training points per IVF cluster
+TRAINING_POINTS_PER_CLUSTER: Final[int] = 39
 
 
-def _create_index(field: VectorStoreField) -> faiss.Index:
-    """Create a Faiss index."""
+def _create_index(
+    field: VectorStoreField, hnsw_m: int = DEFAULT_HNSW_M, ivf_nlist: int = DEFAULT_IVF_NLIST
+) -> faiss.Index:
+    """Create a Faiss index.
+
+    Args:
+        field: The vector field to create the index for.
+        hnsw_m: The number of neighbors per node for HNSW indexes.
+        ivf_nlist: The number of clusters for IVF indexes.
+    """
     if field.index_kind not in INDEX_KIND_MAP:
         raise VectorStoreInitializationException(f"Index kind {field.index_kind} is not supported.")
     if field.distance_function not in DISTANCE_FUNCTION_MAP:
         raise VectorStoreInitializationException(f"Distance function {field.distance_function} is not supported.")
+    metric_type = METRIC_TYPE_MAP[field.distance_function]  # type: ignore[index]
     match field.index_kind:
         case IndexKind.FLAT | IndexKind.DEFAULT:
             match field.distance_function:
@@ -60,19 +93,95 @@ def _create_index(field: VectorStoreField) -> faiss.Index:
                         f"Distance function {field.distance_function} is "
                         f"not supported for index kind {field.index_kind}."
                     )
+        case IndexKind.HNSW:
+            return faiss.IndexHNSWFlat(field.dimensions, hnsw_m, metric_type)
+        case IndexKind.IVF_FLAT:
+            quantizer = faiss.IndexFlat(field.dimensions, metric_type)
+            return faiss.IndexIVFFlat(quantizer, field.dimensions, ivf_nlist, metric_type)
         case _:
             raise VectorStoreInitializationException(f"Index with {field.index_kind} is not supported.")
 
 
+def _train_and_add(index: faiss.Index, vectors: np.ndarray, ids: np.ndarray) -> None:
+    """Train the index on the vectors and add them."""
+    index.train(vectors)
+    index.add_with_ids(vectors, ids)
+
+
+def _rebuild_index(index: faiss.Index, vectors: np.ndarray, ids: np.ndarray) -> faiss.Index:
+    """Create a new index like the given one, with only the given vectors and ids."""
+    new_index = faiss.clone_index(index)
+    new_index.reset()
+    if len(ids):
+        new_index.add_with_ids(vectors, ids)
+    return new_index
+
+
+def _inner_index(index: faiss.Index) -> faiss.Index:
+    """Get the index that is wrapped by an id map, or the index itself."""
+    return faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap) else index
+
+
+def _supports_removal(index: faiss.Index) -> bool:
+    """Whether ids can be removed from the index without breaking the ids of the other vectors.
+
+    An id map renumbers its vectors after a removal, which only matches indexes that store their vectors in order.
+    The lists of an IVF index keep their own order, so removing from an id map around it mixes up the ids.
+    """
+    return not isinstance(index, faiss.IndexIDMap) or isinstance(_inner_index(index), faiss.IndexFlatCodes)
+
+
+def _create_search_parameters(
+    index: faiss.Index, selector: faiss.IDSelector | None, nprobe: int | None = None, ef_search: int | None = None
+) -> faiss.SearchParameters | None:
+    """Create the search parameters to restrict a search to the selected ids and to tune approximate indexes.
+
+    Args:
+        index: The index that will be searched.
+        selector: The selector for the ids to search, None to search all ids.
+        nprobe: The number of clusters to visit, used for IVF indexes.
+        ef_search: The size of the candidate list, used for HNSW indexes.
+    """
+    if selector is None and not nprobe and not ef_search:
+        return None
+    inner_index = _inner_index(index)
+    parameters: dict[str, Any] = {"sel": selector} if selector is not None else {}
+    # IVF and HNSW indexes only accept their own parameter types, which override the settings of the index
+    if isinstance(inner_index, faiss.IndexIVF):
+        return faiss.SearchParametersIVF(nprobe=nprobe or inner_index.nprobe, **parameters)
+    if isinstance(inner_index, faiss.IndexHNSW):
+        return faiss.SearchParametersHNSW(efSearch=ef_search or inner_index.hnsw.efSearch, **parameters)
+    if selector is None:
+        return None
+    return faiss.SearchParameters(**parameters)
+
+
 class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
     """Create a Faiss collection.
 
     The Faiss Collection builds on the InMemoryVectorCollection,
     it maintains indexes and mappings for each vector field.
+    Each record gets a stable 64-bit id in the indexes, which is kept when the record is updated.
+
+    Indexes that need training, such as IVF indexes, are trained automatically once `training_size`
+    vectors have been upserted, until then those vectors are kept and searched in a flat staging index.
     """
 
     indexes: MutableMapping[str, faiss.Index] = Field(default_factory=dict)
     indexes_key_map: MutableMapping[str, MutableMapping[TKey, int]] = Field(default_factory=dict)
+    hnsw_m: int = DEFAULT_HNSW_M
+    ivf_nlist: int = DEFAULT_IVF_NLIST
+    training_size: int | None = None
+    nprobe: int | None = None
+    ef_search: int | None = None
+    _staging_indexes: dict[str, faiss.Index] = PrivateAttr(default_factory=dict)
+    _id_key_maps: dict[str, dict[int, TKey]] = PrivateAttr(default_factory=dict)
+    _deleted_ids: dict[str, set[int]] = PrivateAttr(default_factory=dict)
+    _non_removable_fields: set[str] = PrivateAttr(default_factory=set)
+    _next_id: int = PrivateAttr(default=0)
+    _index_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+    # Memory-mapped indexes, such as IVF indexes with on-disk inverted lists, cannot be changed
+    _read_only: bool = PrivateAttr(default=False)
 
     def __init__(
         self,
@@ -94,12 +203,22 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
 
         or you can manually add them to the indexes field of the collection.
 
+        Vector fields with index kind HNSW or IVF_FLAT get approximate indexes,
+        these can be tuned with the hnsw_m and ivf_nlist arguments, and per search
+        by passing `nprobe` (IVF) or `ef_search` (HNSW) to the search method.
+
         Args:
             collection_name: The name of the collection.
             record_type: The type of the data model.
             definition: The definition of the data model.
             embedding_generator: The embedding generator.
-            kwargs: Additional arguments.
+            kwargs: Additional arguments, such as:
+                hnsw_m: The number of neighbors per node for HNSW indexes.
+                ivf_nlist: The number of clusters for IVF indexes.
+                training_size: The number of vectors to collect before training an index that needs training,
+                    defaults to 39 times ivf_nlist.
+                nprobe: The default number of clusters to visit when searching IVF indexes.
+                ef_search: The default size of the candidate list when searching HNSW indexes.
         """
         super().__init__(
             record_type=record_type,
@@ -119,9 +238,7 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
         if len(self.definition.vector_fields) == 1 and index is not None:
             if not isinstance(index, faiss.Index):
                 raise VectorStoreInitializationException("Index must be a subtype of faiss.Index")
-            if not index.is_trained:
-                raise VectorStoreInitializationException("Index must be trained before using.")
-            self.indexes[self.definition.vector_fields[0].name] = index
+            self._set_index(self.definition.vector_fields[0].name, index)
             return
         for vector_field in self.definition.vector_fields:
             if indexes and vector_field.name in indexes:
@@ -129,18 +246,73 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
                     raise VectorStoreInitializationException(
                         f"Index for {vector_field.name} must be a subtype of faiss.Index"
                     )
-                if not indexes[vector_field.name].is_trained:
-                    raise VectorStoreInitializationException(
-                        f"Index for {vector_field.name} must be trained before using."
-                    )
-                self.indexes[vector_field.name] = indexes[vector_field.name]
-                if vector_field.name not in self.indexes_key_map:
-                    self.indexes_key_map.setdefault(vector_field.name, {})
+                self._set_index(vector_field.name, indexes[vector_field.name])
                 continue
             if vector_field.name not in self.indexes:
-                self.indexes[vector_field.name] = _create_index(vector_field)
-            if vector_field.name not in self.indexes_key_map:
-                self.indexes_key_map.setdefault(vector_field.name, {})
+                self._set_index(vector_field.name, self._create_index(vector_field))
+            else:
+                self._set_index(vector_field.name, self.indexes[vector_field.name])
+
+    def _create_index(self, vector_field: VectorStoreField) -> faiss.Index:
+        """Create the index for a vector field, using the settings of the collection."""
+        return _create_index(vector_field, hnsw_m=self.hnsw_m, ivf_nlist=self.ivf_nlist)
+
+    def _get_active_index(self, field_name: str) -> faiss.Index:
+        """Get the index that holds the vectors of a field, this is the staging index until the index is trained."""
+        return self._staging_indexes.get(field_name, self.indexes[field_name])
+
+    def _set_index(self, field_name: str, index: faiss.Index) -> None:
+        """Set the index for a field, wrapping it in a IndexIDMap2 so that records get stable ids."""
+        if not isinstance(index, faiss.IndexIDMap):
+            if index.ntotal > 0:
+                raise VectorStoreInitializationException(
+                    f"Index for {field_name} must be empty or an IndexIDMap, so that vectors can be mapped to records."
+                )
+            index = faiss.IndexIDMap2(index)
+        self.indexes[field_name] = index
+        self.indexes_key_map.setdefault(field_name, {})
+        self._id_key_maps[field_name] = {faiss_id: key for key, faiss_id in self.indexes_key_map[field_name].items()}
+        self._deleted_ids.setdefault(field_name, set())
+
+    def _get_ids(self, field_name: str, keys: Sequence[TKey]) -> list[int]:
+        """Get the stable ids for the keys, reusing the ids of existing keys.
+
+        Indexes that do not support removal get new ids for existing keys,
+        the old ids are marked as deleted until the index is rebuilt.
+        """
+        ids: list[int] = []
+        key_map = self.indexes_key_map[field_name]
+        reuse_ids = field_name in self._staging_indexes or field_name not in self._non_removable_fields
+        for key in keys:
+            if key in key_map and reuse_ids:
+                ids.append(key_map[key])
+                continue
+            if key in key_map:
+                self._deleted_ids[field_name].add(key_map[key])
+                self._id_key_maps[field_name].pop(key_map[key], None)
+            ids.append(self._next_id)
+            self._next_id += 1
+        return ids
+
+    def _remove_ids(self, field_name: str, ids: Sequence[int]) -> None:
+        """Remove the ids from the index in one batch, or mark them as deleted when the index does not support that."""
+        if not ids:
+            return
+        if field_name in self._staging_indexes:
+            self._staging_indexes[field_name].remove_ids(np.array(ids, dtype=np.int64))
+            return
+        if field_name not in self._non_removable_fields and not _supports_removal(self.indexes[field_name]):
+            self._non_removable_fields.add(field_name)
+        if field_name not in self._non_removable_fields:
+            try:
+                self.indexes[field_name].remove_ids(np.array(ids, dtype=np.int64))
+                return
+            except RuntimeError:
+                logger.info(
+                    f"Index for {field_name} does not support removal, deleted vectors are skipped until it is rebuilt."
+                )
+                self._non_removable_fields.add(field_name)
+        self._deleted_ids[field_name].update(ids)
 
     @override
     async def ensure_collection_exists(
@@ -152,6 +324,7 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
         For more advanced scenario's you can create your own indexes and pass them in here.
         This includes indexes that need training, or GPU-based indexes, since you would also
         need to build the faiss package for use with GPU's yourself.
+        Indexes are wrapped in a IndexIDMap2 when they are not already a IndexIDMap.
 
         Args:
             index: The index to use, this can be used when there is only one vector field.
@@ -162,33 +335,132 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
 
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[TKey]:
-        """Upsert records."""
-        for vector_field in self.definition.vector_fields:
-            vectors_to_add = [record.get(vector_field.storage_name or vector_field.name) for record in records]
-            vectors = np.array(vectors_to_add, dtype=np.float32)
-            if not self.indexes[vector_field.name].is_trained:
-                raise VectorStoreOperationException(
-                    f"This index (of type {type(self.indexes[vector_field.name])}) requires training, "
-                    "which is not supported. To train the index, "
-                    f"use <collection>.indexes[{vector_field.name}].train, "
-                    "see faiss docs for more details."
+        """Upsert records.
+
+        Records with an existing key replace the vector in the index under the same id,
+        for indexes that do not support removal the old vector is skipped in searches instead.
+        When an index needs training, the vectors are added to a staging index,
+        once that has `training_size` vectors the index is trained with them.
+        """
+        self._check_writable()
+        # A key that is in the batch more than once gets a single id with its last vector, like the records
+        indexed_records = list({record[self.definition.key_field.name]: record for record in records}.values())
+        keys = [record[self.definition.key_field.name] for record in indexed_records]
+        async with self._index_lock:
+            for vector_field in self.definition.vector_fields:
+                if vector_field.name not in self.indexes:
+                    self._set_index(vector_field.name, self._create_index(vector_field))
+                index = self.indexes[vector_field.name]
+                if not index.is_trained and vector_field.name not in self._staging_indexes:
+                    self._staging_indexes[vector_field.name] = faiss.IndexIDMap2(
+                        faiss.IndexFlat(index.d, index.metric_type)
+                    )
+                vectors = np.array(
+                    [record.get(vector_field.storage_name or vector_field.name) for record in indexed_records],
+                    dtype=np.float32,
                 )
-            self.indexes[vector_field.name].add(vectors)  # type: ignore
-            start = len(self.indexes_key_map[vector_field.name])
-            for i, record in enumerate(records):
-                key = record[self.definition.key_field.name]
-                self.indexes_key_map[vector_field.name][key] = start + i
-        return await super()._inner_upsert(records, **kwargs)
+                key_map = self.indexes_key_map[vector_field.name]
+                self._remove_ids(vector_field.name, [key_map[key] for key in keys if key in key_map])
+                ids = self._get_ids(vector_field.name, keys)
+                self._get_active_index(vector_field.name).add_with_ids(vectors, np.array(ids, dtype=np.int64))
+                for key, faiss_id in zip(keys, ids):
+                    key_map[key] = faiss_id
+                    self._id_key_maps[vector_field.name][faiss_id] = key
+                staging_index = self._staging_indexes.get(vector_field.name)
+                if staging_index is not None and staging_index.ntotal >= (
+                    self.training_size or TRAINING_POINTS_PER_CLUSTER * self.ivf_nlist
+                ):
+                    await self._train_index(vector_field.name)
+            result = await super()._inner_upsert(records, **kwargs)
+        await self._compact_if_needed()
+        return result
 
     @override
     async def _inner_delete(self, keys: Sequence[TKey], **kwargs: Any) -> None:
-        for key in keys:
+        self._check_writable()
+        async with self._index_lock:
             for vector_field in self.definition.vector_field_names:
-                if key in self.indexes_key_map[vector_field]:
-                    vector_index = self.indexes_key_map[vector_field][key]
-                    self.indexes[vector_field].remove_ids(np.array([vector_index]))
-                    self.indexes_key_map[vector_field].pop(key, None)
-        await super()._inner_delete(keys, **kwargs)
+                if vector_field not in self.indexes_key_map:
+                    continue
+                key_map = self.indexes_key_map[vector_field]
+                ids = [key_map.pop(key) for key in keys if key in key_map]
+                self._remove_ids(vector_field, ids)
+                for faiss_id in ids:
+                    self._id_key_maps[vector_field].pop(faiss_id, None)
+            await super()._inner_delete(keys, **kwargs)
+        await self._compact_if_needed()
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise VectorStoreOperationException(
+                f"Collection {self.collection_name} was loaded with memory-mapped indexes and cannot be changed, "
+                "load the snapshot with mmap_indexes=False to change it."
+            )
+
+    async def train(self, field_name: str | None = None) -> None:
+        """Train the indexes that need training, with the vectors that were upserted so far.
+
+        This is done automatically once `training_size` vectors have been upserted,
+        use this when the collection is complete before that.
+
+        Args:
+            field_name: The vector field to train the index for, all vector fields when None.
+        """
+        self._check_writable()
+        async with self._index_lock:
+            for name in list(self._staging_indexes):
+                if not field_name or name == field_name:
+                    await self._train_index(name)
+
+    async def _train_index(self, field_name: str) -> None:
+        """Train the index of a field in a worker thread, with the vectors of the staging index, and add them."""
+        staging_index = self._staging_indexes[field_name]
+        vectors = staging_index.index.reconstruct_n(0, staging_index.ntotal)
+        ids = faiss.vector_to_array(staging_index.id_map)
+        try:
+            await asyncio.to_thread(_train_and_add, self.indexes[field_name], vectors, ids)
+        except RuntimeError as exc:
+            raise VectorStoreOperationException(
+                f"Training the index for {field_name} with {len(ids)} vectors failed: {exc}"
+            ) from exc
+        del self._staging_indexes[field_name]
+
+    async def _compact_if_needed(self) -> None:
+        """Rebuild the indexes where deleted vectors make up a large part of the index."""
+        for field_name, deleted_ids in self._deleted_ids.items():
+            index = self.indexes.get(field_name)
+            if index is not None and deleted_ids and len(deleted_ids) >= COMPACTION_THRESHOLD * index.ntotal:
+                await self.compact(field_name)
+
+    async def compact(self, field_name: str | None = None) -> None:
+        """Rebuild indexes without the vectors that were deleted or replaced.
+
+        This is only needed for indexes that do not support removing vectors, such as HNSW,
+        it is done automatically when the deleted vectors make up a quarter of the index.
+        The new index is built in a worker thread from the vectors of the stored records,
+        using the same ids, upserts and deletes wait until it is done.
+
+        Args:
+            field_name: The vector field to rebuild the index for, all vector fields when None.
+        """
+        self._check_writable()
+        async with self._index_lock:
+            for vector_field in self.definition.vector_fields:
+                if (field_name and vector_field.name != field_name) or vector_field.name not in self.indexes:
+                    continue
+                if vector_field.name in self._staging_indexes:
+                    continue
+                if not self._deleted_ids[vector_field.name]:
+                    continue
+                key_map = self.indexes_key_map[vector_field.name]
+                storage_name = vector_field.storage_name or vector_field.name
+                keys = list(key_map.keys())
+                vectors = np.array([self.inner_storage[key][storage_name] for key in keys], dtype=np.float32)
+                ids = np.array([key_map[key] for key in keys], dtype=np.int64)
+                self.indexes[vector_field.name] = await asyncio.to_thread(
+                    _rebuild_index, self.indexes[vector_field.name], vectors, ids
+                )
+                self._deleted_ids[vector_field.name] = set()
 
     @override
     async def ensure_collection_deleted(self, **kwargs: Any) -> None:
@@ -197,12 +469,93 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
                 del self.indexes[vector_field]
             if vector_field in self.indexes_key_map:
                 del self.indexes_key_map[vector_field]
+            self._id_key_maps.pop(vector_field, None)
+            self._deleted_ids.pop(vector_field, None)
+            self._staging_indexes.pop(vector_field, None)
+        self._read_only = False
         await super().ensure_collection_deleted(**kwargs)
 
     @override
     async def collection_exists(self, **kwargs: Any) -> bool:
         return bool(self.indexes)
 
+    @override
+    async def save_snapshot(self, path: str | PathLike) -> None:
+        """Save the collection to a snapshot directory.
+
+        Next to the records and vectors, the Faiss index of each vector field is written
+        using the native Faiss serialization, together with the key to id map.
+
+        Args:
+            path: The directory to write the snapshot to, it is created when it does not exist.
+        """
+        await super().save_snapshot(path)
+        directory = Path(path)
+        index_files = {f"{name}.faiss": index for name, index in self.indexes.items()}
+        index_files.update({f"{name}.staging.faiss": index for name, index in self._staging_indexes.items()})
+        try:
+            # The files are replaced, not rewritten, as the indexes can be memory-mapped from them
+            for file_name, index in index_files.items():
+                data = faiss.serialize_index(index)
+                _replace_file(directory / file_name, lambda file: file.write(data))
+        except RuntimeError as exc:
+            raise VectorStoreOperationException(f"Faiss indexes could not be written to the snapshot: {exc}") from exc
+        key_maps = {
+            "next_id": self._next_id,
+            "key_maps": {name: list(key_map.items()) for name, key_map in self.indexes_key_map.items()},
+            "deleted_ids": {name: sorted(ids) for name, ids in self._deleted_ids.items()},
+            "non_removable_fields": sorted(self._non_removable_fields),
+        }
+        _replace_file(directory / FAISS_SNAPSHOT_KEY_MAP_FILE, lambda file: json.dump(key_maps, file), binary=False)
+
+    @override
+    async def load_snapshot(self, path: str | PathLike, mmap: bool = True, mmap_indexes: bool = False) -> None:
+        """Replace the contents of the collection with a snapshot created by `save_snapshot`.
+
+        The Faiss indexes are read into memory, unless mmap_indexes is True. Memory-mapped indexes,
+        such as IVF indexes with their inverted lists on disk, cannot be changed, so a collection
+        loaded with mmap_indexes is read-only, until it is deleted or another snapshot is loaded.
+
+        Args:
+            path: The snapshot directory.
+            mmap: Whether to memory-map the vectors instead of reading them into memory.
+            mmap_indexes: Whether to memory-map the Faiss indexes, for the index types that support it.
+        """
+        directory = Path(path)
+        # The indexes are read before the records are replaced, so a bad snapshot leaves the collection as it is
+        indexes: dict[str, faiss.Index] = {}
+        staging_indexes: dict[str, faiss.Index] = {}
+        try:
+            with open(directory / FAISS_SNAPSHOT_KEY_MAP_FILE, encoding="utf-8") as file:
+                snapshot = json.load(file)
+            next_id = snapshot["next_id"]
+            non_removable_fields = set(snapshot["non_removable_fields"])
+            key_maps = {
+                field_name: dict(snapshot["key_maps"].get(field_name, []))
+                for field_name in self.definition.vector_field_names
+            }
+            deleted_ids = {
+                field_name: set(snapshot["deleted_ids"].get(field_name, []))
+                for field_name in self.definition.vector_field_names
+            }
+            for field_name in self.definition.vector_field_names:
+                indexes[field_name] = faiss.read_index(
+                    str(directory / f"{field_name}.faiss"), faiss.IO_FLAG_MMAP if mmap_indexes else 0
+                )
+                if (staging_file := directory / f"{field_name}.staging.faiss").exists():
+                    staging_indexes[field_name] = faiss.read_index(str(staging_file))
+        except (OSError, RuntimeError, KeyError, json.JSONDecodeError) as exc:
+            raise VectorStoreOperationException(f"Faiss snapshot at '{directory}' could not be read: {exc}") from exc
+        await super().load_snapshot(path, mmap=mmap)
+        self._next_id = next_id
+        self._non_removable_fields = non_removable_fields
+        for field_name, index in indexes.items():
+            self.indexes_key_map[field_name] = key_maps[field_name]
+            self._set_index(field_name, index)
+            self._deleted_ids[field_name] = deleted_ids[field_name]
+        self._staging_indexes.update(staging_indexes)
+        self._read_only = mmap_indexes
+
     @override
     async def _inner_search(
         self,
@@ -212,7 +565,11 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
         vector: Sequence[float | int] | None = None,
         **kwargs: Any,
     ) -> KernelSearchResults[VectorSearchResult[TModel]]:
-        """Inner search method."""
+        """Inner search method.
+
+        For approximate indexes, `nprobe` (IVF) and `ef_search` (HNSW) can be passed as keyword arguments
+        or set on the options, to trade recall for latency on a single search.
+        """
         if not vector:
             vector = await self._generate_vector_from_values(values, options)
         field = self.definition.try_get_vector_field(options.vector_property_name)
@@ -220,30 +577,42 @@ class FaissCollection(InMemoryCollection[TKey, TModel], Generic[TKey, TModel]):
             raise VectorStoreModelException(
                 f"Vector field '{options.vector_property_name}' not found in the data model definition."
             )
+        index = self._get_active_index(field.name)
+        key_map = self.indexes_key_map[field.name]
+        id_key_map = self._id_key_maps[field.name]
+        deleted_ids = self._deleted_ids[field.name] if field.name not in self._staging_indexes else set()
+        # only the ids of the records that match the filters, or that were not deleted, are searched
+        if options.filter:
+            candidate_ids = [key_map[key] for key in self._get_filtered_records(options) if key in key_map]
+            selector = faiss.IDSelectorBatch(np.array(candidate_ids, dtype=np.int64))
+        elif deleted_ids:
+            candidate_ids = list(id_key_map)
+            selector = faiss.IDSelectorNot(faiss.IDSelectorBatch(np.array(list(deleted_ids), dtype=np.int64)))
+        else:
+            candidate_ids = list(id_key_map)
+            selector = None
+        search_parameters = _create_search_parameters(
+            index,
+            selector,
+            nprobe=kwargs.get("nprobe", getattr(options, "nprobe", None)) or self.nprobe,
+            ef_search=kwargs.get("ef_search", getattr(options, "ef_search", None)) or self.ef_search,
+        )
         return_list = []
-        # first we create the vector to search with
-        np_vector = np.array(vector, dtype=np.float32).reshape(1, -1)
-        # then do the actual vector search
-        distances, indexes = self.indexes[field.name].search(
-            np_vector, min(options.top, self.indexes[field.name].ntotal)
-        )  # type: ignore[call-arg]
-        # since Faiss indexes do not contain the full records,
-        # we get the filtered records, this is a dict of the records that match the search filters
-        # and use that to get the actual records
-        filtered_records = self._get_filtered_records(options)
-        # we then iterate through the results, the order is the order of relevance
-        # (less or most distance, dependant on distance metric used)
-        for i, index in enumerate(indexes[0]):
-            key = list(self.indexes_key_map[field.name].keys())[index]
-            # if the key is not in the filtered records, we ignore it
-            if key not in filtered_records:
-                continue
-            filtered_records[key][IN_MEMORY_SCORE_KEY] = distances[0][i]
-            # so we return the list in the order of the search, with the record from the inner_storage.
-            return_list.append(filtered_records[key])
+        count = min(options.skip + options.top, len(candidate_ids))
+        if count > 0:
+            # first we create the vector to search with
+            np_vector = np.array(vector, dtype=np.float32).reshape(1, -1)
+            # then do the actual vector search, the order is the order of relevance
+            distances, ids = index.search(np_vector, count, params=search_parameters)  # type: ignore[call-arg]
+            for distance, faiss_id in list(zip(distances[0], ids[0]))[options.skip :]:
+                if faiss_id < 0 or (key := id_key_map.get(int(faiss_id))) is None:
+                    continue
+                record = self.inner_storage[key]
+                record[IN_MEMORY_SCORE_KEY] = float(distance)
+                return_list.append(record)
         return KernelSearchResults(
             results=self._get_vector_search_results_from_results(return_list, options),
-            total_count=len(return_list) if options and options.include_total_count else None,
+            total_count=len(candidate_ids) if options and options.include_total_count else None,
         )
 
 
@@ -1,12 +1,23 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import ast
+import json
+import operator
+import os
 import sys
-from collections.abc import AsyncIterable, Callable, Sequence
-from typing import Any, ClassVar, Final, Generic, TypeVar
-
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import AsyncIterable, Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, field
+from inspect import getsource
+from os import PathLike
+from pathlib import Path
+from typing import IO, Any, ClassVar, Final, Generic, TypeVar
+
+import numpy as np
 from numpy import dot
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from scipy.spatial.distance import cityblock, cosine, euclidean, hamming, sqeuclidean
 from typing_extensions import override
 
@@ -16,6 +27,7 @@ from semantic_kernel.data.vector import (
     DistanceFunction,
     GetFilteredRecordOptions,
     KernelSearchResults,
+    LambdaVisitor,
     SearchType,
     TModel,
     VectorSearch,
@@ -24,6 +36,7 @@ from semantic_kernel.data.vector import (
     VectorStore,
     VectorStoreCollection,
     VectorStoreCollectionDefinition,
+    VectorStoreField,
 )
 from semantic_kernel.exceptions import VectorSearchExecutionException, VectorStoreModelValidationError
 from semantic_kernel.exceptions.vector_store_exceptions import VectorStoreModelException, VectorStoreOperationException
@@ -51,6 +64,26 @@ DISTANCE_FUNCTION_MAP: Final[dict[DistanceFunction | str, Callable[..., Any]]] =
 }
 
 
+# the number of rows scored at once for distance functions that cannot be expressed as a matrix product
+SCORING_CHUNK_SIZE: Final[int] = 8192
+# when at least this fraction of the rows of a matrix are tombstones, the matrix is compacted
+COMPACTION_THRESHOLD: Final[float] = 0.25
+SNAPSHOT_FORMAT_VERSION: Final[int] = 1
+SNAPSHOT_MANIFEST_FILE: Final[str] = "manifest.json"
+SNAPSHOT_RECORDS_FILE: Final[str] = "records.json"
+# the number of compiled filters that are kept per collection
+FILTER_CACHE_SIZE: Final[int] = 256
+INDEX_OPERATORS: Final[dict[type[ast.cmpop], str]] = {
+    ast.Eq: "eq",
+    ast.In: "in",
+    ast.Lt: "lt",
+    ast.LtE: "le",
+    ast.Gt: "gt",
+    ast.GtE: "ge",
+}
+# used when the field is on the right side of the comparison, i.e. `1 < x.field`
+REVERSED_INDEX_OPERATORS: Final[dict[str, str]] = {"eq": "eq", "lt": "gt", "le": "ge", "gt": "lt", "ge": "le"}
+
 TAKey = TypeVar("TAKey", bound=str)
 TAValue = TypeVar("TAValue", bound=str | int | float | list[float] | None)
 
@@ -81,6 +114,325 @@ class AttributeDict(dict[TAKey, TAValue], Generic[TAKey, TAValue]):
             raise AttributeError(name)
 
 
+class VectorMatrix:
+    """Columnar storage for a single vector field.
+
+    The vectors are kept in a contiguous float32 matrix, with a key to row mapping,
+    deleted or replaced rows are marked as tombstones and reclaimed by compacting the matrix
+    once enough of them have accumulated.
+    Scoring is done for all (or a subset of) the rows at once.
+    """
+
+    def __init__(self, dimensions: int, initial_capacity: int = 1024) -> None:
+        """Create a vector matrix.
+
+        Args:
+            dimensions: The number of dimensions of the vectors.
+            initial_capacity: The number of rows to allocate up front.
+        """
+        self.dimensions = dimensions
+        self.vectors: np.ndarray = np.empty((initial_capacity, dimensions), dtype=np.float32)
+        self.squared_norms: np.ndarray = np.empty(initial_capacity, dtype=np.float32)
+        self.alive: np.ndarray = np.zeros(initial_capacity, dtype=bool)
+        self.row_keys: list[Any] = []
+        self.key_to_row: dict[Any, int] = {}
+
+    @classmethod
+    def from_arrays(
+        cls, keys: Sequence[Any], vectors: np.ndarray, squared_norms: np.ndarray | None = None
+    ) -> "VectorMatrix":
+        """Create a vector matrix that uses the given arrays, without copying them.
+
+        This is used to open a snapshot, the arrays can be memory-mapped,
+        new rows are added to a copy of the arrays once they are full.
+        """
+        matrix = cls(dimensions=vectors.shape[1], initial_capacity=0)
+        matrix.vectors = vectors
+        matrix.squared_norms = squared_norms if squared_norms is not None else np.einsum("ij,ij->i", vectors, vectors)
+        matrix.alive = np.ones(len(keys), dtype=bool)
+        matrix.row_keys = list(keys)
+        matrix.key_to_row = {key: row for row, key in enumerate(matrix.row_keys)}
+        return matrix
+
+    def __len__(self) -> int:
+        """The number of live rows."""
+        return len(self.key_to_row)
+
+    @property
+    def size(self) -> int:
+        """The number of used rows, including tombstones."""
+        return len(self.row_keys)
+
+    def _ensure_capacity(self, required: int) -> None:
+        capacity = self.vectors.shape[0]
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2)
+        vectors = np.empty((new_capacity, self.dimensions), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        squared_norms = np.empty(new_capacity, dtype=np.float32)
+        squared_norms[: self.size] = self.squared_norms[: self.size]
+        alive = np.zeros(new_capacity, dtype=bool)
+        alive[: self.size] = self.alive[: self.size]
+        self.vectors, self.squared_norms, self.alive = vectors, squared_norms, alive
+
+    def as_batch(self, vectors: Sequence[Sequence[float | int]]) -> np.ndarray:
+        """Convert the vectors to a float32 matrix, checking that they have the dimensions of this matrix.
+
+        Raises:
+            VectorStoreOperationException: If the vectors do not have the dimensions of this matrix.
+        """
+        try:
+            batch = np.asarray(vectors, dtype=np.float32)
+        except ValueError as exc:
+            raise VectorStoreOperationException(f"Vectors must have {self.dimensions} dimensions: {exc}") from exc
+        if batch.ndim != 2 or batch.shape[1] != self.dimensions:
+            raise VectorStoreOperationException(
+                f"Vectors must have {self.dimensions} dimensions, got an array of shape {batch.shape}."
+            )
+        return batch
+
+    def upsert(self, keys: Sequence[Any], vectors: Sequence[Sequence[float | int]]) -> None:
+        """Add or replace the vectors for the given keys.
+
+        Replaced vectors are tombstoned and the new vector is appended,
+        so existing rows never change while a search might be using them.
+        """
+        if not keys:
+            return
+        # A key that is in the batch more than once gets its last vector, like the records in the collection
+        positions = {key: position for position, key in enumerate(keys)}
+        if len(positions) < len(keys):
+            keys = list(positions)
+            vectors = [vectors[position] for position in positions.values()]
+        batch = self.as_batch(vectors)
+        self.delete(keys, compact=False)
+        start = self.size
+        self._ensure_capacity(start + len(keys))
+        self.vectors[start : start + len(keys)] = batch
+        self.squared_norms[start : start + len(keys)] = np.einsum("ij,ij->i", batch, batch)
+        self.alive[start : start + len(keys)] = True
+        for offset, key in enumerate(keys):
+            self.key_to_row[key] = start + offset
+            self.row_keys.append(key)
+        self._maybe_compact()
+
+    def delete(self, keys: Sequence[Any], compact: bool = True) -> None:
+        """Tombstone the rows for the given keys."""
+        for key in keys:
+            row = self.key_to_row.pop(key, None)
+            if row is not None:
+                self.alive[row] = False
+        if compact:
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self.size and (self.size - len(self)) / self.size >= COMPACTION_THRESHOLD:
+            self.compact()
+
+    def compact(self) -> None:
+        """Remove all tombstones, keeping the order of the live rows."""
+        rows = np.flatnonzero(self.alive[: self.size])
+        count = len(rows)
+        # new arrays are allocated, so that views on the old rows (for instance from a snapshot) stay valid
+        capacity = max(self.vectors.shape[0], 1)
+        vectors = np.empty((capacity, self.dimensions), dtype=np.float32)
+        vectors[:count] = self.vectors[rows]
+        squared_norms = np.empty(capacity, dtype=np.float32)
+        squared_norms[:count] = self.squared_norms[rows]
+        self.vectors, self.squared_norms = vectors, squared_norms
+        self.alive[:count] = True
+        self.alive[count:] = False
+        self.row_keys = [self.row_keys[row] for row in rows]
+        self.key_to_row = {key: row for row, key in enumerate(self.row_keys)}
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.alive[:] = False
+        self.row_keys = []
+        self.key_to_row = {}
+
+    def rows_for_keys(self, keys: Iterable[Any]) -> np.ndarray:
+        """Get the rows for the given keys, keys without a vector are skipped."""
+        return np.fromiter((row for key in keys if (row := self.key_to_row.get(key)) is not None), dtype=np.int64)
+
+    def live_rows(self) -> np.ndarray:
+        """Get all the rows that are not tombstones."""
+        return np.flatnonzero(self.alive[: self.size])
+
+    def _dot(self, query: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Multiply the rows with the query, avoiding a copy of the matrix when most rows are requested."""
+        if len(rows) * 2 >= self.size:
+            return (self.vectors[: self.size] @ query)[rows]
+        return self.vectors[rows] @ query
+
+    def score(self, vector: Sequence[float | int], distance_function: DistanceFunction, rows: np.ndarray) -> np.ndarray:
+        """Score the given rows against the vector, using the distance function.
+
+        The scores are the same as the ones produced by the matching function in `DISTANCE_FUNCTION_MAP`.
+        """
+        query = np.asarray(vector, dtype=np.float32)
+        if query.shape != (self.dimensions,):
+            raise VectorSearchExecutionException(
+                f"Search vector must have {self.dimensions} dimensions, got an array of shape {query.shape}."
+            )
+        match distance_function:
+            case DistanceFunction.DOT_PROD:
+                return self._dot(query, rows)
+            case DistanceFunction.COSINE_SIMILARITY | DistanceFunction.COSINE_DISTANCE | DistanceFunction.DEFAULT:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    similarity = self._dot(query, rows) / np.sqrt(self.squared_norms[rows] * np.dot(query, query))
+                if distance_function == DistanceFunction.COSINE_SIMILARITY:
+                    return similarity
+                return 1.0 - similarity
+            case DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE | DistanceFunction.EUCLIDEAN_DISTANCE:
+                squared = np.maximum(
+                    self.squared_norms[rows] - 2.0 * self._dot(query, rows) + np.dot(query, query), 0.0
+                )
+                if distance_function == DistanceFunction.EUCLIDEAN_DISTANCE:
+                    return np.sqrt(squared)
+                return squared
+            case DistanceFunction.MANHATTAN | DistanceFunction.HAMMING:
+                scores = np.empty(len(rows), dtype=np.float32)
+                for start in range(0, len(rows), SCORING_CHUNK_SIZE):
+                    chunk = self.vectors[rows[start : start + SCORING_CHUNK_SIZE]]
+                    if distance_function == DistanceFunction.MANHATTAN:
+                        scores[start : start + SCORING_CHUNK_SIZE] = np.abs(chunk - query).sum(axis=1)
+                    else:
+                        scores[start : start + SCORING_CHUNK_SIZE] = (chunk != query).mean(axis=1)
+                return scores
+            case _:
+                raise VectorSearchExecutionException(f"Distance function '{distance_function}' is not supported.")
+
+
+@dataclass
+class IndexCondition:
+    """A single comparison of a field with a constant, taken from a filter, that can be answered by an index."""
+
+    field_name: str
+    operator: str
+    value: Any
+
+
+@dataclass
+class CompiledFilter:
+    """A filter that is parsed and validated once.
+
+    The predicate is run on the candidate records, the conditions are combined with AND
+    and are used to look up the candidates in the secondary indexes, before running the predicate.
+    """
+
+    predicate: Callable[[Any], bool]
+    conditions: list[IndexCondition] = field(default_factory=list)
+
+
+class DataFieldIndex:
+    """Secondary index for a single data field.
+
+    Equality and membership conditions are answered by a hash index that is kept up to date on every change,
+    range conditions use a sorted index that is rebuilt on first use after a change.
+    Keys of records with a value that cannot be hashed are always returned as candidates.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.values: dict[Any, Any] = {}
+        self.hash_index: dict[Hashable, set[Any]] = {}
+        self.unhashable: set[Any] = set()
+        self._sorted_values: list[Any] | None = None
+        self._sorted_keys: list[Any] | None = None
+        self._sortable: bool = True
+
+    def add(self, key: Any, value: Any) -> None:
+        """Add or replace the value for a key."""
+        self.remove(key)
+        self.values[key] = value
+        if isinstance(value, Hashable):
+            self.hash_index.setdefault(value, set()).add(key)
+        else:
+            self.unhashable.add(key)
+        self._sorted_values = self._sorted_keys = None
+
+    def remove(self, key: Any) -> None:
+        """Remove the value for a key."""
+        if key not in self.values:
+            return
+        value = self.values.pop(key)
+        self.unhashable.discard(key)
+        if isinstance(value, Hashable) and (keys := self.hash_index.get(value)) is not None:
+            keys.discard(key)
+            if not keys:
+                del self.hash_index[value]
+        self._sorted_values = self._sorted_keys = None
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self.values.clear()
+        self.hash_index.clear()
+        self.unhashable.clear()
+        self._sorted_values = self._sorted_keys = None
+
+    def _build_sorted_index(self) -> bool:
+        if self._sorted_values is not None:
+            return True
+        pairs = [(value, key) for key, value in self.values.items() if value is not None]
+        try:
+            pairs.sort(key=operator.itemgetter(0))
+        except TypeError:
+            # values that cannot be ordered, range conditions are then answered by the predicate only
+            return False
+        self._sorted_values = [value for value, _ in pairs]
+        self._sorted_keys = [key for _, key in pairs]
+        return True
+
+    def lookup(self, condition: IndexCondition) -> set[Any] | None:
+        """Get the keys that might match the condition, None when the index cannot answer it."""
+        match condition.operator:
+            case "eq":
+                if not isinstance(condition.value, Hashable):
+                    return None
+                return self.hash_index.get(condition.value, set()) | self.unhashable
+            case "in":
+                if not isinstance(condition.value, list | tuple | set | frozenset) or not all(
+                    isinstance(value, Hashable) for value in condition.value
+                ):
+                    return None
+                keys: set[Any] = set(self.unhashable)
+                for value in condition.value:
+                    keys |= self.hash_index.get(value, set())
+                return keys
+        if not self._build_sorted_index():
+            return None
+        try:
+            match condition.operator:
+                case "lt":
+                    return set(self._sorted_keys[: bisect_left(self._sorted_values, condition.value)])  # type: ignore
+                case "le":
+                    return set(self._sorted_keys[: bisect_right(self._sorted_values, condition.value)])  # type: ignore
+                case "gt":
+                    return set(self._sorted_keys[bisect_right(self._sorted_values, condition.value) :])  # type: ignore
+                case "ge":
+                    return set(self._sorted_keys[bisect_left(self._sorted_values, condition.value) :])  # type: ignore
+        except TypeError:
+            return None
+        return None
+
+
+def _replace_file(path: Path, write: Callable[[IO[Any]], Any], binary: bool = True) -> None:
+    """Write a file to a temporary file next to it and replace the file with it.
+
+    Readers that memory-mapped the previous file keep their data, and a failure leaves the previous file intact.
+    """
+    descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb" if binary else "w", encoding=None if binary else "utf-8") as file:
+            write(file)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
 class InMemoryCollection(
     VectorStoreCollection[TKey, TModel],
     VectorSearch[TKey, TModel],
@@ -89,8 +441,12 @@ class InMemoryCollection(
     """In Memory Collection."""
 
     inner_storage: dict[TKey, AttributeDict] = Field(default_factory=dict)
+    columnar: bool = False
     supported_key_types: ClassVar[set[str] | None] = {"str", "int", "float"}
     supported_search_types: ClassVar[set[SearchType]] = {SearchType.VECTOR}
+    _vector_matrices: dict[str, VectorMatrix] = PrivateAttr(default_factory=dict)
+    _data_indexes: dict[str, DataFieldIndex] = PrivateAttr(default_factory=dict)
+    _filter_cache: OrderedDict[Callable | str, CompiledFilter] = PrivateAttr(default_factory=OrderedDict)
 
     def __init__(
         self,
@@ -98,16 +454,33 @@ class InMemoryCollection(
         definition: VectorStoreCollectionDefinition | None = None,
         collection_name: str | None = None,
         embedding_generator: EmbeddingGeneratorBase | None = None,
+        columnar: bool = False,
         **kwargs: Any,
     ):
-        """Create a In Memory Collection."""
+        """Create a In Memory Collection.
+
+        Args:
+            record_type: The type of the data model.
+            definition: The definition of the data model.
+            collection_name: The name of the collection.
+            embedding_generator: The embedding generator.
+            columnar: When True, the vectors of each vector field are also kept in a float32 matrix,
+                so that a search scores all records at once instead of one by one.
+            kwargs: Additional arguments.
+        """
         super().__init__(
             record_type=record_type,
             definition=definition,
             collection_name=collection_name,
             embedding_generator=embedding_generator,
+            columnar=columnar,
             **kwargs,
         )
+        self._data_indexes = {
+            field.storage_name or field.name: DataFieldIndex()
+            for field in self.definition.data_fields
+            if field.is_indexed
+        }
 
     def _validate_data_model(self):
         """Check if the In Memory Score key is not used."""
@@ -119,6 +492,10 @@ class InMemoryCollection(
     async def _inner_delete(self, keys: Sequence[TKey], **kwargs: Any) -> None:
         for key in keys:
             self.inner_storage.pop(key, None)
+            for index in self._data_indexes.values():
+                index.remove(key)
+        for matrix in self._vector_matrices.values():
+            matrix.delete(keys)
 
     @override
     async def _inner_get(
@@ -132,13 +509,47 @@ class InMemoryCollection(
 
     @override
     async def _inner_upsert(self, records: Sequence[Any], **kwargs: Any) -> Sequence[TKey]:
+        # The vectors are checked before any record is stored, so that the records and the matrices stay in sync
+        vector_batches = self._get_vector_batches(records) if self.columnar else {}
         updated_keys = []
         for record in records:
             record = AttributeDict(record)
             self.inner_storage[record[self._key_field_name]] = record
             updated_keys.append(record[self._key_field_name])
+            for field_name, index in self._data_indexes.items():
+                index.add(record[self._key_field_name], record.get(field_name))
+        for field_name, (keys, batch, missing) in vector_batches.items():
+            matrix = self._vector_matrices[field_name]
+            matrix.delete(missing)
+            matrix.upsert(keys, batch)
         return updated_keys
 
+    def _get_vector_matrix(self, field: VectorStoreField) -> VectorMatrix:
+        """Get the vector matrix of a vector field, creating it when needed."""
+        if field.name not in self._vector_matrices:
+            if field.dimensions is None:
+                raise VectorStoreOperationException(
+                    f"Vector field '{field.name}' must have dimensions to be kept in a columnar collection."
+                )
+            self._vector_matrices[field.name] = VectorMatrix(dimensions=field.dimensions)
+        return self._vector_matrices[field.name]
+
+    def _get_vector_batches(self, records: Sequence[Any]) -> dict[str, tuple[list[Any], np.ndarray, list[Any]]]:
+        """Get the keys and the checked vectors of the records for each vector field, and the keys without a vector.
+
+        A key that is in the records more than once gets its last vector, like the records in the collection.
+        """
+        batches: dict[str, tuple[list[Any], np.ndarray, list[Any]]] = {}
+        for vector_field in self.definition.vector_fields:
+            matrix = self._get_vector_matrix(vector_field)
+            storage_name = vector_field.storage_name or vector_field.name
+            vectors_by_key = {record[self._key_field_name]: record.get(storage_name) for record in records}
+            keys = [key for key, vector in vectors_by_key.items() if vector is not None]
+            missing = [key for key, vector in vectors_by_key.items() if vector is None]
+            batch = matrix.as_batch([vectors_by_key[key] for key in keys]) if keys else np.empty((0, matrix.dimensions))
+            batches[vector_field.name] = (keys, batch, missing)
+        return batches
+
     def _deserialize_store_models_to_dicts(self, records: Sequence[Any], **kwargs: Any) -> Sequence[dict[str, Any]]:
         return records
 
@@ -152,11 +563,136 @@ class InMemoryCollection(
     @override
     async def ensure_collection_deleted(self, **kwargs: Any) -> None:
         self.inner_storage = {}
+        self._vector_matrices.clear()
+        for index in self._data_indexes.values():
+            index.clear()
 
     @override
     async def collection_exists(self, **kwargs: Any) -> bool:
         return True
 
+    async def save_snapshot(self, path: str | PathLike) -> None:
+        """Save the collection to a snapshot directory.
+
+        The snapshot contains a manifest, the records without their vectors as json,
+        and a `.npy` file with a float32 matrix for each vector field.
+        An existing snapshot in the directory is overwritten.
+
+        Args:
+            path: The directory to write the snapshot to, it is created when it does not exist.
+
+        Raises:
+            VectorStoreOperationException: If the records cannot be serialized to json.
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        manifest: dict[str, Any] = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "collection_name": self.collection_name,
+            "key_field": self._key_field_name,
+            "vector_fields": {},
+        }
+        for vector_field in self.definition.vector_fields:
+            keys, vectors, squared_norms = self._get_snapshot_vectors(vector_field)
+            # The arrays can be memory-mapped from the files they replace, so those files are replaced, not rewritten
+            _replace_file(directory / f"{vector_field.name}.npy", lambda file: np.save(file, vectors))
+            _replace_file(directory / f"{vector_field.name}.norms.npy", lambda file: np.save(file, squared_norms))
+            manifest["vector_fields"][vector_field.name] = {"dimensions": vector_field.dimensions, "keys": keys}
+        excluded = {field.storage_name or field.name for field in self.definition.vector_fields} | {IN_MEMORY_SCORE_KEY}
+        try:
+            records = [{k: v for k, v in record.items() if k not in excluded} for record in self.inner_storage.values()]
+            _replace_file(directory / SNAPSHOT_RECORDS_FILE, lambda file: json.dump(records, file), binary=False)
+            _replace_file(directory / SNAPSHOT_MANIFEST_FILE, lambda file: json.dump(manifest, file), binary=False)
+        except TypeError as exc:
+            raise VectorStoreOperationException(f"Records could not be written to the snapshot: {exc}") from exc
+
+    def _get_snapshot_vectors(self, vector_field: VectorStoreField) -> tuple[list[Any], np.ndarray, np.ndarray]:
+        """Get the keys, vectors and squared norms of a vector field, for records that have a vector."""
+        if (matrix := self._vector_matrices.get(vector_field.name)) is not None:
+            rows = matrix.live_rows()
+            return [matrix.row_keys[row] for row in rows], matrix.vectors[rows], matrix.squared_norms[rows]
+        storage_name = vector_field.storage_name or vector_field.name
+        keys = [key for key, record in self.inner_storage.items() if record.get(storage_name) is not None]
+        vectors = np.asarray([self.inner_storage[key][storage_name] for key in keys], dtype=np.float32).reshape(
+            len(keys), vector_field.dimensions or 0
+        )
+        return keys, vectors, np.einsum("ij,ij->i", vectors, vectors)
+
+    async def load_snapshot(self, path: str | PathLike, mmap: bool = True) -> None:
+        """Replace the contents of the collection with a snapshot created by `save_snapshot`.
+
+        When mmap is True, the vector matrices are memory-mapped copy-on-write,
+        so processes that load the same snapshot share the vectors through the page cache,
+        while changes made to the collection are never written back to the snapshot.
+        The vectors in the records are views on the rows of those matrices.
+
+        Args:
+            path: The snapshot directory.
+            mmap: Whether to memory-map the vector matrices instead of reading them into memory.
+
+        Raises:
+            VectorStoreOperationException: If the snapshot cannot be read or does not match the definition
+                of the collection, the collection is then left unchanged.
+        """
+        directory = Path(path)
+        try:
+            with open(directory / SNAPSHOT_MANIFEST_FILE, encoding="utf-8") as file:
+                manifest = json.load(file)
+            with open(directory / SNAPSHOT_RECORDS_FILE, encoding="utf-8") as file:
+                records = json.load(file)
+        except (OSError, json.JSONDecodeError) as exc:
+            raise VectorStoreOperationException(f"Snapshot at '{directory}' could not be read: {exc}") from exc
+        if manifest.get("version") != SNAPSHOT_FORMAT_VERSION:
+            raise VectorStoreOperationException(f"Snapshot version {manifest.get('version')} is not supported.")
+        if manifest.get("key_field") != self._key_field_name:
+            raise VectorStoreOperationException(
+                f"Snapshot key field '{manifest.get('key_field')}' does not match '{self._key_field_name}'."
+            )
+        try:
+            records_by_key = {record[self._key_field_name]: AttributeDict(record) for record in records}
+        except (KeyError, TypeError) as exc:
+            raise VectorStoreOperationException(f"Snapshot records could not be read: {exc}") from exc
+        # The snapshot is read and checked completely first, so a bad snapshot leaves the collection as it is
+        mmap_mode = "c" if mmap else None
+        vector_arrays: dict[str, tuple[list[Any], np.ndarray, np.ndarray]] = {}
+        for vector_field in self.definition.vector_fields:
+            info = manifest.get("vector_fields", {}).get(vector_field.name)
+            if info is None or info["dimensions"] != vector_field.dimensions:
+                raise VectorStoreOperationException(
+                    f"Snapshot does not contain vectors with {vector_field.dimensions} dimensions "
+                    f"for field '{vector_field.name}'."
+                )
+            try:
+                vectors = np.load(directory / f"{vector_field.name}.npy", mmap_mode=mmap_mode)
+                squared_norms = np.load(directory / f"{vector_field.name}.norms.npy", mmap_mode=mmap_mode)
+            except (OSError, ValueError) as exc:
+                raise VectorStoreOperationException(
+                    f"Snapshot vectors for field '{vector_field.name}' could not be read: {exc}"
+                ) from exc
+            keys = info["keys"]
+            if (
+                vectors.shape != (len(keys), vector_field.dimensions)
+                or squared_norms.shape != (len(keys),)
+                or not all(key in records_by_key for key in keys)
+            ):
+                raise VectorStoreOperationException(
+                    f"Snapshot vectors for field '{vector_field.name}' do not match the records of the snapshot."
+                )
+            vector_arrays[vector_field.name] = (keys, vectors, squared_norms)
+        await self.ensure_collection_deleted()
+        self.inner_storage.update(records_by_key)
+        for vector_field in self.definition.vector_fields:
+            keys, vectors, squared_norms = vector_arrays[vector_field.name]
+            storage_name = vector_field.storage_name or vector_field.name
+            # plain ndarray row views on the (memory-mapped) buffer are much cheaper to create than memmap rows
+            for key, row in zip(keys, vectors.view(np.ndarray)):
+                self.inner_storage[key][storage_name] = row
+            if self.columnar:
+                self._vector_matrices[vector_field.name] = VectorMatrix.from_arrays(keys, vectors, squared_norms)
+        for field_name, index in self._data_indexes.items():
+            for key, record in self.inner_storage.items():
+                index.add(key, record.get(field_name))
+
     @override
     async def _inner_search(
         self,
@@ -180,6 +716,8 @@ class InMemoryCollection(
                 f"Distance function '{field.distance_function}' is not supported. "
                 f"Supported functions are: {list(DISTANCE_FUNCTION_MAP.keys())}"
             )
+        if self.columnar:
+            return self._search_vector_matrix(vector, field, options)
         distance_func = DISTANCE_FUNCTION_MAP[field.distance_function]  # type: ignore[assignment]
 
         for key, record in self._get_filtered_records(options).items():
@@ -210,6 +748,44 @@ class InMemoryCollection(
             )
         return KernelSearchResults(results=empty_generator())
 
+    def _search_vector_matrix(
+        self,
+        vector: Sequence[float | int] | None,
+        field: VectorStoreField,
+        options: VectorSearchOptions,
+    ) -> KernelSearchResults[VectorSearchResult[TModel]]:
+        """Search using the vector matrix of the field.
+
+        All candidate rows are scored at once, after which only the top `skip + top` rows are selected and sorted.
+        """
+        matrix = self._vector_matrices.get(field.name)
+        if not vector or matrix is None or not len(matrix):
+            return KernelSearchResults(results=empty_generator())
+        rows = matrix.rows_for_keys(self._get_filtered_records(options)) if options.filter else matrix.live_rows()
+        if not len(rows):
+            return KernelSearchResults(results=empty_generator())
+        scores = matrix.score(vector, field.distance_function or DistanceFunction.DEFAULT, rows)
+        if field.distance_function == DistanceFunction.DEFAULT:
+            reverse_func = DISTANCE_FUNCTION_DIRECTION_HELPER[DistanceFunction.COSINE_DISTANCE]
+        else:
+            reverse_func = DISTANCE_FUNCTION_DIRECTION_HELPER[field.distance_function]  # type: ignore[index]
+        # the sort key is ascending, with scores that could not be calculated last
+        sort_key = -scores if reverse_func(1, 0) else scores
+        sort_key = np.where(np.isnan(sort_key), np.inf, sort_key)
+        count = min(options.skip + options.top, len(rows))
+        candidates = np.argpartition(sort_key, count - 1)[:count] if count < len(rows) else np.arange(len(rows))
+        # ties are broken by the order in which the vectors were added
+        candidates = candidates[np.lexsort((rows[candidates], sort_key[candidates]))][options.skip :]
+        return_list = []
+        for candidate in candidates:
+            record = self.inner_storage[matrix.row_keys[rows[candidate]]]
+            record[IN_MEMORY_SCORE_KEY] = float(scores[candidate])
+            return_list.append(record)
+        return KernelSearchResults(
+            results=self._get_vector_search_results_from_results(return_list, options),
+            total_count=len(rows) if options.include_total_count else None,
+        )
+
     async def _generate_return_list(
         self, return_records: dict[TKey, float], options: VectorSearchOptions | None
     ) -> AsyncIterable[dict]:
@@ -229,19 +805,53 @@ class InMemoryCollection(
         if not options.filter:
             return self.inner_storage
         try:
-            callable_filters = [
-                self._parse_and_validate_filter(filter) if isinstance(filter, str) else filter
+            compiled_filters = [
+                self._compile_filter(filter)
                 for filter in ([options.filter] if not isinstance(options.filter, list) else options.filter)
             ]
         except Exception as e:
             raise VectorStoreOperationException(f"Error evaluating filter: {e}") from e
+        candidates: Iterable[TKey] = self.inner_storage
+        for condition in (condition for compiled in compiled_filters for condition in compiled.conditions):
+            if (index := self._data_indexes.get(condition.field_name)) is None:
+                continue
+            if (keys := index.lookup(condition)) is None:
+                continue
+            candidates = keys if candidates is self.inner_storage else keys.intersection(candidates)
         filtered_records: dict[TKey, AttributeDict] = {}
-        for key, record in self.inner_storage.items():
-            for filter in callable_filters:
-                if self._run_filter(filter, record):
-                    filtered_records[key] = record
+        for key in candidates:
+            record = self.inner_storage[key]
+            if all(self._run_filter(compiled.predicate, record) for compiled in compiled_filters):
+                filtered_records[key] = record
         return filtered_records
 
+    def _compile_filter(self, filter: Callable | str) -> CompiledFilter:
+        """Compile a filter, or get it from the cache.
+
+        String filters are parsed and validated, for both strings and callables the conditions
+        that can be answered by the secondary indexes are extracted.
+        """
+        if (compiled := self._filter_cache.get(filter)) is not None:
+            self._filter_cache.move_to_end(filter)
+            return compiled
+        predicate = self._parse_and_validate_filter(filter) if isinstance(filter, str) else filter
+        conditions: list[IndexCondition] = []
+        if self._data_indexes:
+            try:
+                visitor = LambdaVisitor(self._lambda_parser)
+                visitor.visit(ast.parse(filter if isinstance(filter, str) else getsource(filter).strip()))
+                if len(visitor.output_filters) == 1:
+                    conditions = visitor.output_filters[0]
+            except (OSError, TypeError, SyntaxError):
+                # the source of the callable is not available or is not a standalone lambda,
+                # the filter is then run on all records.
+                conditions = []
+        compiled = CompiledFilter(predicate=predicate, conditions=conditions)
+        self._filter_cache[filter] = compiled
+        if len(self._filter_cache) > FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+        return compiled
+
     def _parse_and_validate_filter(self, filter_str: str) -> Callable:
         """Parse and validate a string filter as a lambda expression, then return the callable."""
         forbidden_names = {"__import__", "open", "eval", "exec", "__builtins__"}
@@ -277,9 +887,47 @@ class InMemoryCollection(
             raise VectorStoreOperationException(f"Error running filter: {e}") from e
 
     @override
-    def _lambda_parser(self, node: ast.AST) -> Any:
-        """Not used by InMemoryCollection, but required by the interface."""
-        pass
+    def _lambda_parser(self, node: ast.AST) -> list[IndexCondition]:
+        """Get the conditions from the body of a lambda filter that can be answered by the secondary indexes.
+
+        Only conditions on indexed fields that are combined with AND are returned,
+        other parts of the filter are left to the predicate.
+        """
+        match node:
+            case ast.BoolOp(op=ast.And()):
+                return [condition for value in node.values for condition in self._lambda_parser(value)]
+            case ast.Compare():
+                conditions: list[IndexCondition] = []
+                operands = [node.left, *node.comparators]
+                for idx, op in enumerate(node.ops):
+                    if type(op) not in INDEX_OPERATORS:
+                        continue
+                    operator_name = INDEX_OPERATORS[type(op)]
+                    left, right = operands[idx], operands[idx + 1]
+                    if (field_name := self._get_indexed_field_name(left)) is not None:
+                        value_node = right
+                    elif operator_name != "in" and (field_name := self._get_indexed_field_name(right)) is not None:
+                        value_node, operator_name = left, REVERSED_INDEX_OPERATORS[operator_name]
+                    else:
+                        continue
+                    try:
+                        value = ast.literal_eval(value_node)
+                    except ValueError:
+                        continue
+                    conditions.append(IndexCondition(field_name=field_name, operator=operator_name, value=value))
+                return conditions
+        return []
+
+    def _get_indexed_field_name(self, node: ast.AST) -> str | None:
+        """Get the field name for `x.field` or `x['field']`, if that field is indexed."""
+        match node:
+            case ast.Attribute(value=ast.Name(), attr=name):
+                field_name = name
+            case ast.Subscript(value=ast.Name(), slice=ast.Constant(value=str() as name)):
+                field_name = name
+            case _:
+                return None
+        return field_name if field_name in self._data_indexes else None
 
     def _calculate_vector_similarity(
         self,
@@ -332,4 +980,5 @@ class InMemoryStore(VectorStore):
             definition=definition,
             collection_name=collection_name,
             embedding_generator=embedding_generator or self.embedding_generator,
+            **kwargs,
         )
@@ -965,14 +965,15 @@ def create_mcp_server_from_kernel(
                 return types.GetPromptResult(description="Prompt not found", messages=[])
 
             # Call the prompt
-            rendered_prompt = await prompt.render(
+            rendered_prompt, chat_history = await prompt.render_with_chat_history(
                 kernel,
                 KernelArguments(**arguments) if arguments is not None else KernelArguments(),
             )
             # since the return type of a get_prompts is a list of messages,
             # we need to convert the rendered prompt to a list of messages
             # by using the ChatHistory class
-            chat_history = ChatHistory.from_rendered_prompt(rendered_prompt)
+            if chat_history is None:
+                chat_history = ChatHistory.from_rendered_prompt(rendered_prompt)
             messages = []
             for message in chat_history.messages:
                 messages.append(
@@ -9,6 +9,7 @@ from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.contents.function_result_content import FunctionResultContent
 from semantic_kernel.contents.history_reducer.chat_history_reducer import ChatHistoryReducer
 from semantic_kernel.contents.history_reducer.chat_history_summarization_reducer import ChatHistorySummarizationReducer
+from semantic_kernel.contents.history_reducer.chat_history_token_budget_reducer import ChatHistoryTokenBudgetReducer
 from semantic_kernel.contents.history_reducer.chat_history_truncation_reducer import ChatHistoryTruncationReducer
 from semantic_kernel.contents.image_content import ImageContent
 from semantic_kernel.contents.realtime_events import (
@@ -35,6 +36,7 @@ __all__ = [
     "ChatHistory",
     "ChatHistoryReducer",
     "ChatHistorySummarizationReducer",
+    "ChatHistoryTokenBudgetReducer",
     "ChatHistoryTruncationReducer",
     "ChatMessageContent",
     "FileReferenceContent",
@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Sequence
 from functools import singledispatchmethod
 from html import unescape
 from typing import Any, TypeVar
@@ -19,6 +19,9 @@ from semantic_kernel.kernel_pydantic import KernelBaseModel
 
 logger = logging.getLogger(__name__)
 
+# Marks the position of a chat history object in the parts of a rendered prompt
+_EMBEDDED_HISTORY_ATTRIBUTE = "sk-embedded-index"
+
 _T = TypeVar("_T", bound="ChatHistory")
 
 
@@ -332,6 +335,62 @@ class ChatHistory(KernelBaseModel):
             messages[0].role = AuthorRole.USER
         return cls(messages=messages)
 
+    @classmethod
+    def from_rendered_prompt_parts(cls: type[_T], parts: Sequence["str | ChatHistory"]) -> _T | None:
+        """Create a ChatHistory instance from the parts of a rendered prompt.
+
+        The parts are the rendered text and the chat histories that were embedded in the prompt. The result
+        is the same as for `from_rendered_prompt` with the joined prompt, but the messages of the embedded
+        chat histories are copied as they are, instead of being serialized to xml and parsed again.
+
+        Args:
+            parts (Sequence[str | ChatHistory]): The parts of the rendered prompt.
+
+        Returns:
+            ChatHistory | None: The ChatHistory instance, or None when the prompt has to be parsed as a whole,
+                for instance when a chat history is embedded inside a message.
+        """
+        histories: list[ChatHistory] = []
+        prompt_parts: list[str] = []
+        for part in parts:
+            if isinstance(part, ChatHistory):
+                prompt_parts.append(f'<{CHAT_HISTORY_TAG} {_EMBEDDED_HISTORY_ATTRIBUTE}="{len(histories)}" />')
+                histories.append(part)
+            else:
+                prompt_parts.append(part)
+        prompt = "".join(prompt_parts).strip()
+        try:
+            xml_prompt = XML(text=f"<root>{prompt}</root>")
+        except ParseError:
+            return None
+
+        messages: list["ChatMessageContent"] = []
+        embedded = 0
+        if xml_prompt.text and xml_prompt.text.strip():
+            messages.append(ChatMessageContent(role=AuthorRole.SYSTEM, content=unescape(xml_prompt.text.strip())))
+        for item in xml_prompt:
+            if item.tag == CHAT_MESSAGE_CONTENT_TAG:
+                messages.append(ChatMessageContent.from_element(item))
+            elif item.tag == CHAT_HISTORY_TAG:
+                index = item.get(_EMBEDDED_HISTORY_ATTRIBUTE)
+                if index is None:
+                    messages.extend(ChatMessageContent.from_element(message) for message in item)
+                else:
+                    # The messages get their own list of items, so changes to the request do not leak back
+                    messages.extend(
+                        message.model_copy(update={"items": list(message.items)})
+                        for message in histories[int(index)].messages
+                    )
+                    embedded += 1
+            if item.tail and item.tail.strip():
+                messages.append(ChatMessageContent(role=AuthorRole.USER, content=unescape(item.tail.strip())))
+        if embedded != len(histories):
+            # A chat history that ended up inside a message is part of the content of that message
+            return None
+        if len(messages) == 1 and messages[0].role == AuthorRole.SYSTEM:
+            messages[0].role = AuthorRole.USER
+        return cls(messages=messages)
+
     def serialize(self) -> str:
         """Serializes the ChatHistory instance to a JSON string.
 
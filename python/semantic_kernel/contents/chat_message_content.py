@@ -1,13 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import logging
+from collections.abc import Callable
 from enum import Enum
 from html import unescape
-from typing import Annotated, Any, ClassVar, Literal, overload
+from typing import Annotated, Any, ClassVar, Literal, TypeVar, overload
 from xml.etree.ElementTree import Element  # nosec
 
 from defusedxml import ElementTree
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from semantic_kernel.contents.annotation_content import AnnotationContent
 from semantic_kernel.contents.audio_content import AudioContent
@@ -39,6 +40,8 @@ from semantic_kernel.contents.utils.hashing import make_hashable
 from semantic_kernel.contents.utils.status import Status
 from semantic_kernel.exceptions.content_exceptions import ContentInitializationError
 
+_T = TypeVar("_T")
+
 TAG_CONTENT_MAP = {
     ANNOTATION_CONTENT_TAG: AnnotationContent,
     TEXT_CONTENT_TAG: TextContent,
@@ -97,6 +100,9 @@ class ChatMessageContent(KernelContent):
     finish_reason: FinishReason | None = None
     status: Status | None = None
 
+    # The formats of the message by formatter and arguments, with the state of the message they were created from
+    _formats: dict[tuple[Any, ...], tuple[tuple[Any, ...], Any]] = PrivateAttr(default_factory=dict)
+
     @overload
     def __init__(
         self,
@@ -299,9 +305,57 @@ class ChatMessageContent(KernelContent):
     def to_dict(self, role_key: str = "role", content_key: str = "content") -> dict[str, Any]:
         """Serialize the ChatMessageContent to a dictionary.
 
+        The dictionary is cached until the message changes, see `get_cached_format`. Every call returns
+        a new dictionary, but the values in it are shared.
+
         Returns:
             dict - The dictionary representing the ChatMessageContent.
         """
+        return dict(self.get_cached_format(ChatMessageContent._to_dict, role_key, content_key))
+
+    def get_cached_format(self, formatter: Callable[..., _T], *args: Any) -> _T:
+        """Get the message in the format of a connector, cached until the message changes.
+
+        The formatter is called with the message and the arguments, the result is cached per formatter and
+        arguments. The cached result is used as long as no field of the message or of its items is assigned
+        and no item is added, removed or replaced, so a request only formats the messages that were added or
+        changed since the previous request. Values that are changed in place, like the arguments of a function
+        call, are not noticed, assign a new value instead.
+
+        Args:
+            formatter: Creates the format of the message, called with the message and the arguments.
+            args: The arguments for the formatter, these have to be hashable.
+
+        Returns:
+            The formatted message. It is shared with the next requests, so it must not be changed.
+        """
+        # The private attributes are read directly, pydantic looks them up slowly on every access
+        private: dict[str, Any] = self.__pydantic_private__  # type: ignore[assignment]
+        # The items are kept in the state, so they are compared by identity and cannot be reused by others
+        state: list[Any] = [private["_version"]]
+        for item in self.items:
+            state += (item, item.__pydantic_private__["_version"])  # type: ignore[index]
+        key = (formatter, *args)
+        cached = private["_formats"].get(key)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        formatted = formatter(self, *args)
+        private["_formats"][key] = (state, formatted)
+        return formatted
+
+    def __copy__(self) -> "ChatMessageContent":
+        """Return a shallow copy of the message, with its own cache of formats."""
+        copied = super().__copy__()
+        copied._formats = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "ChatMessageContent":
+        """Return a deep copy of the message, with its own cache of formats."""
+        copied = super().__deepcopy__(memo)
+        copied._formats = {}
+        return copied
+
+    def _to_dict(self, role_key: str, content_key: str) -> dict[str, Any]:
         ret: dict[str, Any] = {
             role_key: self.role.value,
         }
@@ -215,3 +215,12 @@ def extract_range(
 def contains_function_call_or_result(msg: ChatMessageContent) -> bool:
     """Return True if the message has any function call or function result."""
     return any(isinstance(item, (FunctionCallContent, FunctionResultContent)) for item in msg.items)
+
+
+@experimental
+def estimate_token_count(msg: ChatMessageContent) -> int:
+    """Estimate the number of tokens of a message, as one token per four characters of its serialized form.
+
+    Use the tokenizer of the model instead when the count has to be exact.
+    """
+    return -(-len(str(msg.to_dict())) // 4)
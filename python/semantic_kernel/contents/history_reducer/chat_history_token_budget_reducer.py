@@ -0,0 +1,236 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import logging
+import sys
+from collections import Counter
+from collections.abc import Callable
+
+if sys.version < "3.11":
+    from typing_extensions import Self  # pragma: no cover
+else:
+    from typing import Self  # type: ignore # pragma: no cover
+if sys.version < "3.12":
+    from typing_extensions import override  # pragma: no cover
+else:
+    from typing import override  # type: ignore # pragma: no cover
+
+from pydantic import Field, PrivateAttr
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.history_reducer.chat_history_reducer import ChatHistoryReducer
+from semantic_kernel.contents.history_reducer.chat_history_reducer_utils import (
+    SUMMARY_METADATA_KEY,
+    contains_function_call_or_result,
+    estimate_token_count,
+    extract_range,
+    locate_summarization_boundary,
+)
+from semantic_kernel.contents.history_reducer.chat_history_summarization_reducer import DEFAULT_SUMMARIZATION_PROMPT
+from semantic_kernel.exceptions.content_exceptions import ChatHistoryReducerException
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+logger = logging.getLogger(__name__)
+
+
+@experimental
+class ChatHistoryTokenBudgetReducer(ChatHistoryReducer):
+    """A ChatHistory that reduces its messages to a token budget.
+
+    The message count is a poor measure of the size of the context when messages, like function results,
+    vary widely in size. This reducer removes the oldest messages until the history fits in `max_tokens`,
+    without separating function calls from their results. When a service is set, the removed messages are
+    summarized into a single summary message at the start of the history.
+
+    The tokens of a message are counted once, and the counts and the ids of the function results are kept
+    as the history grows, so a reduction only visits the messages it removes. A message that is changed in
+    place after it was counted keeps its count until the messages are replaced.
+
+    Args:
+        max_tokens: The token budget of the history.
+        threshold_tokens: The tokens beyond the budget that are allowed before the history is reduced.
+        target_count: The number of most recent messages that are always kept, default is 1.
+        auto_reduce: Whether to automatically reduce the chat history, default is False.
+        token_counter: Counts the tokens of a message, default is `estimate_token_count`.
+        service: The ChatCompletion service to summarize the removed messages, optional.
+        summarization_instructions: The summarization instructions, optional.
+        execution_settings: The execution settings for the summarization prompt, optional.
+        fail_on_error: Raise error if summarization fails, default is True.
+    """
+
+    target_count: int = Field(default=1, gt=0, description="Number of most recent messages that are always kept.")
+    max_tokens: int = Field(..., gt=0, description="Token budget of the history.")
+    threshold_tokens: int = Field(default=0, ge=0, description="Tokens beyond the budget allowed before reducing.")
+    token_counter: Callable[[ChatMessageContent], int] = Field(default=estimate_token_count, exclude=True)
+    service: ChatCompletionClientBase | None = None
+    summarization_instructions: str = Field(
+        default=DEFAULT_SUMMARIZATION_PROMPT,
+        description="The summarization instructions.",
+        kw_only=True,
+    )
+    execution_settings: PromptExecutionSettings | None = None
+    fail_on_error: bool = Field(default=True, description="Raise error if summarization fails.")
+
+    # The messages that are counted, in the order of the history, with their token counts
+    _counted_messages: list[ChatMessageContent] = PrivateAttr(default_factory=list)
+    _token_counts: list[int] = PrivateAttr(default_factory=list)
+    _token_count: int = PrivateAttr(default=0)
+    # The ids of the function results in the counted messages
+    _result_ids: Counter[str] = PrivateAttr(default_factory=Counter)
+
+    @property
+    def token_count(self) -> int:
+        """The number of tokens of the messages."""
+        self._count_tokens()
+        return self._token_count
+
+    @override
+    async def reduce(self) -> Self | None:
+        self._count_tokens()
+        if self._token_count <= self.max_tokens + self.threshold_tokens:
+            # No need to reduce
+            return None
+
+        logger.info("Performing chat history token budget reduction...")
+
+        history = self.messages
+        summary_count = locate_summarization_boundary(history) if self.service else 0
+        reduction_index = self._locate_reduction_index(summary_count)
+        if reduction_index is None:
+            logger.info(f"No reduction index found. Max tokens: {self.max_tokens}, Target count: {self.target_count}")
+            return None
+
+        summary_msg: ChatMessageContent | None = None
+        if self.service:
+            messages_to_summarize = extract_range(
+                history, start=0, end=reduction_index, filter_func=contains_function_call_or_result
+            )
+            try:
+                if messages_to_summarize:
+                    summary_msg = await self._summarize(messages_to_summarize)
+            except Exception as ex:
+                logger.warning("Summarization failed, continuing without summary.")
+                if self.fail_on_error:
+                    raise ChatHistoryReducerException("Chat History Summarization failed.") from ex
+                return None
+
+        logger.info(f"Removing {reduction_index} messages to fit {self.max_tokens} tokens.")
+        self._remove_messages(reduction_index)
+        if summary_msg:
+            summary_msg.metadata[SUMMARY_METADATA_KEY] = True
+            self._insert_message(0, summary_msg)
+        return self
+
+    def _count_tokens(self) -> None:
+        """Count the tokens of the messages that were added since the previous count."""
+        history = self.messages
+        counted_messages = self._counted_messages
+        # Comparing the lists is done by identity first, so it is cheap when the counted messages are unchanged
+        if len(history) < len(counted_messages) or history[: len(counted_messages)] != counted_messages:
+            # The messages were replaced or removed, so they are all counted again
+            counted_messages.clear()
+            self._token_counts.clear()
+            self._token_count = 0
+            self._result_ids.clear()
+        for message in history[len(counted_messages) :]:
+            self._track_message(len(counted_messages), message)
+
+    def _locate_reduction_index(self, start: int) -> int | None:
+        """Locate the index of the first message to keep, visiting only the messages that are removed.
+
+        Messages are removed from `start` until the remaining messages fit in the budget or only `target_count`
+        messages remain. A function call whose result is in the history is only removed together with its result.
+        """
+        history = self.messages
+        last_index = len(history) - self.target_count
+        token_count = self._token_count
+        open_call_ids: set[str] = set()
+        reduction_index: int | None = None
+        index = start
+        while index < last_index and (token_count > self.max_tokens or open_call_ids):
+            token_count -= self._token_counts[index]
+            for item in history[index].items:
+                if isinstance(item, FunctionCallContent) and item.id in self._result_ids:
+                    open_call_ids.add(item.id)  # type: ignore[arg-type]
+                elif isinstance(item, FunctionResultContent):
+                    open_call_ids.discard(item.id)  # type: ignore[arg-type]
+            index += 1
+            if not open_call_ids:
+                reduction_index = index
+        return reduction_index
+
+    def _track_message(self, index: int, message: ChatMessageContent) -> None:
+        # The count is cached on the message, so it is reused as long as the message is not changed
+        token_count = message.get_cached_format(self.token_counter)
+        self._counted_messages.insert(index, message)
+        self._token_counts.insert(index, token_count)
+        self._token_count += token_count
+        self._result_ids.update(
+            item.id for item in message.items if isinstance(item, FunctionResultContent) and item.id is not None
+        )
+
+    def _insert_message(self, index: int, message: ChatMessageContent) -> None:
+        self.messages.insert(index, message)
+        self._track_message(index, message)
+
+    def _remove_messages(self, end: int) -> None:
+        """Remove the messages before the end index, together with their counts."""
+        for message in self._counted_messages[:end]:
+            for item in message.items:
+                if isinstance(item, FunctionResultContent) and item.id is not None:
+                    self._result_ids[item.id] -= 1
+                    if self._result_ids[item.id] <= 0:
+                        del self._result_ids[item.id]
+        self._token_count -= sum(self._token_counts[:end])
+        del self.messages[:end]
+        del self._counted_messages[:end]
+        del self._token_counts[:end]
+
+    async def _summarize(self, messages: list[ChatMessageContent]) -> ChatMessageContent | None:
+        """Use the ChatCompletion service to generate a single summary message."""
+        from semantic_kernel.contents.utils.author_role import AuthorRole
+
+        if self.service is None:
+            return None
+        chat_history = ChatHistory(messages=messages)
+        execution_settings = self.execution_settings or self.service.get_prompt_execution_settings_from_settings(
+            PromptExecutionSettings()
+        )
+        chat_history.add_message(
+            ChatMessageContent(
+                role=getattr(execution_settings, "instruction_role", AuthorRole.SYSTEM),
+                content=self.summarization_instructions,
+            )
+        )
+        return await self.service.get_chat_message_content(chat_history=chat_history, settings=execution_settings)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equality based on the token budget settings.
+
+        (We don't factor in the actual ChatHistory messages themselves.)
+
+        Returns:
+            True if the other object is a ChatHistoryTokenBudgetReducer with the same token budget settings.
+        """
+        if not isinstance(other, ChatHistoryTokenBudgetReducer):
+            return False
+        return (
+            self.max_tokens == other.max_tokens
+            and self.threshold_tokens == other.threshold_tokens
+            and self.target_count == other.target_count
+            and self.summarization_instructions == other.summarization_instructions
+        )
+
+    def __hash__(self) -> int:
+        """Return a hash code based on the token budget settings."""
+        return hash((
+            self.__class__.__name__,
+            self.max_tokens,
+            self.threshold_tokens,
+            self.target_count,
+            self.summarization_instructions,
+        ))
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Annotated, Any, TypeVar
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 
@@ -19,6 +19,15 @@ class KernelContent(KernelBaseModel, ABC):
     ai_model_id: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    # Counts the assignments to the fields, so values derived from the content can be cached
+    _version: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, counting the assignments to the fields and properties."""
+        super().__setattr__(name, value)
+        if name[0] != "_" and self.__pydantic_private__ is not None:
+            self.__pydantic_private__["_version"] = self.__pydantic_private__.get("_version", 0) + 1
+
     @abstractmethod
     def __str__(self) -> str:
         """Return the string representation of the content."""
@@ -2,9 +2,12 @@
 
 from typing import TYPE_CHECKING
 
+from pydantic import PrivateAttr
+
 from semantic_kernel.filters.filter_context_base import FilterContextBase
 
 if TYPE_CHECKING:
+    from semantic_kernel.contents.chat_history import ChatHistory
     from semantic_kernel.functions.function_result import FunctionResult
 
 
@@ -14,6 +17,10 @@ class PromptRenderContext(FilterContextBase):
     When prompt rendering is expensive (for instance when there are expensive functions being called.)
     This filter can be used to set the rendered_prompt or function result directly and returning.
 
+    The prompt template can also provide the chat history the rendered prompt represents, so a chat completion
+    does not have to parse the rendered prompt. A filter that changes the rendered prompt does not have to
+    care about it, the chat history is only used as long as the rendered prompt is the one it was set with.
+
     Args:
         function: The function invoked.
         kernel: The kernel used.
@@ -26,3 +33,21 @@ class PromptRenderContext(FilterContextBase):
 
     rendered_prompt: str | None = None
     function_result: "FunctionResult | None" = None
+
+    _rendered_chat_history: "ChatHistory | None" = PrivateAttr(default=None)
+    _rendered_chat_history_prompt: str | None = PrivateAttr(default=None)
+
+    def set_rendered_prompt(self, rendered_prompt: str, chat_history: "ChatHistory | None" = None) -> None:
+        """Set the rendered prompt, together with the chat history it represents, when that is known."""
+        self.rendered_prompt = rendered_prompt
+        self._rendered_chat_history = chat_history
+        self._rendered_chat_history_prompt = rendered_prompt if chat_history is not None else None
+
+    def get_rendered_chat_history(self) -> "ChatHistory | None":
+        """Get the chat history the rendered prompt represents.
+
+        Returns None when it is not known, or when the rendered prompt was changed after it was set.
+        """
+        if self._rendered_chat_history is None or self.rendered_prompt != self._rendered_chat_history_prompt:
+            return None
+        return self._rendered_chat_history
@@ -6,8 +6,9 @@ from collections.abc import Mapping, Sequence
 from functools import singledispatchmethod
 from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 
+from semantic_kernel.connectors.ai.function_call_choice_configuration import FunctionCallChoiceConfiguration
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.exceptions import KernelFunctionNotFoundError, KernelPluginNotFoundError
 from semantic_kernel.functions.kernel_function_metadata import KernelFunctionMetadata
@@ -47,6 +48,11 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
 
     plugins: dict[str, KernelPlugin] = Field(default_factory=dict)
 
+    # The function call choice configurations by filters, with the functions they were created from
+    _function_call_choice_configurations: dict[Any, tuple[tuple[Any, ...], FunctionCallChoiceConfiguration]] = (
+        PrivateAttr(default_factory=dict)
+    )
+
     @field_validator("plugins", mode="before")
     @classmethod
     def rewrite_plugins(
@@ -397,3 +403,49 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
                     continue
                 result.append(function.metadata)
         return result
+
+    def get_function_call_choice_configuration(
+        self,
+        filters: dict[
+            Literal["excluded_plugins", "included_plugins", "excluded_functions", "included_functions"], list[str]
+        ]
+        | None = None,
+    ) -> FunctionCallChoiceConfiguration:
+        """Get the function call choice configuration with the functions that match the filters.
+
+        The configuration is cached by filters, and used again as long as the kernel has the same plugins
+        and functions. Adding or removing plugins or functions, also directly in the dictionaries of
+        the plugins, creates a new configuration. The configuration also caches its tools, see
+        `FunctionCallChoiceConfiguration.get_tools`, so it is shared and must not be changed.
+
+        Args:
+            filters: The filters to apply to the functions, see `get_list_of_function_metadata_filters`.
+                All functions are available when there are no filters.
+
+        Returns:
+            FunctionCallChoiceConfiguration: The configuration with the available functions.
+        """
+        functions = tuple(
+            (plugin_name, function)
+            for plugin_name, plugin in self.plugins.items()
+            for function in plugin.functions.values()
+        )
+        try:
+            key = tuple(sorted((name, tuple(values)) for name, values in filters.items())) if filters else None
+            hash(key)
+        except TypeError:
+            # Filters that are not lists of names are reported when the functions are filtered
+            return self._create_function_call_choice_configuration(filters)
+
+        cached = self._function_call_choice_configurations.get(key)
+        # The functions are compared by identity first, the cached entry keeps them alive
+        if cached is not None and cached[0] == functions:
+            return cached[1]
+        configuration = self._create_function_call_choice_configuration(filters)
+        self._function_call_choice_configurations[key] = (functions, configuration)
+        return configuration
+
+    def _create_function_call_choice_configuration(self, filters: Any) -> FunctionCallChoiceConfiguration:
+        if filters:
+            return FunctionCallChoiceConfiguration(available_functions=self.get_list_of_function_metadata(filters))
+        return FunctionCallChoiceConfiguration(available_functions=self.get_full_list_of_function_metadata())
@@ -1,10 +1,13 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import inspect
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from inspect import isasyncgen, isasyncgenfunction, isawaitable, iscoroutinefunction, isgenerator, isgeneratorfunction
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import Field, ValidationError
 
@@ -24,6 +27,8 @@ class KernelFunctionFromMethod(KernelFunction):
     method: Callable[..., Any] = Field(exclude=True)
     stream_method: Callable[..., Any] | None = Field(default=None, exclude=True)
 
+    _RUN_IN_THREAD_CONTEXT: ClassVar[ContextVar[bool]] = ContextVar("_RUN_IN_THREAD_CONTEXT", default=False)
+
     def __init__(
         self,
         method: Callable[..., Any],
@@ -100,7 +105,10 @@ class KernelFunctionFromMethod(KernelFunction):
     ) -> None:
         """Invoke the function with the given arguments."""
         function_arguments = self.gather_function_parameters(context)
-        result = self.method(**function_arguments)
+        if self._RUN_IN_THREAD_CONTEXT.get() and not self.metadata.is_asynchronous:
+            result = await asyncio.to_thread(self._call_sync_method, function_arguments)
+        else:
+            result = self.method(**function_arguments)
         if isasyncgen(result):
             result = [x async for x in result]
         elif isawaitable(result):
@@ -115,6 +123,24 @@ class KernelFunctionFromMethod(KernelFunction):
             )
         context.result = result
 
+    def _call_sync_method(self, function_arguments: dict[str, Any]) -> Any:
+        result = self.method(**function_arguments)
+        return list(result) if isgenerator(result) else result
+
+    @classmethod
+    @contextmanager
+    def run_sync_methods_in_thread(cls) -> Iterator[None]:
+        """Run the synchronous methods invoked within this context in a worker thread.
+
+        This keeps blocking or CPU-bound functions from blocking the event loop,
+        the setting is inherited by the tasks that are created within the context.
+        """
+        token = cls._RUN_IN_THREAD_CONTEXT.set(True)
+        try:
+            yield
+        finally:
+            cls._RUN_IN_THREAD_CONTEXT.reset(token)
+
     async def _invoke_internal_stream(self, context: FunctionInvocationContext) -> None:
         if self.stream_method is None:
             raise NotImplementedError("Stream method not implemented")
@@ -173,7 +173,9 @@ through prompt_template_config or in the prompt_template."
             return
 
         if isinstance(prompt_render_result.ai_service, ChatCompletionClientBase):
-            chat_history = ChatHistory.from_rendered_prompt(prompt_render_result.rendered_prompt)
+            chat_history = prompt_render_result.chat_history
+            if chat_history is None:
+                chat_history = ChatHistory.from_rendered_prompt(prompt_render_result.rendered_prompt)
             try:
                 chat_message_contents = await prompt_render_result.ai_service.get_chat_message_contents(
                     chat_history=chat_history,
@@ -246,7 +248,9 @@ through prompt_template_config or in the prompt_template."
             return
 
         if isinstance(prompt_render_result.ai_service, ChatCompletionClientBase):
-            chat_history = ChatHistory.from_rendered_prompt(prompt_render_result.rendered_prompt)
+            chat_history = prompt_render_result.chat_history
+            if chat_history is None:
+                chat_history = ChatHistory.from_rendered_prompt(prompt_render_result.rendered_prompt)
             value: AsyncGenerator = prompt_render_result.ai_service.get_streaming_chat_message_contents(
                 chat_history=chat_history,
                 settings=prompt_render_result.execution_settings,
@@ -294,11 +298,15 @@ through prompt_template_config or in the prompt_template."
             ai_service=selected_service[0],
             execution_settings=selected_service[1],
             function_result=prompt_render_context.function_result,
+            chat_history=prompt_render_context.get_rendered_chat_history(),
         )
 
     async def _inner_render_prompt(self, context: PromptRenderContext) -> None:
         """Render the prompt using the prompt template."""
-        context.rendered_prompt = await self.prompt_template.render(context.kernel, context.arguments)
+        rendered_prompt, chat_history = await self.prompt_template.render_with_chat_history(
+            context.kernel, context.arguments
+        )
+        context.set_rendered_prompt(rendered_prompt, chat_history)
 
     def _create_function_result(
         self,
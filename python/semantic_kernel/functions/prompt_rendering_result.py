@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.functions.function_result import FunctionResult
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 from semantic_kernel.services.ai_service_client_base import AIServiceClientBase
@@ -14,9 +15,11 @@ class PromptRenderingResult(KernelBaseModel):
         ai_service (Any): The AI service that rendered the prompt.
         execution_settings (PromptExecutionSettings): The execution settings for the prompt.
         function_result (FunctionResult): The result of executing the prompt.
+        chat_history (ChatHistory): The chat history the rendered prompt represents, None when it has to be parsed.
     """
 
     rendered_prompt: str
     ai_service: AIServiceClientBase
     execution_settings: PromptExecutionSettings
     function_result: FunctionResult | None = None
+    chat_history: ChatHistory | None = None
@@ -334,7 +334,11 @@ class Kernel(KernelFilterExtension, KernelFunctionExtension, KernelServicesExten
                 raise FunctionExecutionException("The function name is required.")
             if function_behavior is not None and function_behavior.filters:
                 allowed_functions = [
-                    func.fully_qualified_name for func in self.get_list_of_function_metadata(function_behavior.filters)
+                    func.fully_qualified_name
+                    for func in self.get_function_call_choice_configuration(
+                        function_behavior.filters
+                    ).available_functions
+                    or []
                 ]
                 if function_call.name not in allowed_functions:
                     raise FunctionExecutionException(
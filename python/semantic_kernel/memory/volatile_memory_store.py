@@ -2,8 +2,9 @@
 
 import logging
 import sys
-from copy import deepcopy
+from copy import copy, deepcopy
 
+import numpy as np
 from numpy import array, linalg, ndarray
 
 from semantic_kernel.exceptions import ServiceResourceNotFoundError
@@ -18,15 +19,109 @@ else:
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+class _NormalizedEmbeddingMatrix:
+    """The unit-length embeddings of a collection, stored as rows of a matrix.
+
+    Rows are appended on upsert and removed by moving the last row into their place,
+    so the matrix is always dense and can be scored with a single matrix multiplication.
+    Zero vectors are stored as zero rows and marked as invalid.
+    """
+
+    def __init__(self) -> None:
+        self.rows: ndarray = np.empty((0, 0))
+        self.valid: ndarray = np.empty(0, dtype=bool)
+        self.keys: list[str] = []
+        self.key_to_row: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def upsert(self, keys: list[str], embeddings: list[ndarray]) -> None:
+        # A key that is in the batch more than once gets its last embedding, like the records in the store
+        positions = {key: position for position, key in enumerate(keys)}
+        if len(positions) < len(keys):
+            keys = list(positions)
+            embeddings = [embeddings[position] for position in positions.values()]
+        vectors = np.asarray(embeddings, dtype=float).reshape(len(embeddings), -1)
+        if len(self) and vectors.shape[1] != self.rows.shape[1]:
+            raise ValueError(
+                f"Embeddings with {vectors.shape[1]} dimensions can not be added to a collection "
+                f"with {self.rows.shape[1]} dimensions"
+            )
+        norms = linalg.norm(vectors, axis=1)
+        valid = norms != 0
+        vectors[valid] /= norms[valid, None]
+        new_rows = []
+        for key, vector, is_valid in zip(keys, vectors, valid):
+            if (row := self.key_to_row.get(key)) is not None:
+                self.rows[row] = vector
+                self.valid[row] = is_valid
+                continue
+            self.key_to_row[key] = len(self.keys) + len(new_rows)
+            new_rows.append((key, vector, is_valid))
+        if not new_rows:
+            return
+        if not len(self):
+            self.rows = np.empty((0, vectors.shape[1]))
+        self.keys.extend(key for key, _, _ in new_rows)
+        self._ensure_capacity(len(self.keys))
+        start = len(self.keys) - len(new_rows)
+        self.rows[start : len(self.keys)] = [vector for _, vector, _ in new_rows]
+        self.valid[start : len(self.keys)] = [is_valid for _, _, is_valid in new_rows]
+
+    def _ensure_capacity(self, required: int) -> None:
+        capacity = self.rows.shape[0]
+        if required <= capacity:
+            return
+        new_capacity = max(required, capacity * 2)
+        rows = np.empty((new_capacity, self.rows.shape[1]))
+        rows[:capacity] = self.rows
+        valid = np.zeros(new_capacity, dtype=bool)
+        valid[:capacity] = self.valid
+        self.rows, self.valid = rows, valid
+
+    def remove(self, keys: list[str]) -> None:
+        for key in keys:
+            if (row := self.key_to_row.pop(key, None)) is None:
+                continue
+            last = len(self.keys) - 1
+            last_key = self.keys.pop()
+            if row != last:
+                self.rows[row] = self.rows[last]
+                self.valid[row] = self.valid[last]
+                self.keys[row] = last_key
+                self.key_to_row[last_key] = row
+
+    def score(self, queries: ndarray) -> ndarray:
+        """Get the cosine similarity of every query with every row, as a (queries, rows) matrix.
+
+        Rows with a zero vector get a score of -1.
+        """
+        query_norms = linalg.norm(queries, axis=1)
+        if not query_norms.all():
+            raise ValueError(f"Invalid vectors, cannot compute cosine similarity scores for zero vectors {queries}")
+        scores = (queries / query_norms[:, None]) @ self.rows[: len(self)].T
+        valid = self.valid[: len(self)]
+        if not valid.all():
+            logger.warning(
+                "Some vectors in the embedding collection are zero vectors."
+                "Ignoring cosine similarity score computation for those vectors."
+            )
+            scores[:, ~valid] = -1.0
+        return scores
+
+
 @deprecated("This class will be removed in a future version. Please use the InMemoryStore and Collection instead.")
 class VolatileMemoryStore(MemoryStoreBase):
     """A volatile memory store that stores data in memory."""
 
     _store: dict[str, dict[str, MemoryRecord]]
+    _matrices: dict[str, _NormalizedEmbeddingMatrix]
 
     def __init__(self) -> None:
         """Initializes a new instance of the VolatileMemoryStore class."""
         self._store = {}
+        self._matrices = {}
 
     async def create_collection(self, collection_name: str) -> None:
         """Creates a new collection if it does not exist.
@@ -41,6 +136,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             pass
         else:
             self._store[collection_name] = {}
+            self._matrices[collection_name] = _NormalizedEmbeddingMatrix()
 
     async def get_collections(
         self,
@@ -63,6 +159,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         """
         if collection_name in self._store:
             del self._store[collection_name]
+            del self._matrices[collection_name]
 
     async def does_collection_exist(self, collection_name: str) -> bool:
         """Checks if a collection exists.
@@ -88,9 +185,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         if collection_name not in self._store:
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
-        record._key = record._id
-        self._store[collection_name][record._key] = record
-        return record._key
+        return (await self.upsert_batch(collection_name, [record]))[0]
 
     async def upsert_batch(self, collection_name: str, records: list[MemoryRecord]) -> list[str]:
         """Upserts a batch of records.
@@ -105,6 +200,9 @@ class VolatileMemoryStore(MemoryStoreBase):
         if collection_name not in self._store:
             raise ServiceResourceNotFoundError(f"Collection '{collection_name}' does not exist")
 
+        self._matrices[collection_name].upsert(
+            [record._id for record in records], [record._embedding for record in records]
+        )
         for record in records:
             record._key = record._id
             self._store[collection_name][record._key] = record
@@ -177,6 +275,7 @@ class VolatileMemoryStore(MemoryStoreBase):
             raise ServiceResourceNotFoundError(f"Key '{key}' not found in collection '{collection_name}'")
 
         del self._store[collection_name][key]
+        self._matrices[collection_name].remove([key])
 
     async def remove_batch(self, collection_name: str, keys: list[str]) -> None:
         """Removes a batch of records.
@@ -194,6 +293,7 @@ class VolatileMemoryStore(MemoryStoreBase):
         for key in keys:
             if key in self._store[collection_name]:
                 del self._store[collection_name][key]
+        self._matrices[collection_name].remove(keys)
 
     async def get_nearest_match(
         self,
@@ -213,13 +313,14 @@ class VolatileMemoryStore(MemoryStoreBase):
         Returns:
             Tuple[MemoryRecord, float]: The record and the relevance score.
         """
-        return self.get_nearest_matches(
+        matches = await self.get_nearest_matches(
             collection_name=collection_name,
             embedding=embedding,
             limit=1,
             min_relevance_score=min_relevance_score,
             with_embeddings=with_embedding,
         )
+        return matches[0] if matches else None  # type: ignore[return-value]
 
     async def get_nearest_matches(
         self,
@@ -241,50 +342,70 @@ class VolatileMemoryStore(MemoryStoreBase):
         Returns:
             List[Tuple[MemoryRecord, float]]: The records and their relevance scores.
         """
-        if collection_name not in self._store:
-            logger.warning(
-                f"Collection '{collection_name}' does not exist in collections: "
-                f"{', '.join([collection for collection in await self.get_collections()])}"
+        return (
+            await self.get_nearest_matches_batch(
+                collection_name=collection_name,
+                embeddings=embedding.reshape(1, -1),
+                limit=limit,
+                min_relevance_score=min_relevance_score,
+                with_embeddings=with_embeddings,
             )
-            return []
-
-        # Get all the records in the collection
-        memory_records = list(self._store[collection_name].values())
-
-        # Convert the collection of embeddings into a numpy array (stacked)
-        embeddings = array([x._embedding for x in memory_records], dtype=float)
-        embeddings = embeddings.reshape(embeddings.shape[0], -1)
-
-        # If the query embedding has shape (1, embedding_size),
-        # reshape it to (embedding_size,)
-        if len(embedding.shape) == 2:
-            embedding = embedding.reshape(
-                embedding.shape[1],
-            )
-
-        # Use numpy to get the cosine similarity between the query
-        # embedding and all the embeddings in the collection
-        similarity_scores = self.compute_similarity_scores(embedding, embeddings)
+        )[0]
 
-        # Then, sort the results by the similarity score
-        sorted_results = sorted(
-            zip(memory_records, similarity_scores),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+    async def get_nearest_matches_batch(
+        self,
+        collection_name: str,
+        embeddings: ndarray | list[ndarray],
+        limit: int,
+        min_relevance_score: float = 0.0,
+        with_embeddings: bool = False,
+    ) -> list[list[tuple[MemoryRecord, float]]]:
+        """Gets the nearest matches to each of a batch of embeddings using cosine similarity.
 
-        # Then, filter out the results that are below the minimum relevance score
-        filtered_results = [x for x in sorted_results if x[1] >= min_relevance_score]
+        All the queries are scored with a single matrix multiplication.
 
-        # Then, take the top N results
-        top_results = filtered_results[:limit]
+        Args:
+            collection_name (str): The name of the collection to get the nearest matches from.
+            embeddings (ndarray | List[ndarray]): The embeddings to find the nearest matches to, one per row.
+            limit (int): The maximum number of matches to return per embedding.
+            min_relevance_score (float): The minimum relevance score of the matches. (default: {0.0})
+            with_embeddings (bool): Whether to include the embeddings in the results. (default: {False})
 
-        if not with_embeddings:
-            # create copy of results without embeddings
-            for result in top_results:
-                result = deepcopy(result)
-                result[0]._embedding = None
-        return top_results
+        Returns:
+            List[List[Tuple[MemoryRecord, float]]]: The records and their relevance scores, per embedding.
+        """
+        queries = np.asarray(embeddings, dtype=float)
+        queries = queries.reshape(queries.shape[0], -1)
+        if collection_name not in self._store:
+            logger.warning(
+                f"Collection '{collection_name}' does not exist in collections: "
+                f"{', '.join([collection for collection in await self.get_collections()])}"
+            )
+            return [[] for _ in range(queries.shape[0])]
+
+        matrix = self._matrices[collection_name]
+        if not len(matrix) or limit <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        scores = matrix.score(queries)
+        records = self._store[collection_name]
+        top = min(limit, len(matrix))
+        results: list[list[tuple[MemoryRecord, float]]] = []
+        for query_scores in scores:
+            rows = np.argpartition(-query_scores, top - 1)[:top] if top < len(matrix) else np.arange(len(matrix))
+            rows = rows[np.argsort(-query_scores[rows], kind="stable")]
+            matches = []
+            for row in rows:
+                score = float(query_scores[row])
+                if score < min_relevance_score:
+                    break
+                record = records[matrix.keys[row]]
+                if not with_embeddings:
+                    # create copy of the record without the embedding
+                    record = copy(record)
+                    record._embedding = None  # type: ignore[assignment]
+                matches.append((record, score))
+            results.append(matches)
+        return results
 
     def compute_similarity_scores(self, embedding: ndarray, embedding_array: ndarray) -> ndarray:
         """Computes the cosine similarity scores between a query embedding and a group of embeddings.
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 from semantic_kernel.exceptions.process_exceptions import ProcessInvalidConfigurationException
 from semantic_kernel.processes.local_runtime.local_event import KernelProcessEvent
 from semantic_kernel.processes.local_runtime.local_kernel_process_context import LocalKernelProcessContext
+from semantic_kernel.processes.local_runtime.local_process_checkpoint import ProcessCheckpointStore
+from semantic_kernel.processes.local_runtime.local_process_scheduling import LocalProcessSchedulingOptions
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 if TYPE_CHECKING:
@@ -19,6 +21,10 @@ async def start(
     kernel: "Kernel",
     initial_event: KernelProcessEvent | str | Enum,
     max_supersteps: int | None = None,
+    scheduling_options: LocalProcessSchedulingOptions | None = None,
+    checkpoint_store: ProcessCheckpointStore | None = None,
+    checkpoint_id: str | None = None,
+    resume: bool = False,
     **kwargs,
 ) -> LocalKernelProcessContext:
     """Start the kernel process.
@@ -29,6 +35,12 @@ async def start(
         initial_event: The initial event to start the process with.
         max_supersteps: The maximum number of supersteps. This is the total number of times process steps will run.
                 Defaults to None, and thus the process will run its steps 100 times.
+        scheduling_options: The options for scheduling the steps, use the `Dataflow` mode to run a step as soon as
+                its inputs arrive instead of waiting for all steps of a superstep. Defaults to None.
+        checkpoint_store: The store to save a checkpoint to at every superstep, so the process can be resumed
+                after a crash. Defaults to None.
+        checkpoint_id: The id of the checkpoint. Defaults to None, and thus the name of the process.
+        resume: Resume the process from its checkpoint, the initial event is only sent when there is no checkpoint.
         **kwargs: Additional keyword arguments.
     """
     if process is None:
@@ -47,6 +59,11 @@ async def start(
     if isinstance(initial_event_str, str):
         initial_event_str = KernelProcessEvent(id=initial_event_str, data=kwargs.get("data"))
 
-    process_context = LocalKernelProcessContext(process, kernel, max_supersteps)
-    await process_context.start_with_event(initial_event_str)
+    process_context = LocalKernelProcessContext(
+        process, kernel, max_supersteps, scheduling_options, checkpoint_store, checkpoint_id
+    )
+    if resume:
+        await process_context.resume(initial_event_str)
+    else:
+        await process_context.start_with_event(initial_event_str)
     return process_context
@@ -10,6 +10,8 @@ from semantic_kernel.utils.feature_stage_decorator import experimental
 if TYPE_CHECKING:
     from semantic_kernel.processes.kernel_process.kernel_process import KernelProcess
     from semantic_kernel.processes.local_runtime.local_event import KernelProcessEvent
+    from semantic_kernel.processes.local_runtime.local_process_checkpoint import ProcessCheckpointStore
+    from semantic_kernel.processes.local_runtime.local_process_scheduling import LocalProcessSchedulingOptions
 
 
 @experimental
@@ -18,7 +20,15 @@ class LocalKernelProcessContext(KernelBaseModel):
 
     local_process: LocalProcess
 
-    def __init__(self, process: "KernelProcess", kernel: "Kernel", max_supersteps: int | None = None) -> None:
+    def __init__(
+        self,
+        process: "KernelProcess",
+        kernel: "Kernel",
+        max_supersteps: int | None = None,
+        scheduling_options: "LocalProcessSchedulingOptions | None" = None,
+        checkpoint_store: "ProcessCheckpointStore | None" = None,
+        checkpoint_id: str | None = None,
+    ) -> None:
         """Initializes the local kernel process context.
 
         Args:
@@ -26,6 +36,10 @@ class LocalKernelProcessContext(KernelBaseModel):
             kernel: The kernel instance.
             max_supersteps: The maximum number of supersteps. This is the total number of times process steps will run.
                 Defaults to None.
+            scheduling_options: The options for scheduling the steps of the process. Defaults to None,
+                and thus the steps run in supersteps.
+            checkpoint_store: The store to save a checkpoint to at every superstep. Defaults to None.
+            checkpoint_id: The id of the checkpoint. Defaults to None, and thus the name of the process.
         """
         from semantic_kernel.processes.kernel_process.kernel_process import KernelProcess  # noqa: F401
 
@@ -42,6 +56,9 @@ class LocalKernelProcessContext(KernelBaseModel):
             parent_process_id=None,
             factories=process.factories,
             max_supersteps=max_supersteps,
+            scheduling_options=scheduling_options,
+            checkpoint_store=checkpoint_store,
+            checkpoint_id=checkpoint_id,
         )
 
         super().__init__(local_process=local_process)  # type: ignore
@@ -50,6 +67,10 @@ class LocalKernelProcessContext(KernelBaseModel):
         """Starts the local process with an initial event."""
         await self.local_process.run_once(initial_event)
 
+    async def resume(self, initial_event: "KernelProcessEvent") -> None:
+        """Resumes the local process from its checkpoint, or starts it with the initial event if there is none."""
+        await self.local_process.run_once(initial_event, resume=True)
+
     async def send_event(self, process_event: "KernelProcessEvent") -> None:
         """Sends an event to the process."""
         await self.local_process.send_message(process_event)
@@ -2,16 +2,22 @@
 
 import asyncio
 import contextlib
+import json
 import logging
 import uuid
+from collections import deque
 from collections.abc import Callable
 from queue import Queue
 from typing import TYPE_CHECKING, Any
 
-from pydantic import Field
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic_core import to_jsonable_python
 
 from semantic_kernel.exceptions import KernelException
-from semantic_kernel.exceptions.process_exceptions import ProcessEventUndefinedException
+from semantic_kernel.exceptions.process_exceptions import (
+    ProcessEventUndefinedException,
+    ProcessInvalidConfigurationException,
+)
 from semantic_kernel.kernel import Kernel
 from semantic_kernel.processes.const import END_PROCESS_ID
 from semantic_kernel.processes.kernel_process.kernel_process_state import KernelProcessState
@@ -23,7 +29,14 @@ from semantic_kernel.processes.local_runtime.local_event import (
 )
 from semantic_kernel.processes.local_runtime.local_message import LocalMessage
 from semantic_kernel.processes.local_runtime.local_message_factory import LocalMessageFactory
+from semantic_kernel.processes.local_runtime.local_process_checkpoint import ProcessCheckpointStore
+from semantic_kernel.processes.local_runtime.local_process_scheduling import (
+    LocalProcessSchedulingMode,
+    LocalProcessSchedulingOptions,
+)
 from semantic_kernel.processes.local_runtime.local_step import LocalStep
+from semantic_kernel.processes.process_state_metadata_utils import to_process_state_metadata
+from semantic_kernel.processes.process_types import get_generic_state_type
 from semantic_kernel.utils.feature_stage_decorator import experimental
 
 if TYPE_CHECKING:
@@ -31,6 +44,9 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_CHECKPOINT_PROCESS_KEY = "process"
+_CHECKPOINT_STEP_KEY_PREFIX = "step:"
+
 
 @experimental
 class LocalProcess(LocalStep):
@@ -47,6 +63,14 @@ class LocalProcess(LocalStep):
     max_supersteps: int = Field(
         default=100, ge=1, description="Maximum number of supersteps to execute before stopping the process."
     )
+    scheduling_options: LocalProcessSchedulingOptions = Field(default_factory=LocalProcessSchedulingOptions)
+    checkpoint_store: ProcessCheckpointStore | None = None
+    checkpoint_id: str | None = None
+
+    _step_semaphores: dict[str, asyncio.Semaphore] = PrivateAttr(default_factory=dict)
+    _checkpoint_entries: dict[str, str] = PrivateAttr(default_factory=dict)
+    _resume_superstep: int = PrivateAttr(default=0)
+    _resume_messages: list[LocalMessage] = PrivateAttr(default_factory=list)
 
     def __init__(
         self,
@@ -55,8 +79,22 @@ class LocalProcess(LocalStep):
         factories: dict[str, Callable] | None = None,
         parent_process_id: str | None = None,
         max_supersteps: int | None = None,
+        scheduling_options: LocalProcessSchedulingOptions | None = None,
+        checkpoint_store: ProcessCheckpointStore | None = None,
+        checkpoint_id: str | None = None,
     ):
-        """Initializes the local process."""
+        """Initializes the local process.
+
+        Args:
+            process: The kernel process to run.
+            kernel: The kernel instance.
+            factories: The factories that create the step instances, by fully qualified step type name.
+            parent_process_id: The id of the parent process, when the process is a step of another process.
+            max_supersteps: The maximum number of supersteps to execute before stopping the process.
+            scheduling_options: The options for scheduling the steps of the process.
+            checkpoint_store: The store to save a checkpoint to at every superstep, so the process can be resumed.
+            checkpoint_id: The id of the checkpoint, defaults to the name of the process.
+        """
         args: dict[str, Any] = {
             "step_info": process,
             "kernel": kernel,
@@ -72,6 +110,13 @@ class LocalProcess(LocalStep):
         if factories:
             args["factories"] = factories
 
+        if scheduling_options is not None:
+            args["scheduling_options"] = scheduling_options
+
+        if checkpoint_store is not None:
+            args["checkpoint_store"] = checkpoint_store
+            args["checkpoint_id"] = checkpoint_id
+
         super().__init__(**args)
 
     def ensure_initialized(self):
@@ -80,26 +125,34 @@ class LocalProcess(LocalStep):
             self.initialize_process()
             self.initialize_task = True
 
-    async def start(self, keep_alive: bool = True) -> None:
+    async def start(self, keep_alive: bool = True, resume: bool = False) -> None:
         """Starts the process with an initial event.
 
         Args:
             keep_alive: Indicates if the process should wait for external events after it's finished processing.
+            resume: Resume the process from the checkpoint in the checkpoint store, if there is one.
         """
+        if self.checkpoint_store is not None and self.scheduling_options.mode != LocalProcessSchedulingMode.Superstep:
+            raise ProcessInvalidConfigurationException("Checkpoints are only supported in the superstep mode.")
         self.ensure_initialized()
+        if resume:
+            await self.restore_checkpoint()
         self.process_task = asyncio.create_task(
             self.internal_execute(max_supersteps=self.max_supersteps, keep_alive=keep_alive)
         )
 
-    async def run_once(self, process_event: KernelProcessEvent):
+    async def run_once(self, process_event: KernelProcessEvent, resume: bool = False):
         """Starts the process with an initial event and waits for it to finish.
 
         Args:
             process_event: The KernelProcessEvent to start the process with.
+            resume: Resume the process from the checkpoint in the checkpoint store, if there is one.
+                The event is only sent when there is no checkpoint, otherwise it was handled before the checkpoint.
         """
         if process_event is None:
             raise ProcessEventUndefinedException("The process event must be specified.")
-        self.external_event_queue.put(process_event)
+        if not (resume and await self.restore_checkpoint()):
+            self.external_event_queue.put(process_event)
         await self.start(keep_alive=False)
         if self.process_task:
             await self.process_task
@@ -154,6 +207,7 @@ class LocalProcess(LocalStep):
                     kernel=self.kernel,
                     factories=self.factories,
                     parent_process_id=self.id,
+                    scheduling_options=self.scheduling_options,
                 )
 
                 local_step = process
@@ -161,12 +215,18 @@ class LocalProcess(LocalStep):
                 # The current step should already have an Id.
                 assert step.state and step.state.id is not None  # nosec
 
+                # CPU-bound steps invoke their functions in the thread pool
+                thread_pool_args: dict[str, Any] = {}
+                if step.state.name in self.scheduling_options.thread_pool_steps:
+                    thread_pool_args = {"run_in_thread_pool": True, "executor": self.scheduling_options.executor}
+
                 # Create a LocalStep for the step
                 local_step = LocalStep(  # type: ignore
                     step_info=step,
                     kernel=self.kernel,
                     factories=self.factories,
                     parent_process_id=self.id,
+                    **thread_pool_args,
                 )
 
             # Add the local step to the list of steps
@@ -190,12 +250,23 @@ class LocalProcess(LocalStep):
 
     async def internal_execute(self, max_supersteps: int = 100, keep_alive: bool = True):
         """Internal execution logic for the process."""
+        if self.scheduling_options.mode == LocalProcessSchedulingMode.Dataflow:
+            await self._execute_dataflow(max_supersteps)
+            return
+
         message_channel: Queue[LocalMessage] = Queue()
+        steps_by_id = {step.id: step for step in self.steps}
+
+        # A resumed process continues with the superstep and the messages of the checkpoint
+        first_superstep = self._resume_superstep
+        for message in self._resume_messages:
+            message_channel.put(message)
+        self._resume_superstep, self._resume_messages = 0, []
 
         logger.debug(f"Running process for {max_supersteps} supersteps.")
 
         try:
-            for _ in range(max_supersteps):
+            for superstep in range(first_superstep, max_supersteps):
                 self.enqueue_external_messages(message_channel)
                 for step in self.steps:
                     await self.enqueue_step_messages(step, message_channel)
@@ -204,6 +275,9 @@ class LocalProcess(LocalStep):
                 while not message_channel.empty():
                     messages_to_process.append(message_channel.get())
 
+                if self.checkpoint_store is not None:
+                    await self.save_checkpoint(superstep, messages_to_process)
+
                 if not messages_to_process and (not keep_alive or self.external_event_queue.empty()):
                     break
 
@@ -212,14 +286,189 @@ class LocalProcess(LocalStep):
                     if message.destination_id == END_PROCESS_ID:
                         break
 
-                    destination_step = next(step for step in self.steps if step.id == message.destination_id)
-                    message_tasks.append(destination_step.handle_message(message))
+                    destination_step = steps_by_id[message.destination_id]
+                    message_tasks.append(self._handle_step_message(destination_step, message))
 
                 await asyncio.gather(*message_tasks)
+            else:
+                if self.checkpoint_store is not None:
+                    # Out of supersteps, the checkpoint keeps the messages that were not handled
+                    for step in self.steps:
+                        await self.enqueue_step_messages(step, message_channel)
+                    await self.save_checkpoint(max_supersteps, list(message_channel.queue))
+
+        except Exception as ex:
+            logger.error(f"An error occurred while running the process: {ex}.")
+            raise
+
+    async def _execute_dataflow(self, max_supersteps: int) -> None:
+        """Dispatches every message as soon as it is emitted, instead of waiting for all steps of a superstep.
+
+        A message carries its superstep, which is the superstep of the message its step handled plus one,
+        so a cycle of steps stops after `max_supersteps` like in superstep mode.
+        """
+        steps_by_id = {step.id: step for step in self.steps}
+        ready: deque[tuple[LocalMessage, int]] = deque()
+        running: dict[asyncio.Task, tuple[LocalStep, int]] = {}
+        ended = False
+
+        logger.debug(f"Running process with the dataflow scheduler for {max_supersteps} supersteps.")
+
+        try:
+            while True:
+                external_messages: Queue[LocalMessage] = Queue()
+                self.enqueue_external_messages(external_messages)
+                ready.extend((message, 0) for message in external_messages.queue)
+
+                while ready and not ended:
+                    message, superstep = ready.popleft()
+                    if message.destination_id == END_PROCESS_ID:
+                        ended = True
+                        break
+                    if superstep >= max_supersteps:
+                        logger.warning(
+                            f"Dropping message for step `{message.destination_id}` after {max_supersteps} supersteps."
+                        )
+                        continue
+
+                    destination_step = steps_by_id[message.destination_id]
+                    task = asyncio.create_task(self._handle_step_message(destination_step, message))
+                    running[task] = (destination_step, superstep)
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step, superstep = running.pop(task)
+                    task.result()
+
+                    step_messages: Queue[LocalMessage] = Queue()
+                    await self.enqueue_step_messages(step, step_messages)
+                    ready.extend((message, superstep + 1) for message in step_messages.queue)
 
         except Exception as ex:
             logger.error(f"An error occurred while running the process: {ex}.")
             raise
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def save_checkpoint(self, superstep: int, pending_messages: list[LocalMessage]) -> None:
+        """Saves the state of the steps and the pending messages to the checkpoint store.
+
+        Only the steps that were initialized are saved, the store is passed the entries that changed
+        since the previous checkpoint. Message values and step inputs must be json serializable.
+
+        Args:
+            superstep: The superstep that handles the pending messages.
+            pending_messages: The messages that were not handled yet.
+        """
+        if self.checkpoint_store is None:
+            raise ProcessInvalidConfigurationException("The process does not have a checkpoint store.")
+
+        # Step ids are generated when the process is built, so steps are referenced by name
+        names_by_id = {step.id: step.name for step in self.steps}
+        messages = []
+        for message in pending_messages:
+            data = message.model_dump(mode="json")
+            data["source_id"] = names_by_id.get(message.source_id, message.source_id)
+            data["destination_id"] = names_by_id.get(message.destination_id, message.destination_id)
+            messages.append(data)
+        entries = {_CHECKPOINT_PROCESS_KEY: json.dumps({"superstep": superstep, "messages": messages})}
+
+        for step in self.steps:
+            if not step.initialize_task:
+                continue
+            metadata = to_process_state_metadata(await step.to_kernel_process_step_info())
+            step_entry: dict[str, Any] = {"state": metadata.model_dump(mode="json", by_alias=True)}
+            if not isinstance(step, LocalProcess):
+                # Only the received inputs are saved, the initial inputs contain the step context
+                step_entry["inputs"] = to_jsonable_python({
+                    function_name: {
+                        name: value
+                        for name, value in inputs.items()
+                        if value is not step.initial_inputs.get(function_name, {}).get(name)
+                    }
+                    for function_name, inputs in step.inputs.items()
+                })
+            entries[f"{_CHECKPOINT_STEP_KEY_PREFIX}{step.name}"] = json.dumps(step_entry)
+
+        changed_keys = [key for key, value in entries.items() if self._checkpoint_entries.get(key) != value]
+        if changed_keys:
+            await self.checkpoint_store.save(self.checkpoint_id or self.name, entries, changed_keys)
+        self._checkpoint_entries = entries
+
+    async def restore_checkpoint(self) -> bool:
+        """Restores the state of the steps and the pending messages from the checkpoint store.
+
+        Returns:
+            True when a checkpoint was restored, False when the store does not contain a checkpoint for the process.
+        """
+        if self.checkpoint_store is None:
+            raise ProcessInvalidConfigurationException("The process does not have a checkpoint store.")
+
+        entries = await self.checkpoint_store.load(self.checkpoint_id or self.name)
+        if not entries or _CHECKPOINT_PROCESS_KEY not in entries:
+            return False
+
+        self.ensure_initialized()
+        for step in self.steps:
+            step_entry = entries.get(f"{_CHECKPOINT_STEP_KEY_PREFIX}{step.name}")
+            if step_entry is not None:
+                await self._restore_step(step, json.loads(step_entry))
+
+        process_entry = json.loads(entries[_CHECKPOINT_PROCESS_KEY])
+        ids_by_name = {step.name: step.id for step in self.steps}
+        self._resume_messages = []
+        for data in process_entry["messages"]:
+            data["source_id"] = ids_by_name.get(data["source_id"], data["source_id"])
+            data["destination_id"] = ids_by_name.get(data["destination_id"], data["destination_id"])
+            self._resume_messages.append(LocalMessage.model_validate(data))
+        self._resume_superstep = process_entry["superstep"]
+        self._checkpoint_entries = entries
+        logger.info(f"Resuming process {self.name} at superstep {self._resume_superstep}.")
+        return True
+
+    @classmethod
+    async def _restore_step(cls, step: LocalStep, step_entry: dict[str, Any]) -> None:
+        """Restores the state of a step, before the step is initialized."""
+        state_metadata = step_entry["state"]
+        if isinstance(step, LocalProcess):
+            step.ensure_initialized()
+            steps_state = state_metadata.get("stepsState") or {}
+            for inner_step in step.steps:
+                if (inner_metadata := steps_state.get(inner_step.name)) is not None:
+                    await cls._restore_step(inner_step, {"state": inner_metadata})
+            return
+
+        state = state_metadata.get("state")
+        state_type = get_generic_state_type(step.step_info.inner_step_type)
+        if state_type is not None and state is not None:
+            step.step_info.state.state = (
+                state_type.model_validate(state) if issubclass(state_type, BaseModel) else state_type(**state)
+            )
+
+        if "inputs" in step_entry:
+            async with step.init_lock:
+                if not step.initialize_task:
+                    await step.initialize_step()
+                    step.initialize_task = True
+            for function_name, inputs in step_entry["inputs"].items():
+                step.inputs.setdefault(function_name, {}).update(inputs)
+
+    async def _handle_step_message(self, step: LocalStep, message: LocalMessage) -> None:
+        """Handles a message with a step, within the concurrency limit of the step."""
+        semaphore = self._step_semaphores.get(step.id)
+        if semaphore is None:
+            max_concurrency = self.scheduling_options.get_max_concurrency(step.name)
+            if max_concurrency is None:
+                await step.handle_message(message)
+                return
+            semaphore = self._step_semaphores[step.id] = asyncio.Semaphore(max_concurrency)
+
+        async with semaphore:
+            await step.handle_message(message)
 
     async def to_kernel_process(self) -> "KernelProcess":
         """Builds a KernelProcess from the current LocalProcess."""
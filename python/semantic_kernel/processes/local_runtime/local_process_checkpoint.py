@@ -0,0 +1,128 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+
+@experimental
+class ProcessCheckpointStore(KernelBaseModel, ABC):
+    """Stores the checkpoints of local processes.
+
+    A checkpoint is a set of entries, the serialized state of the process and of every step, so a store
+    can write only the entries that changed since the previous checkpoint.
+    """
+
+    @abstractmethod
+    async def save(self, checkpoint_id: str, entries: dict[str, str], changed_keys: Iterable[str]) -> None:
+        """Save a checkpoint.
+
+        Args:
+            checkpoint_id: The id of the checkpoint.
+            entries: All entries of the checkpoint, by key.
+            changed_keys: The keys of the entries that changed since the previous save of this checkpoint.
+        """
+
+    @abstractmethod
+    async def load(self, checkpoint_id: str) -> dict[str, str] | None:
+        """Load the entries of a checkpoint, None when there is no checkpoint with the id."""
+
+    @abstractmethod
+    async def delete(self, checkpoint_id: str) -> None:
+        """Delete a checkpoint."""
+
+
+@experimental
+class FileProcessCheckpointStore(ProcessCheckpointStore):
+    """Stores every checkpoint as a json file in a directory.
+
+    The file is replaced atomically, so a crash while saving leaves the previous checkpoint intact.
+    """
+
+    directory: Path
+
+    def _get_path(self, checkpoint_id: str) -> Path:
+        return self.directory / f"{checkpoint_id}.json"
+
+    async def save(self, checkpoint_id: str, entries: dict[str, str], changed_keys: Iterable[str]) -> None:
+        """Save a checkpoint."""
+        await asyncio.to_thread(self._save, checkpoint_id, entries)
+
+    def _save(self, checkpoint_id: str, entries: dict[str, str]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            os.replace(temp_path, self._get_path(checkpoint_id))
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    async def load(self, checkpoint_id: str) -> dict[str, str] | None:
+        """Load the entries of a checkpoint, None when there is no checkpoint with the id."""
+        path = self._get_path(checkpoint_id)
+        if not path.exists():
+            return None
+        return json.loads(await asyncio.to_thread(path.read_text, encoding="utf-8"))
+
+    async def delete(self, checkpoint_id: str) -> None:
+        """Delete a checkpoint."""
+        self._get_path(checkpoint_id).unlink(missing_ok=True)
+
+
+@experimental
+class SqliteProcessCheckpointStore(ProcessCheckpointStore):
+    """Stores the checkpoints in a sqlite database, with a row per entry.
+
+    Only the entries that changed are written, in a single transaction, so a checkpoint is saved
+    incrementally and a crash while saving leaves the previous checkpoint intact.
+    """
+
+    path: Path
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS process_checkpoints "
+            "(checkpoint_id TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (checkpoint_id, key))"
+        )
+        return connection
+
+    async def save(self, checkpoint_id: str, entries: dict[str, str], changed_keys: Iterable[str]) -> None:
+        """Save the changed entries of a checkpoint."""
+        rows = [(checkpoint_id, key, entries[key]) for key in changed_keys]
+        if rows:
+            await asyncio.to_thread(self._execute, "INSERT OR REPLACE INTO process_checkpoints VALUES (?, ?, ?)", rows)
+
+    async def load(self, checkpoint_id: str) -> dict[str, str] | None:
+        """Load the entries of a checkpoint, None when there is no checkpoint with the id."""
+        rows = await asyncio.to_thread(
+            self._execute, "SELECT key, value FROM process_checkpoints WHERE checkpoint_id = ?", [(checkpoint_id,)]
+        )
+        return dict(rows) if rows else None
+
+    async def delete(self, checkpoint_id: str) -> None:
+        """Delete a checkpoint."""
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM process_checkpoints WHERE checkpoint_id = ?", [(checkpoint_id,)]
+        )
+
+    def _execute(self, statement: str, parameters: list[tuple[str, ...]]) -> list[tuple[str, str]]:
+        connection = self._connect()
+        try:
+            with connection:
+                if len(parameters) == 1:
+                    return connection.execute(statement, parameters[0]).fetchall()
+                connection.executemany(statement, parameters)
+                return []
+        finally:
+            connection.close()
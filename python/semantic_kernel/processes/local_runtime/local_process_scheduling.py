@@ -0,0 +1,56 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from concurrent.futures import Executor
+from enum import Enum
+
+from pydantic import Field, SkipValidation, field_validator
+
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.utils.feature_stage_decorator import experimental
+
+
+@experimental
+class LocalProcessSchedulingMode(str, Enum):
+    """How a local process schedules the messages between its steps."""
+
+    Superstep = "superstep"
+    """All pending messages are handled together, the next messages are collected when all steps finished."""
+    Dataflow = "dataflow"
+    """A message is handled as soon as it is emitted, without waiting for the other steps."""
+
+
+@experimental
+class LocalProcessSchedulingOptions(KernelBaseModel):
+    """Options for scheduling the steps of a local process.
+
+    In `Dataflow` mode the number of supersteps of a process is the length of the longest chain of messages,
+    so `max_supersteps` limits cycles in the same way in both modes.
+
+    Attributes:
+        mode: How the messages between steps are scheduled.
+        max_concurrency_per_step: The maximum number of messages a step handles at the same time,
+            either for all steps or by step name. None for no limit.
+        thread_pool_steps: The names of the steps whose functions run in a thread pool, use this for CPU-bound
+            steps so they do not block the other steps. The function runs in its own event loop in the thread.
+        executor: The executor for the thread pool steps, None for the default executor of the event loop.
+    """
+
+    mode: LocalProcessSchedulingMode = LocalProcessSchedulingMode.Superstep
+    max_concurrency_per_step: int | dict[str, int] | None = None
+    thread_pool_steps: set[str] = Field(default_factory=set)
+    executor: SkipValidation[Executor | None] = Field(default=None, exclude=True)
+
+    @field_validator("max_concurrency_per_step")
+    @classmethod
+    def validate_max_concurrency_per_step(cls, value: int | dict[str, int] | None) -> int | dict[str, int] | None:
+        """Validate that the concurrency limits are positive."""
+        limits = value.values() if isinstance(value, dict) else [] if value is None else [value]
+        if any(limit < 1 for limit in limits):
+            raise ValueError("max_concurrency_per_step must be at least 1.")
+        return value
+
+    def get_max_concurrency(self, step_name: str) -> int | None:
+        """Get the maximum number of messages the step handles at the same time, None for no limit."""
+        if isinstance(self.max_concurrency_per_step, dict):
+            return self.max_concurrency_per_step.get(step_name)
+        return self.max_concurrency_per_step
@@ -4,11 +4,12 @@ import asyncio
 import logging
 import uuid
 from collections.abc import Callable
+from concurrent.futures import Executor
 from inspect import isawaitable
 from queue import Queue
 from typing import Any
 
-from pydantic import Field, model_validator
+from pydantic import Field, SkipValidation, model_validator
 
 from semantic_kernel import Kernel
 from semantic_kernel.exceptions import KernelException
@@ -49,6 +50,8 @@ class LocalStep(KernelProcessMessageChannel, KernelBaseModel):
     parent_process_id: str | None = None
     init_lock: asyncio.Lock = Field(default_factory=asyncio.Lock, exclude=True)
     factories: dict[str, Callable]
+    run_in_thread_pool: bool = False
+    executor: SkipValidation[Executor | None] = Field(default=None, exclude=True)
 
     @model_validator(mode="before")
     @classmethod
@@ -173,7 +176,11 @@ class LocalStep(KernelProcessMessageChannel, KernelBaseModel):
             self.inputs[target_function] = self.initial_inputs.get(target_function, {}).copy()
 
     async def invoke_function(self, function: "KernelFunction", kernel: "Kernel", arguments: dict[str, Any]):
-        """Invokes the function."""
+        """Invokes the function, in a thread pool when the step is CPU-bound."""
+        if self.run_in_thread_pool:
+            loop = asyncio.get_running_loop()
+            # The function runs in a new event loop in the worker thread, so it does not block the other steps
+            return await loop.run_in_executor(self.executor, lambda: asyncio.run(kernel.invoke(function, **arguments)))
         return await kernel.invoke(function, **arguments)
 
     async def emit_event(self, process_event: KernelProcessEvent):
@@ -1,20 +1,27 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from html import escape
 from typing import TYPE_CHECKING, Any
 
 from pydantic import PrivateAttr, field_validator
 
+from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.exceptions import TemplateRenderException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.prompt_template.const import KERNEL_TEMPLATE_FORMAT_NAME
 from semantic_kernel.prompt_template.input_variable import InputVariable
 from semantic_kernel.prompt_template.prompt_template_base import PromptTemplateBase
 from semantic_kernel.template_engine.blocks.block import Block
+from semantic_kernel.template_engine.blocks.block_types import BlockTypes
 from semantic_kernel.template_engine.blocks.code_block import CodeBlock
+from semantic_kernel.template_engine.blocks.function_id_block import FunctionIdBlock
 from semantic_kernel.template_engine.blocks.named_arg_block import NamedArgBlock
 from semantic_kernel.template_engine.blocks.var_block import VarBlock
+from semantic_kernel.template_engine.protocols.code_renderer import CodeRenderer
+from semantic_kernel.template_engine.protocols.text_renderer import TextRenderer
 from semantic_kernel.template_engine.template_tokenizer import TemplateTokenizer
 
 if TYPE_CHECKING:
@@ -24,10 +31,31 @@ if TYPE_CHECKING:
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _RenderPlan:
+    """The blocks of a template compiled for rendering.
+
+    Every segment is either a static string, the adjacent text blocks joined together, a VarBlock,
+    an index into the function calls, or another block that is rendered in place.
+    """
+
+    segments: tuple["str | VarBlock | int | Block", ...]
+    function_calls: tuple[CodeBlock, ...]
+
+
 class KernelPromptTemplate(PromptTemplateBase):
-    """Create a Kernel prompt template."""
+    """Create a Kernel prompt template.
+
+    The template is compiled once into a render plan, so rendering joins precomputed static text
+    with the variables and the results of the function calls. The function calls of a template
+    are independent, each gets its own copy of the arguments, so they are executed concurrently.
+
+    Chat histories in the arguments are kept as objects by `render_with_chat_history`, so the messages
+    of a prompt that embeds a chat history are not parsed again for a chat completion.
+    """
 
     _blocks: list[Block] = PrivateAttr(default_factory=list)
+    _render_plan: _RenderPlan | None = PrivateAttr(default=None)
 
     @field_validator("prompt_template_config")
     @classmethod
@@ -40,6 +68,7 @@ class KernelPromptTemplate(PromptTemplateBase):
     def model_post_init(self, _: Any) -> None:
         """Post init model."""
         self._blocks = self.extract_blocks()
+        self._render_plan = self._compile(self._blocks)
         # Add all of the existing input variables to our known set. We'll avoid adding any
         # dynamically discovered input variables with the same name.
         seen = {iv.name.lower() for iv in self.prompt_template_config.input_variables}
@@ -91,7 +120,33 @@ class KernelPromptTemplate(PromptTemplateBase):
             str: The prompt template ready to be used for an AI request
 
         """
-        return await self.render_blocks(self._blocks, kernel, arguments)
+        if self._render_plan is None:
+            self._render_plan = self._compile(self._blocks)
+        return self._join(await self._render_parts(self._render_plan, kernel, arguments))
+
+    async def render_with_chat_history(
+        self, kernel: "Kernel", arguments: "KernelArguments | None" = None
+    ) -> tuple[str, ChatHistory | None]:
+        """Render the prompt template, together with the chat history the rendered prompt represents.
+
+        The messages of the chat histories in the arguments are used as they are, only the rest of the
+        prompt is parsed. When no chat history is embedded there is nothing to gain, so the chat history
+        is None and the rendered prompt is parsed when it is needed.
+
+        Args:
+            kernel ("Kernel"): The kernel to use for functions.
+            arguments ("KernelArguments | None"): The arguments to use for rendering. (Default value = None)
+
+        Returns:
+            tuple[str, ChatHistory | None]: The rendered prompt and the chat history, if it could be created.
+        """
+        if self._render_plan is None:
+            self._render_plan = self._compile(self._blocks)
+        parts = await self._render_parts(self._render_plan, kernel, arguments)
+        prompt = self._join(parts)
+        if all(isinstance(part, str) for part in parts):
+            return prompt, None
+        return prompt, ChatHistory.from_rendered_prompt_parts(parts)
 
     async def render_blocks(
         self, blocks: list[Block], kernel: "Kernel", arguments: "KernelArguments | None" = None
@@ -107,28 +162,94 @@ class KernelPromptTemplate(PromptTemplateBase):
             str: The prompt template ready to be used for an AI request
 
         """
-        from semantic_kernel.template_engine.protocols.code_renderer import CodeRenderer
-        from semantic_kernel.template_engine.protocols.text_renderer import TextRenderer
+        plan = self._render_plan if blocks is self._blocks and self._render_plan else self._compile(blocks)
+        return self._join(await self._render_parts(plan, kernel, arguments))
 
-        logger.debug(f"Rendering list of {len(blocks)} blocks")
-        rendered_blocks: list[str] = []
-        arguments = self._get_trusted_arguments(arguments or KernelArguments())
-        allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
+    @staticmethod
+    def _compile(blocks: list[Block]) -> _RenderPlan:
+        """Compile the blocks into a render plan, joining the adjacent static blocks."""
+        segments: list["str | VarBlock | int | Block"] = []
+        function_calls: list[CodeBlock] = []
+        static_parts: list[str] = []
         for block in blocks:
-            if isinstance(block, TextRenderer):
-                rendered_blocks.append(block.render(kernel, arguments))
+            if isinstance(block, VarBlock):
+                segment: "str | VarBlock | int | Block" = block
+            elif isinstance(block, CodeBlock) and block.tokens and isinstance(block.tokens[0], FunctionIdBlock):
+                segment = len(function_calls)
+                function_calls.append(block)
+            elif isinstance(block, TextRenderer) and block.type in (BlockTypes.TEXT, BlockTypes.VALUE):
+                # Text and values do not depend on the kernel or the arguments
+                static_parts.append(block.render(None, None))  # type: ignore[arg-type]
                 continue
-            if isinstance(block, CodeRenderer):
-                try:
-                    rendered = await block.render_code(kernel, arguments)
-                except Exception as exc:
-                    logger.error(f"Error rendering code block: {exc}")
-                    raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
+            elif isinstance(block, TextRenderer | CodeRenderer):
+                segment = block
+            else:
+                continue
+            if static_parts:
+                segments.append("".join(static_parts))
+                static_parts = []
+            segments.append(segment)
+        if static_parts:
+            segments.append("".join(static_parts))
+        return _RenderPlan(segments=tuple(segments), function_calls=tuple(function_calls))
+
+    async def _render_parts(
+        self, plan: _RenderPlan, kernel: "Kernel", arguments: "KernelArguments | None"
+    ) -> list[str | ChatHistory]:
+        """Render a compiled render plan, the chat histories in the arguments are returned as they are."""
+        logger.debug(f"Rendering {len(plan.segments)} segments with {len(plan.function_calls)} function calls")
+        arguments = self._get_trusted_arguments(arguments or KernelArguments())
+        allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
+
+        function_results: list[str] = []
+        if len(plan.function_calls) == 1:
+            function_results = [await self._render_code(plan.function_calls[0], kernel, arguments)]
+        elif plan.function_calls:
+            results = await asyncio.gather(
+                *(self._render_code(block, kernel, arguments) for block in plan.function_calls),
+                return_exceptions=True,
+            )
+            # The first failing block in template order is reported, as if the blocks were rendered in order
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            function_results = results  # type: ignore[assignment]
+
+        rendered_blocks: list[str | ChatHistory] = []
+        for segment in plan.segments:
+            if isinstance(segment, str):
+                rendered_blocks.append(segment)
+            elif isinstance(segment, VarBlock):
+                value = arguments.get(segment.name)
+                if type(value) is str or isinstance(value, ChatHistory):
+                    rendered_blocks.append(value)
+                else:
+                    # Other values are converted by the block, which also reports missing variables
+                    rendered_blocks.append(segment.render(kernel, arguments))
+            elif isinstance(segment, int):
+                rendered = function_results[segment]
                 rendered_blocks.append(rendered if allow_unsafe_function_output else escape(rendered))
-        prompt = "".join(rendered_blocks)
+            elif isinstance(segment, TextRenderer):
+                rendered_blocks.append(segment.render(kernel, arguments))
+            else:
+                rendered = await self._render_code(segment, kernel, arguments)  # type: ignore[arg-type]
+                rendered_blocks.append(rendered if allow_unsafe_function_output else escape(rendered))
+        return rendered_blocks
+
+    @staticmethod
+    def _join(parts: list[str | ChatHistory]) -> str:
+        prompt = "".join(part if isinstance(part, str) else str(part) for part in parts)
         logger.debug(f"Rendered prompt: {prompt}")
         return prompt
 
+    @staticmethod
+    async def _render_code(block: CodeRenderer, kernel: "Kernel", arguments: "KernelArguments") -> str:
+        try:
+            return await block.render_code(kernel, arguments)
+        except Exception as exc:
+            logger.error(f"Error rendering code block: {exc}")
+            raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
+
     @staticmethod
     def quick_render(template: str, arguments: dict[str, Any]) -> str:
         """Quick render a Kernel prompt template, only supports text and variable blocks.
@@ -142,7 +263,6 @@ class KernelPromptTemplate(PromptTemplateBase):
 
         """
         from semantic_kernel import Kernel
-        from semantic_kernel.template_engine.protocols.code_renderer import CodeRenderer
 
         blocks = TemplateTokenizer.tokenize(template)
         if any(isinstance(block, CodeRenderer) for block in blocks):
@@ -9,6 +9,7 @@ from semantic_kernel.kernel_pydantic import KernelBaseModel
 from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
 
 if TYPE_CHECKING:
+    from semantic_kernel.contents.chat_history import ChatHistory
     from semantic_kernel.functions.kernel_arguments import KernelArguments
     from semantic_kernel.kernel import Kernel
     from semantic_kernel.prompt_template.input_variable import InputVariable
@@ -25,6 +26,19 @@ class PromptTemplateBase(KernelBaseModel, ABC):
         """Render the prompt template."""
         pass
 
+    async def render_with_chat_history(
+        self, kernel: "Kernel", arguments: "KernelArguments | None" = None
+    ) -> tuple[str, "ChatHistory | None"]:
+        """Render the prompt template, together with the chat history the rendered prompt represents.
+
+        Templates that can create the chat history while rendering override this, so chat completions
+        do not have to parse the rendered prompt again. By default only the prompt is rendered.
+
+        Returns:
+            The rendered prompt and the chat history, or None when the rendered prompt has to be parsed.
+        """
+        return await self.render(kernel, arguments), None
+
     def _get_trusted_arguments(
         self,
         arguments: "KernelArguments",
@@ -6,6 +6,7 @@ from semantic_kernel.text.text_chunker import (
     split_markdown_paragraph,
     split_plaintext_lines,
     split_plaintext_paragraph,
+    split_text_stream,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "split_markdown_paragraph",
     "split_plaintext_lines",
     "split_plaintext_paragraph",
+    "split_text_stream",
 ]
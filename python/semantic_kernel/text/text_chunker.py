@@ -8,7 +8,9 @@ For markdown, split looking at punctuation first, and so on.
 
 import os
 import re
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 
 NEWLINE = os.linesep
 
@@ -38,6 +40,10 @@ MD_SPLIT_OPTIONS: list[list[str] | None] = [
     None,
 ]
 
+STREAM_BUFFER_SIZE = 65536
+TOKEN_COUNT_CACHE_SIZE = 4096
+CACHED_TEXT_LENGTH = 256
+
 
 def _token_counter(text: str) -> int:
     """Count the number of tokens in a string.
@@ -107,6 +113,109 @@ def split_markdown_paragraph(text: list[str], max_tokens: int, token_counter: Ca
     return _split_text_paragraph(text=split_lines, max_tokens=max_tokens, token_counter=token_counter)
 
 
+def split_text_stream(
+    pieces: Iterable[str],
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    token_counter: Callable[[str], int] = _token_counter,
+    separators: list[list[str] | None] = TEXT_SPLIT_OPTIONS,
+) -> Iterator[str]:
+    """Split a stream of text into chunks, without reading the whole text in memory.
+
+    The pieces can be of any size, for instance the lines of an open file or the blocks of a download.
+    The text is split into lines, the tokens of each line are counted once, and lines are combined
+    into chunks of at most max_tokens tokens, a line that is too long by itself is split using the separators.
+    The token count of a chunk is the sum of the token counts of its lines.
+
+    Args:
+        pieces: The text to split, as an iterable of strings, a file opened in text mode can be passed directly.
+        max_tokens: The maximum number of tokens per chunk.
+        overlap_tokens: The maximum number of tokens from the end of a chunk that are repeated
+            at the start of the next chunk, only whole lines are repeated.
+        token_counter: The function that counts the tokens of a string,
+            for instance `lambda text: len(encoding.encode(text))` with a tiktoken encoding.
+        separators: The separators to split lines that are too long, defaults to the plain text separators.
+
+    Yields:
+        The chunks, with leading and trailing whitespace removed.
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be greater than 0.")
+    if not 0 <= overlap_tokens < max_tokens:
+        raise ValueError("overlap_tokens must be at least 0 and less than max_tokens.")
+    cached_token_counter = lru_cache(maxsize=TOKEN_COUNT_CACHE_SIZE)(token_counter)
+
+    def count_tokens(text: str) -> int:
+        # repeated short lines, like headers and separators, are counted once
+        return cached_token_counter(text) if len(text) <= CACHED_TEXT_LENGTH else token_counter(text)
+
+    chunk: deque[tuple[str, int]] = deque()
+    chunk_tokens = 0
+
+    for line in _stream_lines(pieces, separators):
+        line_tokens = count_tokens(line)
+        parts = (
+            [(line, line_tokens)]
+            if line_tokens <= max_tokens
+            else [
+                (part, count_tokens(part))
+                for part in _split_str_lines(
+                    text=line, max_tokens=max_tokens, separators=separators, trim=False, token_counter=count_tokens
+                )
+            ]
+        )
+        for part, part_tokens in parts:
+            if chunk and chunk_tokens + part_tokens > max_tokens:
+                if text := "".join(text for text, _ in chunk).strip():
+                    yield text
+                # keep the last lines for the overlap, as long as they leave room for the next line
+                overlap: deque[tuple[str, int]] = deque()
+                overlap_count = 0
+                while chunk and overlap_count + chunk[-1][1] <= min(overlap_tokens, max_tokens - part_tokens):
+                    overlap_count += chunk[-1][1]
+                    overlap.appendleft(chunk.pop())
+                chunk, chunk_tokens = overlap, overlap_count
+            chunk.append((part, part_tokens))
+            chunk_tokens += part_tokens
+
+    if chunk and (text := "".join(text for text, _ in chunk).strip()):
+        yield text
+
+
+def _stream_lines(pieces: Iterable[str], separators: list[list[str] | None]) -> Iterator[str]:
+    """Turn a stream of text pieces into a stream of lines, that include their line ending.
+
+    When no line ending is found in STREAM_BUFFER_SIZE characters,
+    the buffered text is cut after the last of the first separators that occurs in it.
+    """
+    buffer = ""
+    for piece in pieces:
+        buffer += piece.replace("\r\n", "\n")
+        start = 0
+        while (end := buffer.find("\n", start)) != -1:
+            yield buffer[start : end + 1]
+            start = end + 1
+        while len(buffer) - start > STREAM_BUFFER_SIZE:
+            window = buffer[start : start + STREAM_BUFFER_SIZE]
+            cutpoint = _find_last_separator(window, separators) or STREAM_BUFFER_SIZE
+            yield window[:cutpoint]
+            start += cutpoint
+        buffer = buffer[start:]
+    if buffer:
+        yield buffer
+
+
+def _find_last_separator(text: str, separators: list[list[str] | None]) -> int:
+    """Find the position after the last occurrence of the first separators that occur in the text."""
+    for split_option in separators:
+        if not split_option:
+            continue
+        cutpoint = max(text.rfind(separator) for separator in split_option)
+        if cutpoint > 0:
+            return cutpoint + 1
+    return 0
+
+
 def _split_text_paragraph(text: list[str], max_tokens: int, token_counter: Callable = _token_counter) -> list[str]:
     """Split text into paragraphs."""
     if not text:
@@ -0,0 +1,218 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+from semantic_kernel.agents.runtime.core.agent_id import CoreAgentId
+from semantic_kernel.agents.runtime.core.exceptions import NotAccessibleError
+from semantic_kernel.agents.runtime.core.message_context import MessageContext
+from semantic_kernel.agents.runtime.core.routed_agent import RoutedAgent, message_handler
+from semantic_kernel.agents.runtime.core.serialization import (
+    DataclassJsonMessageSerializer,
+    try_get_known_serializers_for_type,
+)
+from semantic_kernel.agents.runtime.core.subscription import Subscription
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.distributed.distributed_runtime import DistributedRuntime
+from semantic_kernel.agents.runtime.distributed.distributed_runtime_host import DistributedRuntimeHost
+from semantic_kernel.agents.runtime.in_process.default_subscription import default_subscription
+from semantic_kernel.agents.runtime.in_process.default_topic import DefaultTopicId
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+
+
+@dataclass
+class Ping:
+    content: str
+
+
+@dataclass
+class Pong:
+    content: str
+
+
+@dataclass
+class Forward:
+    content: str
+
+
+class PingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that answers pings.")
+
+    @message_handler
+    async def on_ping(self, message: Ping, ctx: MessageContext) -> Pong:
+        if message.content == "fail":
+            raise ValueError("Ping failed")
+        return Pong(content=f"{message.content} from {self.id}")
+
+
+class ForwardingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that forwards to the ping agent.")
+
+    @message_handler
+    async def on_forward(self, message: Forward, ctx: MessageContext) -> Pong:
+        return await self.send_message(Ping(content=message.content), CoreAgentId("ping", "forwarded"))
+
+
+@default_subscription
+class CollectingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that collects the published messages.")
+        self.received: list[tuple[str, str | None]] = []
+        self.event = asyncio.Event()
+
+    @message_handler
+    async def on_ping(self, message: Ping, ctx: MessageContext) -> None:
+        self.received.append((message.content, None if ctx.sender is None else str(ctx.sender)))
+        if len(self.received) == 2:
+            self.event.set()
+
+
+class SourceSubscription(Subscription):
+    """A subscription that matches topics by their source, which the host can not route."""
+
+    def __init__(self, agent_type: str) -> None:
+        self._agent_type = agent_type
+
+    @property
+    def id(self) -> str:
+        return f"source-{self._agent_type}"
+
+    def is_match(self, topic_id: TopicId) -> bool:
+        return topic_id.source == self._agent_type
+
+    def map_to_agent(self, topic_id: TopicId) -> CoreAgentId:
+        return CoreAgentId(self._agent_type, topic_id.source)
+
+
+@pytest.fixture(params=["tcp", "unix"])
+async def host(request, tmp_path):
+    if request.param == "unix":
+        if sys.platform == "win32":
+            pytest.skip("Unix sockets are not available on Windows")
+        address = f"unix:{tmp_path / 'host.sock'}"
+    else:
+        address = "127.0.0.1:0"
+    async with DistributedRuntimeHost(address) as host:
+        yield host
+
+
+async def create_worker(host: DistributedRuntimeHost) -> DistributedRuntime:
+    runtime = DistributedRuntime(host.address)
+    await runtime.start()
+    runtime.add_message_serializer(try_get_known_serializers_for_type(Pong))
+    return runtime
+
+
+async def test_send_message_across_workers(host):
+    first = await create_worker(host)
+    second = await create_worker(host)
+    await PingAgent.register(first, "ping", PingAgent)
+    await ForwardingAgent.register(second, "forwarding", ForwardingAgent)
+
+    response = await second.send_message(Ping(content="hello"), CoreAgentId("ping", "default"))
+    assert response == Pong(content="hello from ping/default")
+
+    # the forwarding agent is hosted by the second worker and sends to the first one
+    response = await first.send_message(Forward(content="hi"), CoreAgentId("forwarding", "default"))
+    assert response == Pong(content="hi from ping/forwarded")
+
+    ping_agent = await first.try_get_underlying_agent_instance(CoreAgentId("ping", "default"), type=PingAgent)
+    assert ping_agent.id == CoreAgentId("ping", "default")
+    with pytest.raises(NotAccessibleError):
+        await second.try_get_underlying_agent_instance(CoreAgentId("ping", "default"))
+
+    await first.close()
+    await second.close()
+
+
+async def test_send_message_errors(host):
+    first = await create_worker(host)
+    second = await create_worker(host)
+    await PingAgent.register(first, "ping", PingAgent)
+
+    with pytest.raises(ValueError, match="Ping failed"):
+        await second.send_message(Ping(content="fail"), CoreAgentId("ping", "default"))
+    with pytest.raises(LookupError):
+        await second.send_message(Ping(content="hello"), CoreAgentId("unknown", "default"))
+    with pytest.raises(ValueError, match="already exists"):
+        await PingAgent.register(second, "ping", PingAgent)
+    with pytest.raises(ValueError, match="can not be used with a distributed runtime"):
+        await second.add_subscription(SourceSubscription("ping"))
+
+    # the registrations of a worker are removed when it disconnects
+    await first.stop()
+    await asyncio.sleep(0.05)
+    with pytest.raises(LookupError):
+        await second.send_message(Ping(content="hello"), CoreAgentId("ping", "default"))
+    await PingAgent.register(second, "ping", PingAgent)
+
+    await second.close()
+
+
+async def test_publish_message_across_workers(host):
+    first = await create_worker(host)
+    second = await create_worker(host)
+    await CollectingAgent.register(first, "collector", CollectingAgent)
+    await PingAgent.register(second, "ping", PingAgent)
+    await second.add_subscription(TypeSubscription("other", "collector"))
+
+    await second.publish_message(Ping(content="first"), topic_id=DefaultTopicId())
+    await second.publish_message(
+        Ping(content="second"), topic_id=TopicId("other", "default"), sender=CoreAgentId("ping", "default")
+    )
+    # the sender does not receive its own message
+    await first.publish_message(
+        Ping(content="ignored"), topic_id=DefaultTopicId(), sender=CoreAgentId("collector", "default")
+    )
+
+    collector = await first.try_get_underlying_agent_instance(CoreAgentId("collector", "default"), CollectingAgent)
+    await asyncio.wait_for(collector.event.wait(), timeout=5)
+    await asyncio.sleep(0.05)
+    assert collector.received == [("first", None), ("second", "ping/default")]
+
+    await first.close()
+    await second.close()
+
+
+class FailingPingSerializer(DataclassJsonMessageSerializer[Ping]):
+    def deserialize(self, payload: bytes) -> Ping:
+        message = super().deserialize(payload)
+        if message.content == "bad":
+            raise ValueError("Ping could not be deserialized")
+        return message
+
+
+async def test_worker_keeps_reading_after_bad_frame(host):
+    first = await create_worker(host)
+    second = await create_worker(host)
+    await CollectingAgent.register(first, "collector", CollectingAgent)
+    await PingAgent.register(first, "ping", PingAgent)
+    first.add_message_serializer(FailingPingSerializer(Ping))
+
+    await second.publish_message(Ping(content="bad"), topic_id=DefaultTopicId())
+    await second.publish_message(Ping(content="first"), topic_id=DefaultTopicId())
+    await second.publish_message(Ping(content="second"), topic_id=DefaultTopicId())
+
+    collector = await first.try_get_underlying_agent_instance(CoreAgentId("collector", "default"), CollectingAgent)
+    await asyncio.wait_for(collector.event.wait(), timeout=5)
+    assert collector.received == [("first", None), ("second", None)]
+    response = await asyncio.wait_for(
+        second.send_message(Ping(content="hello"), CoreAgentId("ping", "default")), timeout=5
+    )
+    assert response == Pong(content="hello from ping/default")
+
+    await first.close()
+    await second.close()
+
+
+async def test_runtime_must_be_started():
+    runtime = DistributedRuntime("127.0.0.1:1")
+    with pytest.raises(RuntimeError, match="not started"):
+        await PingAgent.register(runtime, "ping", PingAgent)
+    with pytest.raises(ValueError, match="Invalid address"):
+        await DistributedRuntime("localhost").start()
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 from asyncio import Event
 from collections.abc import Sequence
@@ -21,6 +22,7 @@ from semantic_kernel.agents.runtime.in_process.agent_instantiation_context impor
 from semantic_kernel.agents.runtime.in_process.default_subscription import default_subscription, type_subscription
 from semantic_kernel.agents.runtime.in_process.default_topic import DefaultTopicId
 from semantic_kernel.agents.runtime.in_process.in_process_runtime import InProcessRuntime
+from semantic_kernel.agents.runtime.in_process.runtime_impl_helpers import FifoLimiter
 from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
 
 
@@ -395,3 +397,225 @@ async def test_event_handler_exception_multi_message() -> None:
         await runtime.stop_when_idle()
 
     await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_message_events_are_serialized_only_when_logged(caplog: pytest.LogCaptureFixture) -> None:
+    runtime = InProcessRuntime()
+    serialized: list[Any] = []
+    try_serialize = runtime._try_serialize
+
+    def counting_serialize(message: Any) -> str:
+        serialized.append(message)
+        return try_serialize(message)
+
+    runtime._try_serialize = counting_serialize  # type: ignore[method-assign]
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "first", LoopbackAgentWithDefaultSubscription)
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "second", LoopbackAgentWithDefaultSubscription)
+
+    runtime.start()
+    with caplog.at_level(logging.WARNING, logger="in_process_runtime.events"):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+        await runtime.stop_when_idle()
+    assert serialized == []
+
+    runtime.start()
+    with caplog.at_level(logging.INFO, logger="in_process_runtime.events"):
+        await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+        await runtime.stop_when_idle()
+    # once when the message is published and once for the delivery to both recipients
+    assert len(serialized) == 2
+    assert sum(record.name == "in_process_runtime.events" for record in caplog.records) == 3
+
+    await runtime.close()
+
+
+@dataclass
+class SlowMessage:
+    index: int
+
+
+@dataclass
+class ForwardMessage:
+    content: str
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.handled: list[tuple[str, int]] = []
+
+
+@default_subscription
+class SlowAgent(RoutedAgent):
+    tracker = ConcurrencyTracker()
+
+    def __init__(self) -> None:
+        super().__init__("A slow agent.")
+
+    @message_handler
+    async def on_slow_message(self, message: SlowMessage, ctx: MessageContext) -> None:
+        tracker = SlowAgent.tracker
+        tracker.running += 1
+        tracker.max_running = max(tracker.max_running, tracker.running)
+        await asyncio.sleep(0.001 * (message.index % 3))
+        tracker.handled.append((self.id.type, message.index))
+        tracker.running -= 1
+
+
+class ForwardingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that forwards messages to the loopback agent.")
+
+    @message_handler
+    async def on_forward_message(self, message: ForwardMessage, ctx: MessageContext) -> ContentMessage:
+        return await self.send_message(ContentMessage(content=message.content), CoreAgentId("loopback", "default"))
+
+
+@dataclass
+class NestedMessage:
+    path: list[str]
+
+
+class NestingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that sends a message along a path of agent types.")
+
+    @message_handler
+    async def on_nested_message(self, message: NestedMessage, ctx: MessageContext) -> int:
+        if not message.path:
+            return 0
+        next_id = CoreAgentId(message.path[0], f"{self.id.key}-{len(message.path)}")
+        return await self.send_message(NestedMessage(path=message.path[1:]), next_id) + 1
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_handlers() -> None:
+    SlowAgent.tracker = ConcurrencyTracker()
+    runtime = InProcessRuntime(max_concurrent_handlers=2)
+    for name in ("first", "second", "third"):
+        await SlowAgent.register(runtime, name, SlowAgent)
+
+    runtime.start()
+    for index in range(5):
+        await runtime.publish_message(SlowMessage(index=index), topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+
+    assert SlowAgent.tracker.max_running == 2
+    assert len(SlowAgent.tracker.handled) == 15
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_handlers_per_agent_type_is_fifo() -> None:
+    SlowAgent.tracker = ConcurrencyTracker()
+    runtime = InProcessRuntime(max_concurrent_handlers_per_agent_type={"ordered": 1})
+    await SlowAgent.register(runtime, "ordered", SlowAgent)
+    await SlowAgent.register(runtime, "unordered", SlowAgent)
+
+    runtime.start()
+    for index in range(10):
+        await runtime.publish_message(SlowMessage(index=index), topic_id=DefaultTopicId())
+    await runtime.stop_when_idle()
+
+    handled = SlowAgent.tracker.handled
+    assert [index for agent_type, index in handled if agent_type == "ordered"] == list(range(10))
+    assert [index for agent_type, index in handled if agent_type == "unordered"] != list(range(10))
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", [["a", "a"], ["b", "a"], ["b", "a", "b", "a"]])
+async def test_nested_send_does_not_deadlock_with_max_concurrent_handlers_per_agent_type(path: list[str]) -> None:
+    runtime = InProcessRuntime(max_concurrent_handlers_per_agent_type=1)
+    await NestingAgent.register(runtime, "a", NestingAgent)
+    await NestingAgent.register(runtime, "b", NestingAgent)
+
+    runtime.start()
+    response = await asyncio.wait_for(
+        runtime.send_message(NestedMessage(path=path), CoreAgentId("a", "default")), timeout=3
+    )
+    await runtime.stop_when_idle()
+
+    assert response == len(path)
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_nested_send_does_not_deadlock_with_max_concurrent_handlers() -> None:
+    runtime = InProcessRuntime(max_concurrent_handlers=1, max_queue_size=1)
+    await ForwardingAgent.register(runtime, "forwarding", ForwardingAgent)
+    await LoopbackAgent.register(runtime, "loopback", LoopbackAgent)
+
+    runtime.start()
+    response = await asyncio.wait_for(
+        runtime.send_message(ForwardMessage(content="hello"), CoreAgentId("forwarding", "default")), timeout=5
+    )
+    await runtime.stop_when_idle()
+
+    assert response == ContentMessage(content="hello")
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_max_queue_size_applies_backpressure() -> None:
+    runtime = InProcessRuntime(max_queue_size=2)
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    blocked = asyncio.create_task(runtime.publish_message(MessageType(), topic_id=DefaultTopicId()))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert runtime.unprocessed_messages_count == 2
+
+    runtime.start()
+    await asyncio.wait_for(blocked, timeout=5)
+    await runtime.stop_when_idle()
+
+    agent = await runtime.try_get_underlying_agent_instance(
+        CoreAgentId("name", "default"), type=LoopbackAgentWithDefaultSubscription
+    )
+    assert agent.num_calls == 3
+    await runtime.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_blocked_producers() -> None:
+    runtime = InProcessRuntime(max_queue_size=1)
+    await LoopbackAgentWithDefaultSubscription.register(runtime, "name", LoopbackAgentWithDefaultSubscription)
+
+    runtime.start()
+    await runtime.stop()
+    await runtime.publish_message(MessageType(), topic_id=DefaultTopicId())
+    blocked = asyncio.create_task(runtime.publish_message(MessageType(), topic_id=DefaultTopicId()))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    runtime.start()
+    await runtime.stop()
+    await asyncio.wait_for(blocked, timeout=5)
+
+    # the limiter is replaced, so the discarded messages do not keep their slots
+    await asyncio.wait_for(runtime.publish_message(MessageType(), topic_id=DefaultTopicId()), timeout=5)
+    await runtime.close()
+
+
+async def test_fifo_limiter() -> None:
+    limiter = FifoLimiter(1)
+    first = limiter.reserve()
+    second = limiter.reserve()
+    third = limiter.reserve()
+    assert first.done()
+    assert limiter.waiting == 2
+
+    limiter.cancel(second)
+    limiter.release()
+    assert third.done()
+    assert limiter.waiting == 0
+
+    limiter.release()
+    assert limiter.reserve().done()
+    with pytest.raises(ValueError):
+        FifoLimiter(0)
@@ -0,0 +1,113 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import pytest
+
+from semantic_kernel.agents.runtime.core.agent_id import AgentId, CoreAgentId
+from semantic_kernel.agents.runtime.core.topic import TopicId
+from semantic_kernel.agents.runtime.in_process.runtime_impl_helpers import SubscriptionManager
+from semantic_kernel.agents.runtime.in_process.type_prefix_subscription import TypePrefixSubscription
+from semantic_kernel.agents.runtime.in_process.type_subscription import TypeSubscription
+
+
+class SourceSubscription:
+    """A subscription that is not indexed, it matches on the source of the topic."""
+
+    def __init__(self, source: str, agent_type: str, id: str) -> None:
+        self.source = source
+        self.agent_type = agent_type
+        self.id = id
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SourceSubscription) and other.id == self.id
+
+    def is_match(self, topic_id: TopicId) -> bool:
+        return topic_id.source == self.source
+
+    def map_to_agent(self, topic_id: TopicId) -> AgentId:
+        return CoreAgentId(self.agent_type, "fixed")
+
+
+async def test_routes_type_and_prefix_subscriptions():
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("chat.message", "exact", id="1"))
+    await manager.add_subscription(TypePrefixSubscription("chat.", "prefix", id="2"))
+    await manager.add_subscription(TypePrefixSubscription("", "all", id="3"))
+    await manager.add_subscription(TypePrefixSubscription("chat.messages", "longer", id="4"))
+    await manager.add_subscription(SourceSubscription("s1", "source", id="5"))
+
+    recipients = await manager.get_subscribed_recipients(TopicId("chat.message", "s1"))
+    assert [recipient.type for recipient in recipients] == ["exact", "prefix", "all", "source"]
+    assert recipients[0] == CoreAgentId("exact", "s1")
+
+    recipients = await manager.get_subscribed_recipients(TopicId("other", "s2"))
+    assert [recipient.type for recipient in recipients] == ["all"]
+    assert [sub.id for sub in manager.subscriptions] == ["1", "2", "3", "4", "5"]
+
+
+async def test_seen_topics_are_updated_incrementally():
+    manager = SubscriptionManager()
+    topic = TopicId("chat.message", "s1")
+    other_topic = TopicId("other", "s1")
+    assert await manager.get_subscribed_recipients(topic) == []
+    assert await manager.get_subscribed_recipients(other_topic) == []
+
+    await manager.add_subscription(TypeSubscription("chat.message", "exact", id="1"))
+    await manager.add_subscription(TypePrefixSubscription("chat", "prefix", id="2"))
+    await manager.add_subscription(TypeSubscription("chat.message", "prefix", id="3"))
+    await manager.add_subscription(SourceSubscription("s1", "source", id="4"))
+
+    assert [r.type for r in await manager.get_subscribed_recipients(topic)] == ["exact", "prefix", "prefix", "source"]
+    assert [r.type for r in await manager.get_subscribed_recipients(other_topic)] == ["source"]
+
+    await manager.remove_subscription("2")
+    assert [r.type for r in await manager.get_subscribed_recipients(topic)] == ["exact", "prefix", "source"]
+
+    await manager.remove_subscription("4")
+    await manager.remove_subscription("1")
+    assert await manager.get_subscribed_recipients(topic) == [CoreAgentId("prefix", "s1")]
+    assert await manager.get_subscribed_recipients(other_topic) == []
+
+
+async def test_returned_recipients_are_not_mutated():
+    manager = SubscriptionManager()
+    topic = TopicId("default", "s1")
+    await manager.add_subscription(TypeSubscription("default", "first"))
+    recipients = await manager.get_subscribed_recipients(topic)
+
+    await manager.add_subscription(TypeSubscription("default", "second"))
+
+    assert [r.type for r in recipients] == ["first"]
+    assert [r.type for r in await manager.get_subscribed_recipients(topic)] == ["first", "second"]
+
+
+async def test_prefix_trie_is_pruned():
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypePrefixSubscription("ab", "short", id="1"))
+    await manager.add_subscription(TypePrefixSubscription("abcd", "long", id="2"))
+
+    await manager.remove_subscription("2")
+    assert "c" not in manager._prefix_index.children["a"].children["b"].children
+
+    await manager.remove_subscription("1")
+    assert manager._prefix_index.children == {}
+    assert await manager.get_subscribed_recipients(TopicId("abcd", "s")) == []
+
+
+async def test_duplicate_and_missing_subscriptions():
+    manager = SubscriptionManager()
+    await manager.add_subscription(TypeSubscription("default", "agent", id="1"))
+    await manager.add_subscription(TypePrefixSubscription("default", "agent", id="2"))
+    await manager.add_subscription(SourceSubscription("s1", "source", id="3"))
+
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(TypeSubscription("default", "agent"))
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(TypeSubscription("other", "other", id="2"))
+    with pytest.raises(ValueError, match="Subscription already exists"):
+        await manager.add_subscription(SourceSubscription("s2", "source", id="3"))
+    with pytest.raises(ValueError, match="Subscription does not exist"):
+        await manager.remove_subscription("unknown")
+
+    await manager.remove_subscription("1")
+    await manager.add_subscription(TypeSubscription("default", "agent"))
+    assert len(manager.subscriptions) == 3
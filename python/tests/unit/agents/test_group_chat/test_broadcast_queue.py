@@ -169,4 +169,71 @@ async def test_receive_breaks_when_queue_is_empty(channel_ref, message):
     assert queue_ref.is_empty
 
 
+async def test_ensure_synchronized_waits_without_polling(channel_ref, message):
+    broadcast_queue = BroadcastQueue(block_duration=10)
+    release = asyncio.Event()
+
+    async def slow_receive(messages):
+        await release.wait()
+
+    channel_ref.channel.receive.side_effect = slow_receive
+
+    await broadcast_queue.enqueue([channel_ref], [message])
+    synchronize_task = asyncio.create_task(broadcast_queue.ensure_synchronized(channel_ref))
+    await asyncio.sleep(0.01)
+    assert not synchronize_task.done()
+
+    release.set()
+    # The waiter is woken up by the receive task instead of sleeping for the block duration
+    await asyncio.wait_for(synchronize_task, timeout=1)
+    assert broadcast_queue.queues[channel_ref.hash].is_empty
+
+
+async def test_receive_batches_pending_messages(channel_ref):
+    broadcast_queue = BroadcastQueue()
+    first, second, third = (MagicMock(spec=ChatMessageContent) for _ in range(3))
+    release = asyncio.Event()
+    received: list[list[ChatMessageContent]] = []
+
+    async def receive(messages):
+        received.append(list(messages))
+        await release.wait()
+
+    channel_ref.channel.receive.side_effect = receive
+
+    await broadcast_queue.enqueue([channel_ref], [first])
+    await asyncio.sleep(0)
+    await broadcast_queue.enqueue([channel_ref], [second])
+    await broadcast_queue.enqueue([channel_ref], [third])
+
+    metrics = broadcast_queue.get_lag_metrics()[channel_ref.hash]
+    assert metrics.pending_batches == 3
+    assert metrics.pending_messages == 3
+    assert metrics.lag_seconds > 0
+
+    release.set()
+    await broadcast_queue.ensure_synchronized(channel_ref)
+
+    assert received == [[first], [second, third]]
+    metrics = broadcast_queue.get_lag_metrics()[channel_ref.hash]
+    assert metrics.pending_batches == 0
+    assert metrics.lag_seconds == 0
+    assert metrics.delivered_batches == 3
+    assert metrics.delivered_messages == 3
+    assert metrics.receive_calls == 2
+    assert metrics.last_receive_duration is not None
+
+
+async def test_receive_respects_max_batch_size(channel_ref):
+    broadcast_queue = BroadcastQueue(max_batch_size=1)
+    messages = [MagicMock(spec=ChatMessageContent) for _ in range(3)]
+
+    for message in messages:
+        await broadcast_queue.enqueue([channel_ref], [message])
+    await broadcast_queue.ensure_synchronized(channel_ref)
+
+    assert channel_ref.channel.receive.await_count == 3
+    assert broadcast_queue.get_lag_metrics()[channel_ref.hash].receive_calls == 3
+
+
 # endregion
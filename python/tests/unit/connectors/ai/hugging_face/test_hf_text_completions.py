@@ -1,10 +1,11 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from threading import Thread
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
 
 import pytest
-from transformers import AutoTokenizer, TextIteratorStreamer
 
 from semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion import HuggingFaceTextCompletion
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
@@ -120,41 +121,82 @@ async def test_text_completion_throws():
     ids=["text2text-generation", "text-generation"],
 )
 async def test_text_completion_streaming(model_name, task, input_str):
-    ret = {"summary_text": "test"} if task == "summarization" else {"generated_text": "test"}
-    mock_pipeline = Mock(return_value=ret)
+    generation_threads = []
+
+    def generate(prompt, streamer, **kwargs):
+        generation_threads.append(threading.get_ident())
+        streamer.on_finalized_text("mocked_text")
+        streamer.on_finalized_text("", stream_end=True)
 
-    mock_streamer = MagicMock(spec=TextIteratorStreamer)
-    mock_streamer.__iter__.return_value = iter(["mocked_text"])
+    mock_pipeline = Mock(side_effect=generate)
 
     with (
         patch(
             "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
             return_value=mock_pipeline,
         ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.Thread",
-            side_effect=Mock(spec=Thread),
-        ),
         patch(
             "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.AutoTokenizer",
-            side_effect=Mock(spec=AutoTokenizer),
-        ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.TextIteratorStreamer",
-            return_value=mock_streamer,
-        ) as mock_stream,
+        ) as mock_tokenizer,
     ):
-        mock_stream.return_value = mock_streamer
         service = HuggingFaceTextCompletion(service_id=model_name, ai_model_id=model_name, task=task)
         prompt = "test prompt"
         exec_settings = PromptExecutionSettings(service_id=model_name, extension_data={"max_new_tokens": 25})
 
-        result = []
-        async for content in service.get_streaming_text_contents(prompt, exec_settings):
-            result.append(content)
+        for _ in range(2):
+            result = []
+            async for content in service.get_streaming_text_contents(prompt, exec_settings):
+                result.append(content)
+
+            assert len(result) == 1
+            assert result[0][0].inner_content == "mocked_text"
+
+        # the tokenizer of the pipeline is used, and the generation runs in a separate thread
+        mock_tokenizer.from_pretrained.assert_not_called()
+        assert threading.get_ident() not in generation_threads
+
+
+async def test_text_completion_streaming_generation_error():
+    mock_pipeline = Mock(side_effect=RuntimeError("generation failed"))
 
-        assert len(result) == 1
-        assert result[0][0].inner_content == "mocked_text"
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
+        return_value=mock_pipeline,
+    ):
+        service = HuggingFaceTextCompletion(service_id="test", ai_model_id="test")
+
+        with pytest.raises(ServiceResponseException, match="Hugging Face completion failed"):
+            async for _ in service.get_streaming_text_contents("test prompt", PromptExecutionSettings()):
+                pass
+
+        # the generation slot is released after a failure
+        assert service._get_generation_semaphore()._value == 1
+
+
+async def test_text_completion_bounded_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    def generate(prompt, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.02)
+        in_flight -= 1
+        return [{"generated_text": prompt}]
+
+    with patch(
+        "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
+        return_value=Mock(side_effect=generate),
+    ):
+        service = HuggingFaceTextCompletion(service_id="test", ai_model_id="test")
+        service.max_concurrent_generations = 2
+        results = await asyncio.gather(*[
+            service.get_text_contents(f"prompt {i}", PromptExecutionSettings()) for i in range(5)
+        ])
+
+        assert [result[0].text for result in results] == [f"prompt {i}" for i in range(5)]
+        assert max_in_flight == 2
 
 
 @pytest.mark.parametrize(
@@ -173,9 +215,6 @@ async def test_text_completion_streaming_throws(model_name, task, input_str):
     ret = {"summary_text": "test"} if task == "summarization" else {"generated_text": "test"}
     mock_pipeline = Mock(return_value=ret)
 
-    mock_streamer = MagicMock(spec=TextIteratorStreamer)
-    mock_streamer.__iter__.return_value = Exception()
-
     with (
         patch(
             "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.pipeline",
@@ -185,12 +224,7 @@ async def test_text_completion_streaming_throws(model_name, task, input_str):
             "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.Thread",
             side_effect=Exception(),
         ),
-        patch(
-            "semantic_kernel.connectors.ai.hugging_face.services.hf_text_completion.TextIteratorStreamer",
-            return_value=mock_streamer,
-        ) as mock_stream,
     ):
-        mock_stream.return_value = mock_streamer
         service = HuggingFaceTextCompletion(service_id=model_name, ai_model_id=model_name, task=task)
         prompt = "test prompt"
         exec_settings = PromptExecutionSettings(service_id=model_name, extension_data={"max_new_tokens": 25})
@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -54,3 +56,48 @@ async def test_generate_embeddings_throws():
 
         with pytest.raises(ServiceResponseException, match="Hugging Face embeddings failed"):
             await service.generate_embeddings(texts)
+
+
+async def test_generate_embeddings_coalesces_concurrent_requests():
+    model_name = "sentence-transformers/all-MiniLM-L6-v2"
+    loop_thread = threading.get_ident()
+    encode_threads = []
+
+    def encode(sentences, **kwargs):
+        encode_threads.append(threading.get_ident())
+        return array([[float(len(sentence))] for sentence in sentences])
+
+    with patch("sentence_transformers.SentenceTransformer") as mock_transformer:
+        mock_instance = mock_transformer.return_value
+        mock_instance.encode.side_effect = encode
+
+        service = HuggingFaceTextEmbedding(service_id="test", ai_model_id=model_name)
+        first, second = await asyncio.gather(
+            service.generate_embeddings(["a", "bb"]), service.generate_embeddings(["ccc"])
+        )
+        raw = await service.generate_raw_embeddings(["dddd"])
+
+        assert first.tolist() == [[1.0], [2.0]]
+        assert second.tolist() == [[3.0]]
+        assert raw.tolist() == [[4.0]]
+        assert [call.kwargs for call in mock_instance.encode.call_args_list] == [
+            {"sentences": ["a", "bb", "ccc"], "convert_to_numpy": True},
+            {"sentences": ["dddd"]},
+        ]
+        assert loop_thread not in encode_threads
+
+
+async def test_generate_embeddings_flushes_full_batches():
+    model_name = "sentence-transformers/all-MiniLM-L6-v2"
+
+    with patch("sentence_transformers.SentenceTransformer") as mock_transformer:
+        mock_instance = mock_transformer.return_value
+        mock_instance.encode.side_effect = lambda sentences, **kwargs: array([[0.0]] * len(sentences))
+
+        service = HuggingFaceTextEmbedding(service_id="test", ai_model_id=model_name)
+        service.max_batch_size = 2
+        service.batch_window = 10
+        results = await asyncio.gather(*[service.generate_embeddings([f"text {i}"]) for i in range(4)])
+
+        assert [len(result) for result in results] == [1, 1, 1, 1]
+        assert [len(call.kwargs["sentences"]) for call in mock_instance.encode.call_args_list] == [2, 2]
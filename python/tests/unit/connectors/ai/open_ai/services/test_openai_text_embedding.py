@@ -1,10 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
-from openai import AsyncClient
+from openai import APITimeoutError, AsyncClient, BadRequestError, InternalServerError, RateLimitError
 from openai.resources.embeddings import AsyncEmbeddings
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
 
 from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_prompt_execution_settings import (
     OpenAIEmbeddingPromptExecutionSettings,
@@ -124,3 +128,133 @@ async def test_embedding_pes(mock_create, openai_unit_test_env) -> None:
         model=ai_model_id,
         dimensions=embedding_dimensions,
     )
+
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+
+
+def _embedding_response(inputs: list[str]) -> CreateEmbeddingResponse:
+    return CreateEmbeddingResponse(
+        data=[
+            Embedding(embedding=[float(text.split("-")[1])], index=i, object="embedding")
+            for i, text in enumerate(inputs)
+        ],
+        model="test_model_id",
+        object="list",
+        usage=Usage(prompt_tokens=len(inputs), total_tokens=len(inputs)),
+    )
+
+
+async def test_embedding_batches_concurrently_and_preserves_order(openai_unit_test_env) -> None:
+    texts = [f"text-{i}" for i in range(10)]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create(input: list[str], **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # later batches finish first
+        await asyncio.sleep(0.01 * (10 - int(input[0].split("-")[1])) / 10)
+        in_flight -= 1
+        return _embedding_response(input)
+
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.max_concurrent_batches = 2
+    with patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock, side_effect=create) as mock_create:
+        embeddings = await openai_text_embedding.generate_raw_embeddings(texts, batch_size=3)
+
+    assert embeddings == [[float(i)] for i in range(10)]
+    assert [call.kwargs["input"] for call in mock_create.await_args_list] == [
+        texts[0:3],
+        texts[3:6],
+        texts[6:9],
+        texts[9:10],
+    ]
+    assert max_in_flight == 2
+    assert openai_text_embedding.total_tokens == 10
+
+
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_batches_by_token_budget(mock_create, openai_unit_test_env) -> None:
+    mock_create.side_effect = lambda input, **kwargs: _embedding_response(input)
+    # each text is estimated at 11 tokens, the long text at 101 tokens
+    texts = ["short-0" + " " * 37, "short-1" + " " * 37, "longer-2" + " " * 392, "short-3" + " " * 37]
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.max_batch_tokens = 30
+
+    embeddings = await openai_text_embedding.generate_raw_embeddings(texts)
+
+    assert embeddings == [[0.0], [1.0], [2.0], [3.0]]
+    assert [call.kwargs["input"] for call in mock_create.await_args_list] == [texts[0:2], texts[2:3], texts[3:4]]
+
+
+@patch("semantic_kernel.connectors.ai.embedding_generator_base.BATCH_RETRY_BASE_DELAY", 0)
+async def test_embedding_retries_only_failed_batch(openai_unit_test_env) -> None:
+    texts = [f"text-{i}" for i in range(4)]
+    failures = {"text-2": 1}
+
+    async def create(input: list[str], **kwargs):
+        if failures.get(input[0], 0) > 0:
+            failures[input[0]] -= 1
+            raise APITimeoutError(request=_REQUEST)
+        return _embedding_response(input)
+
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    with patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock, side_effect=create) as mock_create:
+        embeddings = await openai_text_embedding.generate_raw_embeddings(texts, batch_size=2)
+
+    assert embeddings == [[0.0], [1.0], [2.0], [3.0]]
+    assert [call.kwargs["input"] for call in mock_create.await_args_list] == [texts[0:2], texts[2:4], texts[2:4]]
+
+
+@patch("semantic_kernel.connectors.ai.embedding_generator_base.BATCH_RETRY_BASE_DELAY", 0)
+@patch.object(
+    AsyncEmbeddings,
+    "create",
+    new_callable=AsyncMock,
+    side_effect=RateLimitError("rate limited", response=httpx.Response(429, request=_REQUEST), body=None),
+)
+async def test_embedding_batch_fails_after_retries(mock_create, openai_unit_test_env) -> None:
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    openai_text_embedding.max_batch_retries = 1
+
+    with pytest.raises(ServiceResponseException):
+        await openai_text_embedding.generate_raw_embeddings(["text-0"])
+    assert mock_create.await_count == 2
+
+
+@patch("semantic_kernel.connectors.ai.embedding_generator_base.BATCH_RETRY_BASE_DELAY", 0)
+async def test_embedding_retries_server_errors(openai_unit_test_env) -> None:
+    errors = [InternalServerError("unavailable", response=httpx.Response(503, request=_REQUEST), body=None)]
+
+    async def create(input: list[str], **kwargs):
+        if errors:
+            raise errors.pop()
+        return _embedding_response(input)
+
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    with patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock, side_effect=create) as mock_create:
+        embeddings = await openai_text_embedding.generate_raw_embeddings(["text-0"])
+
+    assert embeddings == [[0.0]]
+    assert mock_create.await_count == 2
+
+
+@patch("semantic_kernel.connectors.ai.embedding_generator_base.BATCH_RETRY_BASE_DELAY", 0)
+@pytest.mark.parametrize(
+    "error",
+    [
+        BadRequestError("bad request", response=httpx.Response(400, request=_REQUEST), body=None),
+        ValueError("invalid input"),
+    ],
+)
+async def test_embedding_does_not_retry_other_errors(error, openai_unit_test_env) -> None:
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+
+    with (
+        patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock, side_effect=error) as mock_create,
+        pytest.raises(ServiceResponseException),
+    ):
+        await openai_text_embedding.generate_raw_embeddings(["text-0"])
+    assert mock_create.await_count == 1
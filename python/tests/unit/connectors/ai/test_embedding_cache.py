@@ -0,0 +1,101 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from semantic_kernel.connectors.ai.embedding_cache import (
+    CachedEmbeddingGenerator,
+    InMemoryEmbeddingCache,
+    SqliteEmbeddingCache,
+    create_embedding_cache_key,
+)
+from semantic_kernel.connectors.ai.embedding_generator_base import EmbeddingGeneratorBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+
+
+class CountingEmbeddingGenerator(EmbeddingGeneratorBase):
+    calls: list[list[str]] = []
+
+    async def generate_embeddings(
+        self, texts: list[str], settings: PromptExecutionSettings | None = None, **kwargs: Any
+    ) -> np.ndarray:
+        self.calls.append(list(texts))
+        dimensions = (settings.extension_data.get("dimensions") if settings else None) or 2
+        return np.array([[float(len(text))] * dimensions for text in texts])
+
+
+@pytest.fixture
+def generator() -> CountingEmbeddingGenerator:
+    return CountingEmbeddingGenerator(ai_model_id="test-model", calls=[])
+
+
+async def test_cache_hits_and_misses(generator):
+    cached = CachedEmbeddingGenerator(generator)
+
+    first = await cached.generate_embeddings(["a", "bb", "a"])
+    second = await cached.generate_embeddings(["bb", "ccc"])
+
+    assert first.tolist() == [[1.0, 1.0], [2.0, 2.0], [1.0, 1.0]]
+    assert second.tolist() == [[2.0, 2.0], [3.0, 3.0]]
+    assert generator.calls == [["a", "bb"], ["ccc"]]
+    assert cached.metrics.hits == 1
+    assert cached.metrics.misses == 4
+    assert cached.metrics.tier_hits == {"memory": 1}
+    assert cached.metrics.hit_rate == pytest.approx(0.2)
+    assert cached.service_id == generator.service_id
+
+
+async def test_cache_key_includes_dimensions(generator):
+    cached = CachedEmbeddingGenerator(generator)
+
+    await cached.generate_raw_embeddings(["a"], PromptExecutionSettings(dimensions=2))
+    raw = await cached.generate_raw_embeddings(["a"], PromptExecutionSettings(dimensions=3))
+    await cached.generate_raw_embeddings(["a"], PromptExecutionSettings(dimensions=3))
+
+    assert raw == [[1.0, 1.0, 1.0]]
+    assert generator.calls == [["a"], ["a"]]
+    assert create_embedding_cache_key("m", 2, "a") != create_embedding_cache_key("m", 3, "a")
+    assert create_embedding_cache_key("m", None, "a") != create_embedding_cache_key("other", None, "a")
+
+
+async def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryEmbeddingCache(max_size=2)
+    await cache.set_many({"a": np.array([1.0]), "b": np.array([2.0])})
+    await cache.get_many(["a"])
+    await cache.set_many({"c": np.array([3.0])})
+
+    assert len(cache) == 2
+    assert set(await cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+async def test_disk_cache_is_shared_and_promoted(generator, tmp_path):
+    path = tmp_path / "embeddings.db"
+    first = CachedEmbeddingGenerator(generator, disk_cache_path=path)
+    await first.generate_embeddings(["a", "bb"])
+
+    second = CachedEmbeddingGenerator(generator, disk_cache_path=path)
+    embeddings = await second.generate_embeddings(["a", "bb"])
+    await second.generate_embeddings(["a"])
+
+    assert embeddings.tolist() == [[1.0, 1.0], [2.0, 2.0]]
+    assert generator.calls == [["a", "bb"]]
+    assert second.metrics.tier_hits == {"sqlite": 2, "memory": 1}
+    for cache in (*first.caches, *second.caches):
+        if isinstance(cache, SqliteEmbeddingCache):
+            cache.close()
+
+
+async def test_sqlite_cache_clear(tmp_path):
+    cache = SqliteEmbeddingCache(path=tmp_path / "cache" / "embeddings.db")
+    await cache.set_many({"a": np.array([1.0, 2.0], dtype=np.float32)})
+
+    found = await cache.get_many(["a", "b"])
+    assert list(found) == ["a"]
+    assert found["a"].dtype == np.float32
+    assert found["a"].tolist() == [1.0, 2.0]
+
+    await cache.clear()
+    assert await cache.get_many(["a"]) == {}
+    cache.close()
@@ -1,5 +1,7 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import threading
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
@@ -8,13 +10,22 @@ import pytest
 if TYPE_CHECKING:
     from semantic_kernel.kernel import Kernel
 
-from semantic_kernel.connectors.ai.function_calling_utils import _combine_filter_dicts
+from semantic_kernel.connectors.ai.function_call_choice_configuration import FunctionCallChoiceConfiguration
+from semantic_kernel.connectors.ai.function_calling_utils import (
+    _combine_filter_dicts,
+    invoke_function_calls,
+    invoke_function_calls_as_completed,
+    kernel_function_metadata_to_function_call_format,
+)
 from semantic_kernel.connectors.ai.function_choice_behavior import (
     DEFAULT_MAX_AUTO_INVOKE_ATTEMPTS,
     FunctionChoiceBehavior,
     FunctionChoiceType,
 )
+from semantic_kernel.contents.chat_history import ChatHistory
+from semantic_kernel.contents.function_call_content import FunctionCallContent
 from semantic_kernel.exceptions import ServiceInitializationError
+from semantic_kernel.functions.kernel_function_decorator import kernel_function
 
 
 @pytest.fixture
@@ -230,3 +241,123 @@ def test_from_string_invalid():
         match="The specified type `invalid` is not supported. Allowed types are: `auto`, `none`, `required`.",
     ):
         FunctionChoiceBehavior.from_string("invalid")
+
+
+def test_get_function_call_timeout():
+    behavior = FunctionChoiceBehavior.Auto(function_call_timeout=10, function_timeouts={"plugin-slow": 60})
+
+    assert behavior.get_function_call_timeout("plugin-slow") == 60
+    assert behavior.get_function_call_timeout("plugin-fast") == 10
+    assert FunctionChoiceBehavior.Auto().get_function_call_timeout("plugin-fast") is None
+
+
+def test_function_call_choice_configuration_is_cached(kernel: "Kernel"):
+    kernel.add_plugin(SchedulerPlugin(), "scheduler")
+    behavior = FunctionChoiceBehavior.Auto(filters={"included_functions": ["scheduler-wait"]})
+
+    config = behavior.get_config(kernel)
+    assert behavior.get_config(kernel) is config
+    assert FunctionChoiceBehavior.Auto(filters={"included_functions": ["scheduler-wait"]}).get_config(kernel) is config
+    assert [f.fully_qualified_name for f in config.available_functions] == ["scheduler-wait"]
+    assert len(FunctionChoiceBehavior.Auto().get_config(kernel).available_functions) == 2
+
+    # Changing the functions, also directly in the plugin, creates a new configuration
+    kernel.add_plugin(SchedulerPlugin(), "other")
+    assert len(FunctionChoiceBehavior.Auto().get_config(kernel).available_functions) == 4
+    del kernel.plugins["scheduler"].functions["wait"]
+    assert behavior.get_config(kernel).available_functions == []
+
+
+def test_function_call_choice_configuration_get_tools(kernel: "Kernel"):
+    kernel.add_plugin(SchedulerPlugin(), "scheduler")
+    config = FunctionChoiceBehavior.Auto().get_config(kernel)
+    tool_format = Mock(side_effect=kernel_function_metadata_to_function_call_format)
+
+    tools = config.get_tools(tool_format)
+    tools.clear()
+
+    assert sorted(tool["function"]["name"] for tool in config.get_tools(tool_format)) == [
+        "scheduler-blocking",
+        "scheduler-wait",
+    ]
+    assert tool_format.call_count == 2
+    assert FunctionCallChoiceConfiguration(available_functions=[]).get_tools(tool_format) == []
+
+
+class SchedulerPlugin:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.thread_ids: list[int] = []
+
+    @kernel_function
+    async def wait(self, seconds: float) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(seconds)
+        self.in_flight -= 1
+        return f"waited {seconds}"
+
+    @kernel_function
+    def blocking(self) -> str:
+        self.thread_ids.append(threading.get_ident())
+        return "done"
+
+
+def _function_call(id: str, name: str, arguments: str = "{}") -> FunctionCallContent:
+    return FunctionCallContent(id=id, name=name, arguments=arguments)
+
+
+async def test_invoke_function_calls_as_completed_with_concurrency_limit(kernel: "Kernel"):
+    plugin = SchedulerPlugin()
+    kernel.add_plugin(plugin, "scheduler")
+    chat_history = ChatHistory()
+    function_calls = [
+        _function_call("1", "scheduler-wait", '{"seconds": 0.05}'),
+        _function_call("2", "scheduler-wait", '{"seconds": 0.01}'),
+        _function_call("3", "scheduler-wait", '{"seconds": 0.01}'),
+    ]
+
+    completed = [
+        function_call.id
+        async for function_call, _ in invoke_function_calls_as_completed(
+            kernel, function_calls, chat_history, FunctionChoiceBehavior.Auto(max_concurrent_function_calls=2)
+        )
+    ]
+
+    assert completed == ["2", "3", "1"]
+    assert plugin.max_in_flight == 2
+    assert [message.items[0].id for message in chat_history.messages] == ["2", "3", "1"]
+
+
+async def test_invoke_function_calls_with_timeout(kernel: "Kernel"):
+    kernel.add_plugin(SchedulerPlugin(), "scheduler")
+    chat_history = ChatHistory()
+    function_calls = [
+        _function_call("1", "scheduler-wait", '{"seconds": 5}'),
+        _function_call("2", "scheduler-wait", '{"seconds": 0.01}'),
+    ]
+
+    results = await invoke_function_calls(
+        kernel, function_calls, chat_history, FunctionChoiceBehavior.Auto(function_timeouts={"scheduler-wait": 0.1})
+    )
+
+    assert results == [None, None]
+    assert [message.items[0].result for message in chat_history.messages] == [
+        "waited 0.01",
+        "The tool call `scheduler-wait` timed out after 0.1 seconds.",
+    ]
+
+
+async def test_invoke_function_calls_runs_sync_functions_in_thread(kernel: "Kernel"):
+    plugin = SchedulerPlugin()
+    kernel.add_plugin(plugin, "scheduler")
+    function_calls = [_function_call("1", "scheduler-blocking")]
+
+    await invoke_function_calls(kernel, function_calls, ChatHistory(), FunctionChoiceBehavior.Auto())
+    await invoke_function_calls(
+        kernel, function_calls, ChatHistory(), FunctionChoiceBehavior.Auto(run_sync_functions_in_thread=True)
+    )
+
+    assert plugin.thread_ids[0] == threading.get_ident()
+    assert plugin.thread_ids[1] != threading.get_ident()
@@ -1,6 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from unittest.mock import patch
+
 from semantic_kernel.connectors.ai import PromptExecutionSettings
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatPromptExecutionSettings
 
 
 def test_init():
@@ -14,3 +17,39 @@ def test_init_with_data():
     settings = PromptExecutionSettings(service_id="test", extension_data=ext_data)
     assert settings.service_id == "test"
     assert settings.extension_data["test"] == "test"
+
+
+def test_copy_for_request():
+    settings = PromptExecutionSettings(service_id="test", extension_data={"stop": ["a"]})
+
+    copied = settings.copy_for_request()
+    copied.service_id = "other"
+    copied.extension_data["stop"] = ["b"]
+    copied.extension_data["new"] = 1
+
+    assert type(copied) is PromptExecutionSettings
+    assert settings.service_id == "test"
+    assert settings.extension_data == {"stop": ["a"]}
+
+
+def test_copy_for_request_caches_conversion():
+    settings = PromptExecutionSettings(service_id="test", max_tokens=10)
+
+    with patch.object(
+        OpenAIChatPromptExecutionSettings,
+        "from_prompt_execution_settings",
+        wraps=OpenAIChatPromptExecutionSettings.from_prompt_execution_settings,
+    ) as convert:
+        first = settings.copy_for_request(OpenAIChatPromptExecutionSettings)
+        first.max_tokens = 20
+        second = settings.copy_for_request(OpenAIChatPromptExecutionSettings)
+        assert convert.call_count == 1
+
+        settings.extension_data["max_tokens"] = 30
+        third = settings.copy_for_request(OpenAIChatPromptExecutionSettings)
+        assert convert.call_count == 2
+
+    assert isinstance(first, OpenAIChatPromptExecutionSettings)
+    assert first is not second
+    assert second.max_tokens == 10
+    assert third.max_tokens == 30
@@ -1,11 +1,12 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import faiss
+import numpy as np
 from pytest import fixture, mark, raises
 
-from semantic_kernel.connectors.faiss import FaissCollection, FaissStore
+from semantic_kernel.connectors.faiss import FaissCollection, FaissStore, _create_search_parameters
 from semantic_kernel.data.vector import DistanceFunction, VectorStoreCollectionDefinition, VectorStoreField
-from semantic_kernel.exceptions import VectorStoreInitializationException
+from semantic_kernel.exceptions import VectorStoreInitializationException, VectorStoreOperationException
 
 
 @fixture(scope="function")
@@ -78,17 +79,23 @@ async def test_ensure_collection_exists_custom(store, data_model_def):
     assert collection.inner_storage == {}
     assert collection.indexes
     assert collection.indexes["vector"] is not None
-    assert collection.indexes["vector"] == index
+    assert isinstance(collection.indexes["vector"], faiss.IndexIDMap2)
+    assert collection.indexes["vector"].d == index.d
     assert collection.indexes["vector"].is_trained is True
     await collection.ensure_collection_deleted()
 
 
 async def test_ensure_collection_exists_custom_untrained(store, data_model_def):
-    index = faiss.IndexIVFFlat(faiss.IndexFlat(5), 5, 10)
-    collection = store.get_collection(collection_name="test", record_type=dict, definition=data_model_def)
-    with raises(VectorStoreInitializationException):
-        await collection.ensure_collection_exists(index=index)
-    del index
+    index = faiss.IndexIVFFlat(faiss.IndexFlat(5), 5, 2)
+    collection = store.get_collection(
+        collection_name="test", record_type=dict, definition=data_model_def, training_size=4
+    )
+    await collection.ensure_collection_exists(index=index)
+    await collection.upsert([{"id": f"testid{i}", "content": "c", "vector": [float(i)] * 5} for i in range(3)])
+    assert not collection.indexes["vector"].is_trained
+    await collection.upsert({"id": "testid3", "content": "c", "vector": [3.0] * 5})
+    assert collection.indexes["vector"].is_trained
+    assert collection.indexes["vector"].ntotal == 4
 
 
 async def test_ensure_collection_exists_custom_dict(store, data_model_def):
@@ -98,7 +105,7 @@ async def test_ensure_collection_exists_custom_dict(store, data_model_def):
     assert collection.inner_storage == {}
     assert collection.indexes
     assert collection.indexes["vector"] is not None
-    assert collection.indexes["vector"] == index
+    assert isinstance(collection.indexes["vector"], faiss.IndexIDMap2)
     await collection.ensure_collection_deleted()
 
 
@@ -174,3 +181,292 @@ async def test_ensure_collection_exists_and_search(faiss_collection, dist):
         assert res.record == record1 if idx == 0 else record2
         idx += 1
     await faiss_collection.ensure_collection_deleted()
+
+
+async def test_snapshot_round_trip(faiss_collection, data_model_def, tmp_path):
+    await faiss_collection.ensure_collection_exists()
+    record1 = {"id": "testid1", "content": "test content", "vector": [1.0, 1.0, 1.0, 1.0, 1.0]}
+    record2 = {"id": "testid2", "content": "test content", "vector": [-1.0, -1.0, -1.0, -1.0, -1.0]}
+    await faiss_collection.upsert([record1, record2])
+    await faiss_collection.save_snapshot(tmp_path)
+
+    loaded = FaissCollection(record_type=dict, definition=data_model_def, collection_name="test")
+    await loaded.load_snapshot(tmp_path)
+    assert await loaded.collection_exists()
+    assert loaded.indexes["vector"].ntotal == 2
+    results = await loaded.search(vector=[0.9, 0.9, 0.9, 0.9, 0.9], vector_property_name="vector")
+    assert [res.record["id"] async for res in results.results] == ["testid1", "testid2"]
+    await loaded.upsert({"id": "testid3", "content": "test content", "vector": [2.0, 2.0, 2.0, 2.0, 2.0]})
+    assert loaded.indexes["vector"].ntotal == 3
+    assert faiss.read_index(str(tmp_path / "vector.faiss")).ntotal == 2
+
+
+async def test_bad_snapshot_keeps_records(faiss_collection, tmp_path):
+    await faiss_collection.ensure_collection_exists()
+    await faiss_collection.upsert({"id": "testid1", "content": "test content", "vector": [1.0] * 5})
+    await faiss_collection.save_snapshot(tmp_path)
+    (tmp_path / "vector.faiss").unlink()
+    await faiss_collection.upsert({"id": "testid2", "content": "test content", "vector": [-1.0] * 5})
+
+    with raises(VectorStoreOperationException):
+        await faiss_collection.load_snapshot(tmp_path)
+    assert set(faiss_collection.inner_storage) == {"testid1", "testid2"}
+    assert faiss_collection.indexes["vector"].ntotal == 2
+    results = await faiss_collection.search(vector=[-1.0] * 5, vector_property_name="vector", top=1)
+    assert [res.record["id"] async for res in results.results] == ["testid2"]
+
+
+async def test_ensure_collection_exists_custom_id_map(store, data_model_def):
+    index = faiss.IndexIDMap(faiss.IndexFlat(5))
+    collection = store.get_collection(collection_name="test", record_type=dict, definition=data_model_def)
+    await collection.ensure_collection_exists(index=index)
+    assert collection.indexes["vector"] is index
+
+
+async def test_ensure_collection_exists_custom_not_empty(store, data_model_def):
+    index = faiss.IndexFlat(5)
+    index.add(np.ones((1, 5), dtype=np.float32))
+    collection = store.get_collection(collection_name="test", record_type=dict, definition=data_model_def)
+    with raises(VectorStoreInitializationException):
+        await collection.ensure_collection_exists(index=index)
+
+
+async def test_upsert_existing_key_keeps_id(faiss_collection):
+    await faiss_collection.ensure_collection_exists()
+    await faiss_collection.upsert([
+        {"id": "testid1", "content": "test content", "vector": [1.0, 1.0, 1.0, 1.0, 1.0]},
+        {"id": "testid2", "content": "test content", "vector": [-1.0, -1.0, -1.0, -1.0, -1.0]},
+    ])
+    faiss_id = faiss_collection.indexes_key_map["vector"]["testid2"]
+    await faiss_collection.upsert({"id": "testid2", "content": "new content", "vector": [2.0, 2.0, 2.0, 2.0, 2.0]})
+    assert faiss_collection.indexes["vector"].ntotal == 2
+    assert faiss_collection.indexes_key_map["vector"]["testid2"] == faiss_id
+    assert faiss_collection.indexes["vector"].reconstruct(faiss_id).tolist() == [2.0] * 5
+    results = await faiss_collection.search(vector=[1.0] * 5, vector_property_name="vector", top=1, skip=0)
+    assert [res.record["id"] async for res in results.results] == ["testid2"]
+
+
+async def test_upsert_duplicate_keys(faiss_collection):
+    await faiss_collection.ensure_collection_exists()
+    await faiss_collection.upsert([
+        {"id": "a", "content": "first", "vector": [-1.0] * 5},
+        {"id": "a", "content": "second", "vector": [1.0] * 5},
+    ])
+    assert faiss_collection.indexes["vector"].ntotal == 1
+    assert list(faiss_collection._id_key_maps["vector"].values()) == ["a"]
+    results = await faiss_collection.search(vector=[1.0] * 5, vector_property_name="vector", include_total_count=True)
+    assert results.total_count == 1
+    assert [res.record["content"] async for res in results.results] == ["second"]
+
+    await faiss_collection.delete("a")
+    results = await faiss_collection.search(vector=[1.0] * 5, vector_property_name="vector", include_total_count=True)
+    assert results.total_count == 0
+    assert [res async for res in results.results] == []
+
+
+async def test_delete_batch_and_search(faiss_collection):
+    await faiss_collection.ensure_collection_exists()
+    await faiss_collection.upsert([
+        {"id": f"testid{i}", "content": "test content", "vector": [float(i)] * 5} for i in range(10)
+    ])
+    await faiss_collection.delete(["testid9", "testid8", "testid0"])
+    assert faiss_collection.indexes["vector"].ntotal == 7
+    results = await faiss_collection.search(
+        vector=[1.0] * 5, vector_property_name="vector", top=2, skip=1, include_total_count=True
+    )
+    assert results.total_count == 7
+    assert [res.record["id"] async for res in results.results] == ["testid6", "testid5"]
+
+
+async def test_search_with_filter(faiss_collection):
+    await faiss_collection.ensure_collection_exists()
+    await faiss_collection.upsert([
+        {"id": f"testid{i}", "content": f"content {i % 2}", "vector": [float(i)] * 5} for i in range(10)
+    ])
+    results = await faiss_collection.search(
+        vector=[1.0] * 5,
+        vector_property_name="vector",
+        filter="lambda x: x.content == 'content 0'",
+        top=3,
+        include_total_count=True,
+    )
+    assert results.total_count == 5
+    assert [res.record["id"] async for res in results.results] == ["testid8", "testid6", "testid4"]
+
+
+async def test_non_removable_index_is_compacted(store, data_model_def):
+    collection = store.get_collection(collection_name="test", record_type=dict, definition=data_model_def)
+    await collection.ensure_collection_exists(index=faiss.IndexHNSWFlat(5, 16, faiss.METRIC_INNER_PRODUCT))
+    await collection.upsert([{"id": f"testid{i}", "content": "c", "vector": [float(i)] * 5} for i in range(10)])
+    await collection.delete("testid9")
+    assert collection._deleted_ids["vector"] == {9}
+    assert collection.indexes["vector"].ntotal == 10
+    results = await collection.search(vector=[1.0] * 5, vector_property_name="vector", top=1)
+    assert [res.record["id"] async for res in results.results] == ["testid8"]
+    await collection.upsert({"id": "testid8", "content": "c", "vector": [0.5] * 5})
+    assert collection.indexes_key_map["vector"]["testid8"] == 10
+    await collection.delete("testid7")
+    # 3 out of 11 vectors are deleted, which triggers a rebuild
+    assert collection._deleted_ids["vector"] == set()
+    assert collection.indexes["vector"].ntotal == 8
+    results = await collection.search(vector=[1.0] * 5, vector_property_name="vector", top=1)
+    assert [res.record["id"] async for res in results.results] == ["testid6"]
+
+
+@fixture
+def ann_definition():
+    def _definition(index_kind: str, distance_function: str = "euclidean_squared_distance"):
+        return VectorStoreCollectionDefinition(
+            fields=[
+                VectorStoreField("key", name="id"),
+                VectorStoreField("data", name="content"),
+                VectorStoreField(
+                    "vector", name="vector", dimensions=8, index_kind=index_kind, distance_function=distance_function
+                ),
+            ]
+        )
+
+    return _definition
+
+
+@mark.parametrize("distance_function", ["euclidean_squared_distance", "dot_prod"])
+async def test_hnsw_index(ann_definition, distance_function):
+    collection = FaissCollection(
+        record_type=dict,
+        definition=ann_definition("hnsw", distance_function),
+        collection_name="test",
+        hnsw_m=8,
+    )
+    await collection.ensure_collection_exists()
+    inner_index = faiss.downcast_index(collection.indexes["vector"].index)
+    assert isinstance(inner_index, faiss.IndexHNSWFlat)
+    assert inner_index.hnsw.nb_neighbors(1) == 8
+    vectors = np.random.default_rng(1).random((50, 8))
+    await collection.upsert([{"id": str(i), "content": "c", "vector": vectors[i].tolist()} for i in range(50)])
+    results = await collection.search(vector=vectors[7].tolist(), vector_property_name="vector", top=1, ef_search=64)
+    if distance_function == "euclidean_squared_distance":
+        assert [res.record["id"] async for res in results.results] == ["7"]
+    else:
+        assert len([res async for res in results.results]) == 1
+
+
+async def test_ivf_index_trains_on_first_vectors(ann_definition):
+    collection = FaissCollection(
+        record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test", ivf_nlist=4, training_size=40
+    )
+    await collection.ensure_collection_exists()
+    vectors = np.random.default_rng(2).random((60, 8))
+    await collection.upsert([{"id": str(i), "content": "c", "vector": vectors[i].tolist()} for i in range(30)])
+    assert "vector" in collection._staging_indexes
+    assert not collection.indexes["vector"].is_trained
+    # searching before training uses the staging index
+    results = await collection.search(vector=vectors[3].tolist(), vector_property_name="vector", top=1)
+    assert [res.record["id"] async for res in results.results] == ["3"]
+    await collection.delete("29")
+    await collection.upsert([{"id": str(i), "content": "c", "vector": vectors[i].tolist()} for i in range(30, 60)])
+    assert collection._staging_indexes == {}
+    assert collection.indexes["vector"].is_trained
+    assert collection.indexes["vector"].ntotal == 59
+    results = await collection.search(
+        vector=vectors[42].tolist(), vector_property_name="vector", top=1, nprobe=4, include_total_count=True
+    )
+    assert results.total_count == 59
+    assert [res.record["id"] async for res in results.results] == ["42"]
+
+
+async def test_ivf_index_explicit_train(ann_definition):
+    collection = FaissCollection(
+        record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test", ivf_nlist=2
+    )
+    await collection.ensure_collection_exists()
+    vectors = np.random.default_rng(3).random((10, 8))
+    await collection.upsert([{"id": str(i), "content": "c", "vector": vectors[i].tolist()} for i in range(10)])
+    assert not collection.indexes["vector"].is_trained
+    await collection.train()
+    assert collection.indexes["vector"].is_trained
+    assert collection.indexes["vector"].ntotal == 10
+
+
+async def test_ivf_index_train_too_few_vectors(ann_definition):
+    collection = FaissCollection(
+        record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test", ivf_nlist=10
+    )
+    await collection.ensure_collection_exists()
+    await collection.upsert({"id": "1", "content": "c", "vector": [1.0] * 8})
+    with raises(VectorStoreOperationException):
+        await collection.train()
+    assert "vector" in collection._staging_indexes
+
+
+async def test_ivf_index_filter_and_delete(ann_definition):
+    collection = FaissCollection(
+        record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test", ivf_nlist=2, training_size=20
+    )
+    await collection.ensure_collection_exists()
+    vectors = np.random.default_rng(5).random((30, 8))
+    await collection.upsert([
+        {"id": str(i), "content": f"content {i % 2}", "vector": vectors[i].tolist()} for i in range(30)
+    ])
+    inner_index = faiss.downcast_index(collection.indexes["vector"].index)
+    inner_index.nprobe = 2
+    # A filtered search without nprobe uses the IVF parameters, with the nprobe of the index
+    results = await collection.search(
+        vector=vectors[7].tolist(), vector_property_name="vector", filter="lambda x: x.content == 'content 1'", top=1
+    )
+    assert [res.record["id"] async for res in results.results] == ["7"]
+    # Removing from the id map would mix up the ids of the IVF lists, so deleted ids are skipped instead
+    await collection.delete("5")
+    assert collection._deleted_ids["vector"] == {5}
+    for key in (7, 8):
+        results = await collection.search(vector=vectors[key].tolist(), vector_property_name="vector", top=1)
+        assert [res.record["id"] async for res in results.results] == [str(key)]
+
+
+async def test_ivf_snapshot_load_and_write(ann_definition, tmp_path):
+    collection = FaissCollection(
+        record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test", ivf_nlist=2, training_size=20
+    )
+    await collection.ensure_collection_exists()
+    vectors = np.random.default_rng(4).random((30, 8))
+    await collection.upsert([{"id": str(i), "content": "c", "vector": vectors[i].tolist()} for i in range(30)])
+    await collection.save_snapshot(tmp_path)
+
+    loaded = FaissCollection(record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test")
+    await loaded.load_snapshot(tmp_path)
+    await loaded.upsert([
+        {"id": "1", "content": "c", "vector": vectors[2].tolist()},
+        {"id": "30", "content": "c", "vector": vectors[3].tolist()},
+    ])
+    await loaded.delete("5")
+    assert set(loaded.inner_storage) == {str(i) for i in range(31)} - {"5"}
+    await loaded.save_snapshot(tmp_path / "changed")
+
+    # Memory-mapped indexes cannot be changed, writes are rejected instead of aborting in Faiss
+    mapped = FaissCollection(record_type=dict, definition=ann_definition("ivf_flat"), collection_name="test")
+    await mapped.load_snapshot(tmp_path, mmap_indexes=True)
+    results = await mapped.search(vector=vectors[7].tolist(), vector_property_name="vector", top=1, nprobe=2)
+    assert [res.record["id"] async for res in results.results] == ["7"]
+    with raises(VectorStoreOperationException):
+        await mapped.upsert({"id": "31", "content": "c", "vector": vectors[4].tolist()})
+    with raises(VectorStoreOperationException):
+        await mapped.delete("7")
+    assert "7" in mapped.inner_storage
+    await mapped.load_snapshot(tmp_path / "changed")
+    await mapped.delete("7")
+    assert "7" not in mapped.inner_storage
+
+
+def test_search_parameters():
+    ivf = faiss.IndexIDMap2(faiss.IndexIVFFlat(faiss.IndexFlatL2(4), 4, 2))
+    hnsw = faiss.IndexIDMap2(faiss.IndexHNSWFlat(4, 8))
+    flat = faiss.IndexIDMap2(faiss.IndexFlatL2(4))
+    selector = faiss.IDSelectorBatch(np.array([1], dtype=np.int64))
+    assert _create_search_parameters(flat, None, nprobe=4) is None
+    assert isinstance(_create_search_parameters(flat, selector, nprobe=4), faiss.SearchParameters)
+    assert _create_search_parameters(ivf, None, nprobe=4).nprobe == 4
+    assert _create_search_parameters(ivf, None) is None
+    ivf_parameters = _create_search_parameters(ivf, selector)
+    assert isinstance(ivf_parameters, faiss.SearchParametersIVF)
+    assert ivf_parameters.nprobe == 1
+    assert isinstance(_create_search_parameters(hnsw, selector), faiss.SearchParametersHNSW)
+    assert _create_search_parameters(hnsw, selector, ef_search=32).efSearch == 32
@@ -1,9 +1,18 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from pytest import fixture, mark, raises
+import json
 
-from semantic_kernel.connectors.in_memory import InMemoryCollection, InMemoryStore
-from semantic_kernel.data.vector import DistanceFunction
+import numpy as np
+from pytest import approx, fixture, mark, raises
+
+from semantic_kernel.connectors.in_memory import (
+    DataFieldIndex,
+    IndexCondition,
+    InMemoryCollection,
+    InMemoryStore,
+    VectorMatrix,
+)
+from semantic_kernel.data.vector import DistanceFunction, VectorStoreCollectionDefinition, VectorStoreField
 from semantic_kernel.exceptions.vector_store_exceptions import VectorStoreOperationException
 
 
@@ -172,3 +181,310 @@ async def test_multiple_filters(collection):
     results = collection._get_filtered_records(type("opt", (), {"filter": filters})())
     assert len(results) == 1
     assert "1" in results
+
+
+@fixture
+def columnar_collection(definition):
+    return InMemoryCollection(collection_name="test", record_type=dict, definition=definition, columnar=True)
+
+
+@mark.parametrize(
+    "distance_function",
+    [
+        DistanceFunction.COSINE_DISTANCE,
+        DistanceFunction.COSINE_SIMILARITY,
+        DistanceFunction.EUCLIDEAN_DISTANCE,
+        DistanceFunction.MANHATTAN,
+        DistanceFunction.EUCLIDEAN_SQUARED_DISTANCE,
+        DistanceFunction.DOT_PROD,
+        DistanceFunction.HAMMING,
+        DistanceFunction.DEFAULT,
+    ],
+)
+async def test_columnar_search_matches_row_search(collection, columnar_collection, distance_function):
+    rng = np.random.default_rng(42)
+    records = [{"id": f"id{i}", "content": "content", "vector": rng.random(5).round(1).tolist()} for i in range(50)]
+    query = rng.random(5).tolist()
+    for coll in (collection, columnar_collection):
+        for field in coll.definition.fields:
+            if field.name == "vector":
+                field.distance_function = distance_function
+        await coll.upsert(records)
+    expected = await collection.search(vector=query, vector_property_name="vector", top=5, skip=2)
+    actual = await columnar_collection.search(
+        vector=query, vector_property_name="vector", top=5, skip=2, include_total_count=True
+    )
+    expected_scores = [res.score async for res in expected.results]
+    actual_scores = [res.score async for res in actual.results]
+    assert actual.total_count == 50
+    assert actual_scores == approx(expected_scores, rel=1e-4, abs=1e-5)
+
+
+async def test_columnar_upsert_and_delete(columnar_collection):
+    record1 = {"id": "testid1", "content": "test content", "vector": [1.0, 1.0, 1.0, 1.0, 1.0]}
+    record2 = {"id": "testid2", "content": "test content", "vector": [-1.0, -1.0, -1.0, -1.0, -1.0]}
+    await columnar_collection.upsert([record1, record2])
+    matrix = columnar_collection._vector_matrices["vector"]
+    assert len(matrix) == 2
+    await columnar_collection.upsert({"id": "testid2", "content": "test content", "vector": [1.0] * 5})
+    assert len(matrix) == 2
+    assert matrix.vectors[matrix.key_to_row["testid2"]].tolist() == [1.0] * 5
+    await columnar_collection.delete("testid1")
+    assert len(matrix) == 1
+    assert matrix.row_keys == ["testid2"]
+    results = await columnar_collection.search(
+        vector=[1.0] * 5, vector_property_name="vector", include_total_count=True
+    )
+    assert results.total_count == 1
+    assert [res.record["id"] async for res in results.results] == ["testid2"]
+    await columnar_collection.ensure_collection_deleted()
+    assert columnar_collection._vector_matrices == {}
+
+
+async def test_columnar_search_with_filter(columnar_collection):
+    records = [{"id": str(i), "content": f"content {i % 2}", "vector": [float(i)] * 5} for i in range(1, 11)]
+    await columnar_collection.upsert(records)
+    results = await columnar_collection.search(
+        vector=[1.0] * 5,
+        vector_property_name="vector",
+        filter="lambda x: x.content == 'content 0'",
+        top=2,
+        include_total_count=True,
+    )
+    assert results.total_count == 5
+    assert {res.record["id"] async for res in results.results} <= {"2", "4", "6", "8", "10"}
+
+
+async def test_columnar_wrong_dimensions(columnar_collection):
+    await columnar_collection.upsert({"id": "1", "content": "content", "vector": [1.0] * 5})
+    with raises(VectorStoreOperationException):
+        await columnar_collection.upsert([
+            {"id": "1", "content": "changed", "vector": [2.0] * 5},
+            {"id": "2", "content": "content", "vector": [1.0, 2.0]},
+        ])
+    # Nothing is written when a vector does not fit, so the records and the matrix still agree
+    assert set(columnar_collection.inner_storage) == {"1"}
+    assert columnar_collection.inner_storage["1"]["content"] == "content"
+    assert columnar_collection._vector_matrices["vector"].row_keys == ["1"]
+
+
+async def test_columnar_without_dimensions():
+    vector_field = VectorStoreField("vector", name="vector", dimensions=2)
+    vector_field.dimensions = None
+    definition = VectorStoreCollectionDefinition(fields=[VectorStoreField("key", name="id"), vector_field])
+    collection = InMemoryCollection(collection_name="test", record_type=dict, definition=definition, columnar=True)
+    with raises(VectorStoreOperationException):
+        await collection.upsert({"id": "1", "vector": [1.0, 2.0]})
+    assert collection.inner_storage == {}
+
+
+async def test_columnar_duplicate_keys(columnar_collection):
+    await columnar_collection.upsert([
+        {"id": "1", "content": "first", "vector": [-1.0] * 5},
+        {"id": "2", "content": "other", "vector": [0.5] * 5},
+        {"id": "1", "content": "second", "vector": [1.0] * 5},
+    ])
+    matrix = columnar_collection._vector_matrices["vector"]
+    assert len(matrix) == 2
+    assert matrix.live_rows().tolist() == [0, 1]
+    assert matrix.vectors[matrix.key_to_row["1"]].tolist() == [1.0] * 5
+    results = await columnar_collection.search(
+        vector=[1.0] * 5, vector_property_name="vector", include_total_count=True
+    )
+    assert results.total_count == 2
+    assert [res.record["content"] async for res in results.results] == ["second", "other"]
+
+
+def test_vector_matrix_growth_and_compaction():
+    matrix = VectorMatrix(dimensions=2, initial_capacity=2)
+    matrix.upsert([str(i) for i in range(10)], [[float(i), 0.0] for i in range(10)])
+    assert matrix.vectors.shape[0] >= 10
+    matrix.delete([str(i) for i in range(5)])
+    assert matrix.size == 5
+    assert matrix.row_keys == ["5", "6", "7", "8", "9"]
+    scores = matrix.score([1.0, 0.0], DistanceFunction.DOT_PROD, matrix.live_rows())
+    assert scores.tolist() == [5.0, 6.0, 7.0, 8.0, 9.0]
+    matrix.upsert(["5", "10", "5"], [[50.0, 0.0], [10.0, 0.0], [55.0, 0.0]])
+    assert len(matrix) == 6
+    assert matrix.vectors[matrix.key_to_row["5"]].tolist() == [55.0, 0.0]
+
+
+@fixture
+def indexed_collection():
+    definition = VectorStoreCollectionDefinition(
+        fields=[
+            VectorStoreField("key", name="id", type="str"),
+            VectorStoreField("data", name="tenant", type="str", is_indexed=True),
+            VectorStoreField("data", name="rank", type="int", is_indexed=True),
+            VectorStoreField("data", name="content", type="str"),
+            VectorStoreField("vector", name="vector", dimensions=2),
+        ]
+    )
+    return InMemoryCollection(collection_name="test", record_type=dict, definition=definition, columnar=True)
+
+
+@fixture
+async def indexed_records(indexed_collection):
+    records = [
+        {"id": str(i), "tenant": f"tenant{i % 3}", "rank": i, "content": f"content {i}", "vector": [float(i), 1.0]}
+        for i in range(30)
+    ]
+    await indexed_collection.upsert(records)
+    return records
+
+
+@mark.parametrize(
+    "filter, expected",
+    [
+        ("lambda x: x.tenant == 'tenant1'", {str(i) for i in range(1, 30, 3)}),
+        ("lambda x: x['tenant'] == 'tenant1' and x.rank < 10", {"1", "4", "7"}),
+        ("lambda x: 25 <= x.rank", {"25", "26", "27", "28", "29"}),
+        ("lambda x: 3 < x.rank <= 5", {"4", "5"}),
+        ("lambda x: x.tenant in ['tenant0', 'tenant2'] and x.rank > 25", {"26", "27", "29"}),
+        ("lambda x: x.tenant == 'tenant0' or x.rank == 1", {str(i) for i in range(0, 30, 3)} | {"1"}),
+        ("lambda x: x.rank >= 28 and x.content != 'content 28'", {"29"}),
+        (["lambda x: x.tenant == 'tenant2'", "lambda x: x.rank < 6"], {"2", "5"}),
+    ],
+)
+async def test_indexed_filters(indexed_collection, indexed_records, filter, expected):
+    results = indexed_collection._get_filtered_records(type("opt", (), {"filter": filter})())
+    assert set(results) == expected
+
+
+async def test_indexed_filter_prunes_candidates(indexed_collection, indexed_records):
+    calls = []
+    original = indexed_collection._run_filter
+    indexed_collection._run_filter = lambda filter, record: calls.append(record["id"]) or original(filter, record)
+    results = indexed_collection._get_filtered_records(type("opt", (), {"filter": "lambda x: x.tenant == 'tenant1'"})())
+    assert len(results) == 10
+    assert len(calls) == 10
+
+
+async def test_indexed_filter_is_cached(indexed_collection, indexed_records):
+    filter = "lambda x: x.rank == 3"
+    first = indexed_collection._compile_filter(filter)
+    assert first.conditions == [IndexCondition(field_name="rank", operator="eq", value=3)]
+    assert indexed_collection._compile_filter(filter) is first
+
+
+async def test_indexed_filter_after_update_and_delete(indexed_collection, indexed_records):
+    await indexed_collection.upsert({"id": "1", "tenant": "tenant0", "rank": 100, "content": "c", "vector": [1.0, 1.0]})
+    await indexed_collection.delete("4")
+    results = indexed_collection._get_filtered_records(type("opt", (), {"filter": "lambda x: x.tenant == 'tenant1'"})())
+    assert "1" not in results
+    assert "4" not in results
+    results = indexed_collection._get_filtered_records(type("opt", (), {"filter": "lambda x: x.rank > 50"})())
+    assert set(results) == {"1"}
+
+
+async def test_indexed_search(indexed_collection, indexed_records):
+    results = await indexed_collection.search(
+        vector=[10.0, 1.0],
+        vector_property_name="vector",
+        filter=lambda x: x.tenant == "tenant2",
+        top=2,
+        include_total_count=True,
+    )
+    assert results.total_count == 10
+    assert [res.record["id"] async for res in results.results] == ["11", "8"]
+
+
+def test_data_field_index_unhashable_and_unsortable():
+    index = DataFieldIndex()
+    index.add("a", 1)
+    index.add("b", [1, 2])
+    index.add("c", "text")
+    assert index.lookup(IndexCondition(field_name="f", operator="eq", value=1)) == {"a", "b"}
+    assert index.lookup(IndexCondition(field_name="f", operator="gt", value=0)) is None
+    index.remove("b")
+    index.remove("c")
+    assert index.lookup(IndexCondition(field_name="f", operator="ge", value=1)) == {"a"}
+
+
+@mark.parametrize("mmap", [True, False])
+async def test_snapshot_round_trip(indexed_collection, indexed_records, tmp_path, mmap):
+    await indexed_collection.delete("3")
+    await indexed_collection.save_snapshot(tmp_path)
+    loaded = InMemoryCollection(
+        collection_name="test", record_type=dict, definition=indexed_collection.definition, columnar=True
+    )
+    await loaded.load_snapshot(tmp_path, mmap=mmap)
+    assert set(loaded.inner_storage) == set(indexed_collection.inner_storage)
+    assert loaded.inner_storage["5"]["vector"].tolist() == [5.0, 1.0]
+    assert isinstance(loaded._vector_matrices["vector"].vectors, np.memmap) is mmap
+    results = await loaded.search(
+        vector=[10.0, 1.0], vector_property_name="vector", filter="lambda x: x.tenant == 'tenant2'", top=2
+    )
+    assert [res.record["id"] async for res in results.results] == ["11", "8"]
+    await loaded.upsert({"id": "100", "tenant": "tenant2", "rank": 100, "content": "new", "vector": [11.0, 1.0]})
+    assert loaded.inner_storage["5"]["vector"].tolist() == [5.0, 1.0]
+    assert np.load(tmp_path / "vector.npy").shape == (29, 2)
+
+
+@mark.parametrize("columnar", [True, False])
+async def test_snapshot_save_over_loaded_snapshot(indexed_collection, tmp_path, columnar):
+    await indexed_collection.upsert([
+        {"id": str(i), "tenant": "tenant", "rank": i, "content": "content", "vector": [float(i), 1.0]}
+        for i in range(2000)
+    ])
+    await indexed_collection.save_snapshot(tmp_path)
+    loaded = InMemoryCollection(
+        collection_name="test", record_type=dict, definition=indexed_collection.definition, columnar=columnar
+    )
+    await loaded.load_snapshot(tmp_path)
+
+    # The loaded vectors are memory-mapped from the files that are saved again
+    await loaded.delete("0")
+    await loaded.save_snapshot(tmp_path)
+
+    assert loaded.inner_storage["5"]["vector"].tolist() == [5.0, 1.0]
+    assert loaded.inner_storage["1999"]["vector"].tolist() == [1999.0, 1.0]
+    reloaded = InMemoryCollection(
+        collection_name="test", record_type=dict, definition=indexed_collection.definition, columnar=columnar
+    )
+    await reloaded.load_snapshot(tmp_path)
+    assert "0" not in reloaded.inner_storage
+    assert reloaded.inner_storage["1999"]["vector"].tolist() == [1999.0, 1.0]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+async def test_snapshot_without_columnar(collection, tmp_path):
+    await collection.upsert({"id": "testid", "content": "test content", "vector": [0.1, 0.2, 0.3, 0.4, 0.5]})
+    await collection.save_snapshot(tmp_path)
+    loaded = InMemoryCollection(collection_name="test", record_type=dict, definition=collection.definition)
+    await loaded.load_snapshot(tmp_path)
+    result = await loaded.get("testid", include_vectors=True)
+    assert result["content"] == "test content"
+    assert result["vector"] == approx([0.1, 0.2, 0.3, 0.4, 0.5])
+
+
+async def test_snapshot_mismatch(collection, indexed_collection, tmp_path):
+    await collection.save_snapshot(tmp_path)
+    with raises(VectorStoreOperationException):
+        await indexed_collection.load_snapshot(tmp_path)
+    with raises(VectorStoreOperationException):
+        await collection.load_snapshot(tmp_path / "missing")
+
+
+@mark.parametrize("broken_file", ["vector.npy", "vector.norms.npy", "manifest"])
+async def test_bad_snapshot_keeps_records(indexed_collection, indexed_records, tmp_path, broken_file):
+    await indexed_collection.save_snapshot(tmp_path)
+    if broken_file == "manifest":
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        manifest["vector_fields"]["vector"]["dimensions"] = 3
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    else:
+        (tmp_path / broken_file).unlink()
+    await indexed_collection.delete("0")
+
+    with raises(VectorStoreOperationException):
+        await indexed_collection.load_snapshot(tmp_path)
+    assert set(indexed_collection.inner_storage) == {str(i) for i in range(1, 30)}
+    assert len(indexed_collection._vector_matrices["vector"]) == 29
+    results = await indexed_collection.search(
+        vector=[1.0, 1.0],
+        vector_property_name="vector",
+        filter="lambda x: x.tenant == 'tenant1'",
+        include_total_count=True,
+    )
+    assert results.total_count == 10
@@ -376,6 +376,46 @@ async def test_template_unsafe(chat_history: ChatHistory):
     assert chat_history_2.messages[2].role == AuthorRole.USER
 
 
+@pytest.mark.parametrize(
+    "parts",
+    [
+        ["system stuff", "history", '<message role="user">What can you do?</message>'],
+        ["history", "What &lt;can&gt; you do?"],
+        ["history"],
+        ['<message role="user">first</message>', "history", "history"],
+    ],
+)
+def test_chat_history_from_rendered_prompt_parts(parts: list[str]):
+    embedded = ChatHistory()
+    embedded.add_system_message("be <nice>")
+    embedded.add_user_message("hello")
+    embedded.add_assistant_message("a & b")
+    parts = [embedded if part == "history" else part for part in parts]
+
+    chat_history = ChatHistory.from_rendered_prompt_parts(parts)
+
+    assert chat_history == ChatHistory.from_rendered_prompt("".join(str(part) for part in parts))
+
+
+def test_chat_history_from_rendered_prompt_parts_copies_messages():
+    embedded = ChatHistory()
+    embedded.add_user_message("hello")
+
+    chat_history = ChatHistory.from_rendered_prompt_parts([embedded])
+    chat_history.messages[0].items.append(TextContent(text="more"))
+
+    assert chat_history.messages[0] is not embedded.messages[0]
+    assert len(embedded.messages[0].items) == 1
+
+
+@pytest.mark.parametrize("parts", [['<message role="user">', "history", "</message>"], ["<message", "history"]])
+def test_chat_history_from_rendered_prompt_parts_needs_parsing(parts: list[str]):
+    embedded = ChatHistory()
+    embedded.add_user_message("hello")
+
+    assert ChatHistory.from_rendered_prompt_parts([embedded if p == "history" else p for p in parts]) is None
+
+
 async def test_template_safe(chat_history: ChatHistory):
     chat_history.add_assistant_message("I am an AI assistant")
 
@@ -0,0 +1,172 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from semantic_kernel.connectors.ai.chat_completion_client_base import ChatCompletionClientBase
+from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
+from semantic_kernel.contents.chat_message_content import ChatMessageContent
+from semantic_kernel.contents.function_call_content import FunctionCallContent
+from semantic_kernel.contents.function_result_content import FunctionResultContent
+from semantic_kernel.contents.history_reducer.chat_history_reducer_utils import (
+    SUMMARY_METADATA_KEY,
+    estimate_token_count,
+)
+from semantic_kernel.contents.history_reducer.chat_history_token_budget_reducer import ChatHistoryTokenBudgetReducer
+from semantic_kernel.contents.utils.author_role import AuthorRole
+from semantic_kernel.exceptions.content_exceptions import ChatHistoryReducerException
+
+
+def count_words(message: ChatMessageContent) -> int:
+    return len(str(message).split())
+
+
+@pytest.fixture
+def mock_service():
+    service = MagicMock(spec=ChatCompletionClientBase)
+    service.get_chat_message_content = AsyncMock()
+    return service
+
+
+@pytest.fixture
+def chat_messages():
+    return [
+        ChatMessageContent(role=AuthorRole.USER, content="one two three"),
+        ChatMessageContent(role=AuthorRole.ASSISTANT, content="four five"),
+        ChatMessageContent(role=AuthorRole.USER, content="six seven eight nine"),
+        ChatMessageContent(role=AuthorRole.ASSISTANT, content="ten"),
+    ]
+
+
+def test_token_budget_reducer_defaults():
+    reducer = ChatHistoryTokenBudgetReducer(max_tokens=100)
+    assert reducer.target_count == 1
+    assert reducer.threshold_tokens == 0
+    assert reducer.token_counter is estimate_token_count
+    assert reducer.service is None
+
+
+def test_token_budget_reducer_eq_and_hash():
+    r1 = ChatHistoryTokenBudgetReducer(max_tokens=100, threshold_tokens=10)
+    r2 = ChatHistoryTokenBudgetReducer(max_tokens=100, threshold_tokens=10)
+    r3 = ChatHistoryTokenBudgetReducer(max_tokens=100)
+    assert r1 == r2
+    assert r1 != r3
+    assert hash(r1) == hash(r2)
+    assert hash(r1) != hash(r3)
+
+
+def test_estimate_token_count():
+    message = ChatMessageContent(role=AuthorRole.USER, content="Hello, world!")
+    assert estimate_token_count(message) == -(-len(str(message.to_dict())) // 4)
+
+
+async def test_token_budget_reducer_no_need(chat_messages):
+    reducer = ChatHistoryTokenBudgetReducer(max_tokens=8, threshold_tokens=2, token_counter=count_words)
+    reducer.messages = chat_messages
+
+    assert reducer.token_count == 10
+    assert await reducer.reduce() is None
+    assert len(reducer.messages) == 4
+
+
+async def test_token_budget_reducer_reduce(chat_messages):
+    reducer = ChatHistoryTokenBudgetReducer(max_tokens=6, token_counter=count_words)
+    reducer.messages = chat_messages
+
+    assert await reducer.reduce() is reducer
+    assert reducer.messages == chat_messages[2:]
+    assert reducer.token_count == 5
+
+
+async def test_token_budget_reducer_keeps_target_count(chat_messages):
+    reducer = ChatHistoryTokenBudgetReducer(max_tokens=1, target_count=2, token_counter=count_words)
+    reducer.messages = chat_messages
+
+    await reducer.reduce()
+
+    assert reducer.messages == chat_messages[2:]
+    assert reducer.token_count == 5
+
+
+async def test_token_budget_reducer_keeps_function_call_pairs():
+    call = ChatMessageContent(
+        role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id="call", name="plugin-function", arguments="{}")]
+    )
+    result = ChatMessageContent(role=AuthorRole.TOOL, items=[FunctionResultContent(id="call", result="a " * 50)])
+    messages = [
+        ChatMessageContent(role=AuthorRole.USER, content="question"),
+        call,
+        result,
+        ChatMessageContent(role=AuthorRole.ASSISTANT, content="answer"),
+    ]
+    token_counts = {id(message): count for message, count in zip(messages, [1, 1, 50, 1])}
+    reducer = ChatHistoryTokenBudgetReducer(max_tokens=52, token_counter=lambda message: token_counts[id(message)])
+    reducer.messages = messages
+
+    # Removing the question is enough for the budget, the call is kept with its result
+    await reducer.reduce()
+    assert reducer.messages == messages[1:]
+
+    # The call cannot be removed without its result
+    reducer.max_tokens = 51
+    await reducer.reduce()
+    assert reducer.messages == messages[3:]
+
+
+async def test_token_budget_reducer_counts_messages_once(chat_messages):
+    counted = []
+
+    def token_counter(message):
+        counted.append(message)
+        return count_words(message)
+
+    reducer = ChatHistoryTokenBudgetReducer(max_tokens=6, auto_reduce=True, token_counter=token_counter)
+    for message in chat_messages:
+        await reducer.add_message_async(message)
+    await reducer.add_message_async(ChatMessageContent(role=AuthorRole.USER, content="eleven"))
+
+    assert counted == [*chat_messages, reducer.messages[-1]]
+    assert reducer.messages[:-1] == chat_messages[2:]
+    assert reducer.token_count == 6
+
+    # Replaced messages are counted again, with the counts cached on the messages
+    reducer.messages = list(chat_messages)
+    assert reducer.token_count == 10
+    assert len(counted) == 5
+
+
+async def test_token_budget_reducer_summarizes(chat_messages, mock_service):
+    mock_service.get_chat_message_content.return_value = ChatMessageContent(
+        role=AuthorRole.ASSISTANT, content="summary"
+    )
+    reducer = ChatHistoryTokenBudgetReducer(
+        max_tokens=6, token_counter=count_words, service=mock_service, execution_settings=PromptExecutionSettings()
+    )
+    reducer.messages = chat_messages
+
+    await reducer.reduce()
+
+    summary = reducer.messages[0]
+    assert summary.content == "summary"
+    assert summary.metadata[SUMMARY_METADATA_KEY] is True
+    assert reducer.messages[1:] == chat_messages[2:]
+    assert reducer.token_count == 6
+    summarized = mock_service.get_chat_message_content.call_args.kwargs["chat_history"].messages
+    assert summarized[:2] == chat_messages[:2]
+
+
+async def test_token_budget_reducer_summarization_fails(chat_messages, mock_service):
+    mock_service.get_chat_message_content.side_effect = Exception("failed")
+    reducer = ChatHistoryTokenBudgetReducer(
+        max_tokens=6, token_counter=count_words, service=mock_service, execution_settings=PromptExecutionSettings()
+    )
+    reducer.messages = chat_messages
+
+    with pytest.raises(ChatHistoryReducerException):
+        await reducer.reduce()
+
+    reducer.fail_on_error = False
+    assert await reducer.reduce() is None
+    assert reducer.messages == chat_messages
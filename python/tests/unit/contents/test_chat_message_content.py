@@ -415,3 +415,47 @@ def test_cmc_with_unhashable_types_can_hash():
 
     for message in user_messages:
         assert hash(message) is not None
+
+
+def test_cmc_get_cached_format():
+    calls = []
+
+    def formatter(message, key):
+        calls.append(key)
+        return {key: message.content}
+
+    message = ChatMessageContent(role=AuthorRole.USER, content="Hello, world!")
+    formatted = message.get_cached_format(formatter, "text")
+    assert message.get_cached_format(formatter, "text") is formatted
+    assert message.get_cached_format(formatter, "other") == {"other": "Hello, world!"}
+    assert calls == ["text", "other"]
+
+
+def test_cmc_to_dict_cache_invalidation():
+    message = ChatMessageContent(role=AuthorRole.USER, content="Hello, world!")
+    assert message.to_dict() == {"role": "user", "content": "Hello, world!"}
+
+    message.items[0].text = "Hello, again!"
+    assert message.to_dict() == {"role": "user", "content": "Hello, again!"}
+
+    message.role = AuthorRole.ASSISTANT
+    assert message.to_dict() == {"role": "assistant", "content": "Hello, again!"}
+
+    message.items.append(TextContent(text="Goodbye!"))
+    assert message.to_dict()["content"] == [
+        {"type": "text", "text": "Hello, again!"},
+        {"type": "text", "text": "Goodbye!"},
+    ]
+
+    message.items[1] = FunctionCallContent(id="test", name="plugin-function", arguments="{}")
+    assert message.to_dict()["tool_calls"][0]["id"] == "test"
+
+
+def test_cmc_copy_has_own_cache():
+    message = ChatMessageContent(role=AuthorRole.USER, content="Hello, world!")
+    assert message.to_dict()["role"] == "user"
+
+    copied = message.model_copy(update={"role": AuthorRole.ASSISTANT})
+
+    assert copied.to_dict()["role"] == "assistant"
+    assert message.to_dict()["role"] == "user"
@@ -10,6 +10,7 @@ from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_completion impo
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.const import METADATA_EXCEPTION_KEY
 from semantic_kernel.contents import AuthorRole
+from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
 from semantic_kernel.contents.streaming_chat_message_content import StreamingChatMessageContent
 from semantic_kernel.contents.text_content import TextContent
@@ -384,6 +385,48 @@ async def test_prompt_render_with_filter(kernel: Kernel, openai_unit_test_env):
     assert prompt_render_result.rendered_prompt == "preface test"
 
 
+async def test_invoke_chat_uses_rendered_chat_history(openai_unit_test_env):
+    kernel = Kernel()
+    kernel.add_service(OpenAIChatCompletion(service_id="test", ai_model_id="test"))
+    function = KernelFunctionFromPrompt(function_name="test", plugin_name="test", prompt="{{$history}}{{$input}}")
+    history = ChatHistory()
+    history.add_user_message("hello")
+    history.add_assistant_message("hi")
+
+    with (
+        patch(
+            "semantic_kernel.connectors.ai.open_ai.services.open_ai_chat_completion.OpenAIChatCompletion.get_chat_message_contents"
+        ) as mock,
+        patch.object(ChatHistory, "from_rendered_prompt") as mock_parse,
+    ):
+        mock.return_value = [ChatMessageContent(role=AuthorRole.ASSISTANT, content="test")]
+        result = await function.invoke(kernel=kernel, history=history, input="question")
+
+    mock_parse.assert_not_called()
+    assert [message.content for message in mock.call_args.kwargs["chat_history"]] == ["hello", "hi", "question"]
+    assert result.rendered_prompt == f"{history}question"
+
+
+async def test_prompt_render_with_filter_parses_changed_prompt(kernel: Kernel, openai_unit_test_env):
+    kernel.add_service(OpenAIChatCompletion(service_id="default", ai_model_id="test"))
+
+    @kernel.filter("prompt_rendering")
+    async def prompt_rendering_filter(context: PromptRenderContext, next):
+        await next(context)
+        assert context.get_rendered_chat_history() is not None
+        context.rendered_prompt = f"preface {context.rendered_prompt}"
+
+    function = KernelFunctionFromPrompt(function_name="test", plugin_name="test", prompt="{{$history}}")
+    history = ChatHistory()
+    history.add_user_message("hello")
+    _rebuild_function_invocation_context()
+    context = FunctionInvocationContext(function=function, kernel=kernel, arguments=KernelArguments(history=history))
+    prompt_render_result = await function._render_prompt(context)
+
+    assert prompt_render_result.rendered_prompt == f"preface {history}"
+    assert prompt_render_result.chat_history is None
+
+
 @pytest.mark.parametrize(
     ("mode"),
     [
@@ -0,0 +1,113 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import numpy as np
+import pytest
+
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
+
+
+def create_record(id: str, embedding: list[float]) -> MemoryRecord:
+    return MemoryRecord.local_record(
+        id=id, text=f"text {id}", description=None, additional_metadata=None, embedding=np.array(embedding)
+    )
+
+
+@pytest.fixture
+async def store() -> VolatileMemoryStore:
+    store = VolatileMemoryStore()
+    await store.create_collection("test")
+    await store.upsert_batch(
+        "test",
+        [
+            create_record("x", [1.0, 0.0]),
+            create_record("y", [0.0, 2.0]),
+            create_record("xy", [1.0, 1.0]),
+            create_record("zero", [0.0, 0.0]),
+        ],
+    )
+    return store
+
+
+async def test_get_nearest_matches(store):
+    matches = await store.get_nearest_matches("test", np.array([2.0, 0.1]), limit=2)
+
+    assert [record._id for record, _ in matches] == ["x", "xy"]
+    assert matches[0][1] == pytest.approx(2.0 / np.linalg.norm([2.0, 0.1]))
+    assert matches[0][0]._embedding is None
+    assert (await store.get("test", "x", with_embedding=True))._embedding is not None
+
+
+async def test_get_nearest_matches_min_relevance_and_zero_vectors(store):
+    matches = await store.get_nearest_matches(
+        "test", np.array([[1.0, 0.0]]), limit=10, min_relevance_score=-1.0, with_embeddings=True
+    )
+
+    assert [record._id for record, _ in matches] == ["x", "xy", "y", "zero"]
+    assert [score for _, score in matches] == pytest.approx([1.0, np.sqrt(0.5), 0.0, -1.0])
+    assert matches[0][0]._embedding is not None
+
+    matches = await store.get_nearest_matches("test", np.array([1.0, 0.0]), limit=10, min_relevance_score=0.5)
+    assert [record._id for record, _ in matches] == ["x", "xy"]
+
+
+async def test_get_nearest_match(store):
+    record, score = await store.get_nearest_match("test", np.array([0.0, 1.0]))
+
+    assert record._id == "y"
+    assert score == pytest.approx(1.0)
+
+
+async def test_get_nearest_matches_batch(store):
+    results = await store.get_nearest_matches_batch("test", np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), limit=1)
+
+    assert [[record._id for record, _ in matches] for matches in results] == [["x"], ["y"], ["xy"]]
+
+
+async def test_matrix_is_updated_incrementally(store):
+    await store.remove_batch("test", ["x", "unknown"])
+    await store.upsert("test", create_record("y", [1.0, 0.0]))
+    await store.upsert("test", create_record("new", [-1.0, 0.0]))
+
+    results = await store.get_nearest_matches_batch("test", [np.array([1.0, 0.0]), np.array([-1.0, 0.0])], limit=1)
+    assert [[record._id for record, _ in matches] for matches in results] == [["y"], ["new"]]
+
+    await store.remove("test", "y")
+    matches = await store.get_nearest_matches("test", np.array([1.0, 0.0]), limit=10, min_relevance_score=-1.0)
+    assert [record._id for record, _ in matches] == ["xy", "zero", "new"]
+
+
+async def test_remove_batch(store):
+    await store.remove_batch("test", [])
+    await store.remove_batch("test", ["x", "y"])
+
+    matches = await store.get_nearest_matches("test", np.array([1.0, 0.0]), limit=10, min_relevance_score=-1.0)
+    assert [record._id for record, _ in matches] == ["xy", "zero"]
+
+
+async def test_upsert_batch_with_duplicate_keys(store):
+    await store.upsert_batch("test", [create_record("new", [1.0, 0.0]), create_record("new", [-1.0, 0.0])])
+    await store.upsert_batch("test", [create_record("x", [0.0, 1.0]), create_record("x", [0.0, -1.0])])
+
+    matches = await store.get_nearest_matches("test", np.array([-1.0, 0.0]), limit=1)
+    assert [record._id for record, _ in matches] == ["new"]
+    matches = await store.get_nearest_matches("test", np.array([0.0, -1.0]), limit=1)
+    assert [record._id for record, _ in matches] == ["x"]
+    assert len(store._matrices["test"]) == 5
+
+
+async def test_get_nearest_matches_unknown_or_empty_collection(store):
+    assert await store.get_nearest_matches("unknown", np.array([1.0, 0.0]), limit=1) == []
+
+    await store.create_collection("empty")
+    assert await store.get_nearest_matches_batch("empty", np.array([[1.0, 0.0]]), limit=1) == [[]]
+
+    await store.delete_collection("test")
+    assert await store.get_collections() == ["empty"]
+
+
+async def test_errors(store):
+    with pytest.raises(ValueError):
+        await store.get_nearest_matches("test", np.array([0.0, 0.0]), limit=1)
+    with pytest.raises(ValueError):
+        await store.upsert("test", create_record("wrong", [1.0, 0.0, 0.0]))
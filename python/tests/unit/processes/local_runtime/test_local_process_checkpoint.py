@@ -0,0 +1,151 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+from typing import ClassVar
+
+import pytest
+
+from semantic_kernel import Kernel
+from semantic_kernel.exceptions.process_exceptions import ProcessInvalidConfigurationException
+from semantic_kernel.functions import kernel_function
+from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.processes.kernel_process.kernel_process_step import KernelProcessStep
+from semantic_kernel.processes.kernel_process.kernel_process_step_context import KernelProcessStepContext
+from semantic_kernel.processes.kernel_process.kernel_process_step_state import KernelProcessStepState
+from semantic_kernel.processes.local_runtime.local_event import KernelProcessEvent
+from semantic_kernel.processes.local_runtime.local_kernel_process import start
+from semantic_kernel.processes.local_runtime.local_process import LocalProcess
+from semantic_kernel.processes.local_runtime.local_process_checkpoint import (
+    FileProcessCheckpointStore,
+    SqliteProcessCheckpointStore,
+)
+from semantic_kernel.processes.local_runtime.local_process_scheduling import (
+    LocalProcessSchedulingMode,
+    LocalProcessSchedulingOptions,
+)
+from semantic_kernel.processes.process_builder import ProcessBuilder
+
+
+class CounterState(KernelBaseModel):
+    count: int = 0
+
+
+class CounterStep(KernelProcessStep[CounterState]):
+    invocations: ClassVar[int] = 0
+    state: CounterState | None = None
+
+    async def activate(self, state: KernelProcessStepState[CounterState]):
+        self.state = state.state
+
+    @kernel_function
+    async def count(self, context: KernelProcessStepContext):
+        CounterStep.invocations += 1
+        self.state.count += 1
+        if self.state.count < 5:
+            await context.emit_event(process_event="next")
+
+
+class JoinStep(KernelProcessStep):
+    joined: ClassVar[list[str]] = []
+
+    @kernel_function
+    async def join(self, first: str, second: str):
+        JoinStep.joined.append(f"{first} {second}")
+
+
+@pytest.fixture(autouse=True)
+def reset_steps():
+    CounterStep.invocations = 0
+    JoinStep.joined = []
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileProcessCheckpointStore(directory=tmp_path / "checkpoints")
+    return SqliteProcessCheckpointStore(path=tmp_path / "checkpoints.db")
+
+
+def build_counter_process():
+    process = ProcessBuilder(name="counter")
+    counter_step = process.add_step(CounterStep, name="counter_step")
+    process.on_input_event(event_id="start").send_event_to(target=counter_step)
+    counter_step.on_event("next").send_event_to(target=counter_step)
+    return process.build()
+
+
+def build_join_process():
+    process = ProcessBuilder(name="join")
+    join_step = process.add_step(JoinStep, name="join_step")
+    process.on_input_event(event_id="first").send_event_to(target=join_step, parameter_name="first")
+    process.on_input_event(event_id="second").send_event_to(target=join_step, parameter_name="second")
+    return process.build()
+
+
+async def test_store_save_load_delete(store):
+    assert await store.load("process") is None
+
+    await store.save("process", {"a": "1", "b": "2"}, ["a", "b"])
+    assert await store.load("process") == {"a": "1", "b": "2"}
+
+    await store.save("process", {"a": "1", "b": "3"}, ["b"])
+    assert await store.load("process") == {"a": "1", "b": "3"}
+    assert await store.load("other") is None
+
+    await store.delete("process")
+    assert await store.load("process") is None
+
+
+async def test_sqlite_store_only_writes_changed_entries(tmp_path):
+    store = SqliteProcessCheckpointStore(path=tmp_path / "checkpoints.db")
+
+    await store.save("process", {"a": "1", "b": "2"}, ["a", "b"])
+    await store.save("process", {"a": "changed", "b": "3"}, ["b"])
+
+    assert await store.load("process") == {"a": "1", "b": "3"}
+
+
+async def test_resume_continues_from_checkpoint(store):
+    # The process runs out of supersteps after three counts, as if it was stopped
+    await start(build_counter_process(), Kernel(), initial_event="start", max_supersteps=3, checkpoint_store=store)
+    assert CounterStep.invocations == 3
+
+    # A new instance of the process continues with the state and the pending message of the checkpoint
+    context = await start(build_counter_process(), Kernel(), initial_event="start", checkpoint_store=store, resume=True)
+    assert CounterStep.invocations == 5
+    state = await context.get_state()
+    assert state.steps[0].state.state.count == 5
+
+    # A completed process has nothing left to do
+    await start(build_counter_process(), Kernel(), initial_event="start", checkpoint_store=store, resume=True)
+    assert CounterStep.invocations == 5
+
+
+async def test_resume_without_checkpoint_sends_the_initial_event(store):
+    await start(build_counter_process(), Kernel(), initial_event="start", checkpoint_store=store, resume=True)
+
+    assert CounterStep.invocations == 5
+    assert await store.load("counter") is not None
+
+
+async def test_resume_restores_step_inputs(store):
+    process = LocalProcess(process=build_join_process(), kernel=Kernel(), checkpoint_store=store, checkpoint_id="join")
+    await process.run_once(KernelProcessEvent(id="first", data="hello"))
+    assert JoinStep.joined == []
+
+    resumed = LocalProcess(process=build_join_process(), kernel=Kernel(), checkpoint_store=store, checkpoint_id="join")
+    assert await resumed.restore_checkpoint()
+    await resumed.run_once(KernelProcessEvent(id="second", data="world"))
+
+    assert JoinStep.joined == ["hello world"]
+
+
+async def test_checkpoints_require_superstep_mode(store):
+    process = LocalProcess(
+        process=build_counter_process(),
+        kernel=Kernel(),
+        checkpoint_store=store,
+        scheduling_options=LocalProcessSchedulingOptions(mode=LocalProcessSchedulingMode.Dataflow),
+    )
+
+    with pytest.raises(ProcessInvalidConfigurationException):
+        await process.run_once(KernelProcessEvent(id="start"))
@@ -0,0 +1,163 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+import threading
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+
+from semantic_kernel import Kernel
+from semantic_kernel.functions import kernel_function
+from semantic_kernel.processes.kernel_process.kernel_process_step import KernelProcessStep
+from semantic_kernel.processes.local_runtime.local_kernel_process import start
+from semantic_kernel.processes.local_runtime.local_message import LocalMessage
+from semantic_kernel.processes.local_runtime.local_process import LocalProcess
+from semantic_kernel.processes.local_runtime.local_process_scheduling import (
+    LocalProcessSchedulingMode,
+    LocalProcessSchedulingOptions,
+)
+from semantic_kernel.processes.process_builder import ProcessBuilder
+
+completed: list[str] = []
+
+
+class SlowStep(KernelProcessStep):
+    @kernel_function
+    async def run(self):
+        await asyncio.sleep(0.2)
+        completed.append("slow")
+
+
+class FastStep(KernelProcessStep):
+    @kernel_function
+    async def run(self):
+        completed.append("fast")
+
+
+class FinalStep(KernelProcessStep):
+    @kernel_function
+    async def run(self):
+        completed.append("final")
+
+
+class LoopStep(KernelProcessStep):
+    invocations: ClassVar[int] = 0
+
+    @kernel_function
+    async def run(self):
+        LoopStep.invocations += 1
+
+
+class ThreadStep(KernelProcessStep):
+    thread_ids: ClassVar[list[int]] = []
+
+    @kernel_function
+    def run(self):
+        ThreadStep.thread_ids.append(threading.get_ident())
+
+
+@pytest.fixture(autouse=True)
+def reset_steps():
+    completed.clear()
+    LoopStep.invocations = 0
+    ThreadStep.thread_ids = []
+
+
+def build_fan_out_process():
+    process = ProcessBuilder(name="fan_out")
+    slow_step = process.add_step(SlowStep)
+    fast_step = process.add_step(FastStep)
+    final_step = process.add_step(FinalStep)
+    process.on_input_event(event_id="start").send_event_to(target=slow_step)
+    process.on_input_event(event_id="start").send_event_to(target=fast_step)
+    fast_step.on_function_result(function_name="run").send_event_to(target=final_step)
+    return process.build()
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        (LocalProcessSchedulingMode.Superstep, ["fast", "slow", "final"]),
+        (LocalProcessSchedulingMode.Dataflow, ["fast", "final", "slow"]),
+    ],
+)
+async def test_scheduling_mode(mode, expected):
+    await start(
+        build_fan_out_process(),
+        Kernel(),
+        initial_event="start",
+        scheduling_options=LocalProcessSchedulingOptions(mode=mode),
+    )
+
+    assert completed == expected
+
+
+async def test_dataflow_stops_cycles_after_max_supersteps():
+    process = ProcessBuilder(name="loop")
+    loop_step = process.add_step(LoopStep)
+    process.on_input_event(event_id="start").send_event_to(target=loop_step)
+    loop_step.on_function_result(function_name="run").send_event_to(target=loop_step)
+
+    await start(
+        process.build(),
+        Kernel(),
+        initial_event="start",
+        max_supersteps=5,
+        scheduling_options=LocalProcessSchedulingOptions(mode=LocalProcessSchedulingMode.Dataflow),
+    )
+
+    assert LoopStep.invocations == 5
+
+
+async def test_thread_pool_steps():
+    process = ProcessBuilder(name="thread_pool")
+    thread_step = process.add_step(ThreadStep, name="cpu_bound")
+    process.on_input_event(event_id="start").send_event_to(target=thread_step)
+
+    await start(
+        process.build(),
+        Kernel(),
+        initial_event="start",
+        scheduling_options=LocalProcessSchedulingOptions(thread_pool_steps={"cpu_bound"}),
+    )
+
+    assert len(ThreadStep.thread_ids) == 1
+    assert ThreadStep.thread_ids[0] != threading.get_ident()
+
+
+async def test_max_concurrency_per_step():
+    process = LocalProcess(
+        process=build_fan_out_process(),
+        kernel=Kernel(),
+        scheduling_options=LocalProcessSchedulingOptions(max_concurrency_per_step={"limited": 2}),
+    )
+    running = 0
+    max_running = 0
+
+    async def handle_message(message):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    step = MagicMock()
+    step.handle_message = handle_message
+    message = MagicMock(spec=LocalMessage)
+
+    for name, expected in (("limited", 2), ("unlimited", 5)):
+        step.name = name
+        step.id = name
+        max_running = 0
+        await asyncio.gather(*[process._handle_step_message(step, message) for _ in range(5)])
+        assert max_running == expected
+
+
+def test_max_concurrency_per_step_validation():
+    assert LocalProcessSchedulingOptions(max_concurrency_per_step=3).get_max_concurrency("any") == 3
+    assert LocalProcessSchedulingOptions(max_concurrency_per_step={"a": 1}).get_max_concurrency("b") is None
+    with pytest.raises(ValueError):
+        LocalProcessSchedulingOptions(max_concurrency_per_step=0)
+    with pytest.raises(ValueError):
+        LocalProcessSchedulingOptions(max_concurrency_per_step={"a": 0})
@@ -1,7 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+
 import pytest
 
+from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.exceptions.template_engine_exceptions import TemplateRenderException
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 from semantic_kernel.functions.kernel_function import KernelFunction
@@ -137,3 +140,84 @@ async def test_it_renders_code_error(kernel: Kernel):
     target = create_kernel_prompt_template(template, allow_dangerously_set_content=True)
     with pytest.raises(TemplateRenderException):
         await target.render(kernel, arguments)
+
+
+def test_render_plan_joins_static_text():
+    target = create_kernel_prompt_template("a {{'b'}} c {{$x}} d {{p.f}}{{p.g $x}} e")
+
+    plan = target._render_plan
+    assert plan.segments[0] == "a b c "
+    assert isinstance(plan.segments[1], VarBlock)
+    assert plan.segments[2:] == (" d ", 0, 1, " e")
+    assert [block.content for block in plan.function_calls] == ["p.f", "p.g $x"]
+
+
+async def test_it_renders_function_calls_concurrently(kernel: Kernel):
+    first_started = asyncio.Event()
+
+    @kernel_function(name="first")
+    async def first() -> str:
+        first_started.set()
+        return "1"
+
+    @kernel_function(name="second")
+    async def second() -> str:
+        # Only completes when the first function runs at the same time
+        await asyncio.wait_for(first_started.wait(), timeout=1)
+        return "2"
+
+    kernel.add_function("test", KernelFunction.from_method(second, "test"))
+    kernel.add_function("test", KernelFunction.from_method(first, "test"))
+
+    target = create_kernel_prompt_template("{{$a}}-{{test.second}}-{{test.first}}-{{$a}}")
+    result = await target.render(kernel, KernelArguments(a="<a>"))
+
+    assert result == "&lt;a&gt;-2-1-&lt;a&gt;"
+
+
+async def test_it_reports_the_first_failing_function_call(kernel: Kernel):
+    @kernel_function(name="first")
+    async def first() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("first")
+
+    @kernel_function(name="second")
+    async def second() -> str:
+        raise ValueError("second")
+
+    kernel.add_function("test", KernelFunction.from_method(first, "test"))
+    kernel.add_function("test", KernelFunction.from_method(second, "test"))
+
+    target = create_kernel_prompt_template("{{test.first}} {{test.second}}")
+    with pytest.raises(TemplateRenderException, match="test.first"):
+        await target.render(kernel, KernelArguments())
+
+
+async def test_render_blocks_with_other_blocks(kernel: Kernel):
+    target = create_kernel_prompt_template("{{$a}}")
+    blocks = target.extract_blocks() + create_kernel_prompt_template(" and {{$b}}")._blocks
+
+    assert await target.render_blocks(blocks, kernel, KernelArguments(a=1, b="two")) == "1 and two"
+
+
+async def test_render_with_chat_history(kernel: Kernel):
+    history = ChatHistory()
+    history.add_user_message("<hello>")
+    history.add_assistant_message("hi")
+    target = create_kernel_prompt_template('{{$system}}{{$history}}<message role="user">{{$input}}</message>')
+    arguments = KernelArguments(system="be nice", history=history, input="<question>")
+
+    prompt, chat_history = await target.render_with_chat_history(kernel, arguments)
+
+    assert prompt == await target.render(kernel, arguments)
+    assert chat_history == ChatHistory.from_rendered_prompt(prompt)
+    assert [message.content for message in chat_history] == ["be nice", "<hello>", "hi", "<question>"]
+
+
+async def test_render_with_chat_history_without_history(kernel: Kernel):
+    target = create_kernel_prompt_template('<message role="user">{{$input}}</message>')
+
+    prompt, chat_history = await target.render_with_chat_history(kernel, KernelArguments(input="test"))
+
+    assert prompt == '<message role="user">test</message>'
+    assert chat_history is None
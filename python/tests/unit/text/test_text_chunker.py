@@ -2,11 +2,14 @@
 
 import os
 
+import pytest
+
 from semantic_kernel.text import (
     split_markdown_lines,
     split_markdown_paragraph,
     split_plaintext_lines,
     split_plaintext_paragraph,
+    split_text_stream,
 )
 
 NEWLINE = os.linesep
@@ -532,3 +535,66 @@ def test_split_md_on_newlines():
     max_token_per_line = 15
     split = split_markdown_paragraph(test, max_token_per_line)
     assert expected == split
+
+
+def test_split_text_stream():
+    """Test split_text_stream() combines lines from pieces into chunks"""
+    pieces = ["This is the first line.\nThis is the sec", "ond line.\r\nThis is the third line.\n", "Last."]
+
+    split = list(split_text_stream(pieces, max_tokens=12, token_counter=lambda text: len(text.split())))
+
+    assert split == [
+        "This is the first line.\nThis is the second line.",
+        "This is the third line.\nLast.",
+    ]
+
+
+def test_split_text_stream_with_overlap():
+    """Test split_text_stream() repeats whole lines for the overlap"""
+    pieces = [f"line {i}\n" for i in range(6)]
+
+    split = list(
+        split_text_stream(pieces, max_tokens=6, overlap_tokens=2, token_counter=lambda text: len(text.split()))
+    )
+
+    assert split == ["line 0\nline 1\nline 2", "line 2\nline 3\nline 4", "line 4\nline 5"]
+
+
+def test_split_text_stream_splits_long_lines():
+    """Test split_text_stream() splits lines that are longer than max_tokens"""
+    text = "This is a test of the emergency broadcast system. This is only a test."
+
+    split = list(split_text_stream([text], max_tokens=8, token_counter=lambda text: len(text.split())))
+
+    assert split == ["This is a test of the", "emergency broadcast system. This is only a test."]
+
+
+def test_split_text_stream_counts_lines_once():
+    """Test split_text_stream() counts the tokens of repeated lines once"""
+    counted = []
+
+    def token_counter(text: str) -> int:
+        counted.append(text)
+        return len(text.split())
+
+    split = list(split_text_stream(["header\n", "body\n"] * 3, max_tokens=100, token_counter=token_counter))
+
+    assert split == ["header\nbody\nheader\nbody\nheader\nbody"]
+    assert counted == ["header\n", "body\n"]
+
+
+def test_split_text_stream_without_line_endings(monkeypatch):
+    """Test split_text_stream() cuts text without line endings on separators"""
+    monkeypatch.setattr("semantic_kernel.text.text_chunker.STREAM_BUFFER_SIZE", 20)
+
+    split = list(split_text_stream(["One sentence. Two sentence. ", "Three."], max_tokens=2, token_counter=lambda t: 1))
+
+    assert split == ["One sentence. Two sentence.", "Three."]
+
+
+def test_split_text_stream_invalid_arguments():
+    """Test split_text_stream() validates max_tokens and overlap_tokens"""
+    with pytest.raises(ValueError):
+        list(split_text_stream(["text"], max_tokens=0))
+    with pytest.raises(ValueError):
+        list(split_text_stream(["text"], max_tokens=5, overlap_tokens=5))